@@ -4,8 +4,13 @@ import pandas as pd
 import json
 import os
 from dotenv import load_dotenv
-from src.models import SteeringMode, AllergyFilter, AllergyChecker
+from src.models import SteeringMode, AllergyFilter, ScoreCalculator
+from src.mode_kernel import best_per_mode
+from src.keyword_index import iter_bits
+from src.price_index import ConstraintIndex
+from src.lexicon import get_kernel, lexicons
 from src.executive_dashboard import ExecutiveDashboard
+from src.ui_components import UIComponents
 from src.decision_engine import DecisionIntelligenceEngine
 
 # Load environment variables
@@ -24,6 +29,9 @@ class FreeAIReferee:
     
     def __init__(self):
         self.use_mock = True  # Always use mock for free version
+        # ConstraintIndex of the last menu: filter and budget-slider changes re-filter it without rescanning
+        self._menu_items = None
+        self._constraints = None
     
     def make_decision(self, menu_text, steering_mode, budget_limit=None, allergy_filters=None):
         """Make referee decision with parallel universe analysis"""
@@ -47,9 +55,11 @@ class FreeAIReferee:
                 "vetoed_items": []
             }
         
-        # Apply allergy filters first (Hard Vetoes)
-        safe_items = AllergyChecker.get_safe_items(items, allergy_filters)
-        vetoed_items = [item for item in items if item not in safe_items]
+        # Apply allergy filters and the budget limit first (Hard Vetoes)
+        constraints = self._constraints_for(items)
+        vetoed = constraints.vetoed_bits(allergy_filters, budget_limit)
+        safe_items = [items[item_id] for item_id in iter_bits(constraints.all_bits & ~vetoed)]
+        vetoed_items = [items[item_id] for item_id in iter_bits(vetoed)]
         
         if not safe_items:
             return {
@@ -63,25 +73,15 @@ class FreeAIReferee:
                 "vetoed_items": [self._clean_item_name(item) for item in vetoed_items]
             }
         
-        # Analyze safe items for both modes
-        zen_choice, zen_scores = self._analyze_items(safe_items, SteeringMode.ZEN)
-        gremlin_choice, gremlin_scores = self._analyze_items(safe_items, SteeringMode.GREMLIN)
-        
-        # Current mode choice
-        if steering_mode == SteeringMode.ZEN:
-            winner = zen_choice
-            winner_scores = zen_scores
-            parallel_choice = gremlin_choice
-            parallel_mode = "Gremlin"
-        else:
-            winner = gremlin_choice
-            winner_scores = gremlin_scores
-            parallel_choice = zen_choice
-            parallel_mode = "Zen"
+        # Analyze safe items for both modes in a single scoring pass
+        best = self._analyze_items(safe_items, ScoreCalculator.MODE_WEIGHTS)
+        parallel_mode = SteeringMode.GREMLIN if steering_mode == SteeringMode.ZEN else SteeringMode.ZEN
+        winner, winner_scores = best[steering_mode]
+        parallel_choice, _ = best[parallel_mode]
         
         # Generate personality-appropriate responses
         verdict, modification, parallel_explanation = self._generate_responses(
-            winner, parallel_choice, steering_mode, allergy_filters, vetoed_items
+            winner, parallel_choice, steering_mode, allergy_filters, vetoed_items, budget_limit
         )
         
         return {
@@ -95,34 +95,22 @@ class FreeAIReferee:
             "vetoed_items": [self._clean_item_name(item) for item in vetoed_items]
         }
     
-    def _analyze_items(self, items, mode):
-        """Analyze items and return best choice for given mode"""
-        health_keywords = ['salad', 'grilled', 'steamed', 'quinoa', 'salmon', 'chicken breast', 'vegetables', 'fruit', 'lean']
-        taste_keywords = ['burger', 'pizza', 'chocolate', 'cheese', 'bacon', 'fried', 'cake', 'ice cream', 'sauce', 'crispy']
-        
-        best_item = items[0]
-        best_score = 0
-        best_scores = {'health': 5, 'taste': 5}
-        
-        for item in items:
-            item_lower = item.lower()
-            health_score = min(10, max(1, sum(2 for keyword in health_keywords if keyword in item_lower) + 3))
-            taste_score = min(10, max(1, sum(2 for keyword in taste_keywords if keyword in item_lower) + 3))
-            
-            # Apply mode weights
-            if mode == SteeringMode.ZEN:
-                final_score = (health_score * 0.8) + (taste_score * 0.2)
-            else:
-                final_score = (health_score * 0.1) + (taste_score * 0.9)
-            
-            if final_score > best_score:
-                best_score = final_score
-                best_item = item
-                best_scores = {'health': health_score, 'taste': taste_score}
-        
-        return best_item, best_scores
+    def _constraints_for(self, items):
+        """ConstraintIndex for a menu, reused while the same menu is re-refereed"""
+        if items != self._menu_items:
+            self._constraints = ConstraintIndex.from_items(items)
+            self._menu_items = items
+        return self._constraints
+    
+    def _analyze_items(self, items, mode_weights):
+        """Best choice and its scores for every mode (or persona weight vector), scoring each item once"""
+        choices = {}
+        for mode, (index, scores) in best_per_mode(items, get_kernel('referee').score_item, mode_weights).items():
+            health_score, taste_score = scores or (5, 5)
+            choices[mode] = (items[index], {'health': health_score, 'taste': taste_score})
+        return choices
     
-    def _generate_responses(self, winner, parallel_choice, mode, allergy_filters, vetoed_items):
+    def _generate_responses(self, winner, parallel_choice, mode, allergy_filters, vetoed_items, budget_limit=None):
         """Generate personality-appropriate responses"""
         winner_clean = self._clean_item_name(winner)
         parallel_clean = self._clean_item_name(parallel_choice)
@@ -131,6 +119,8 @@ class FreeAIReferee:
         veto_text = ""
         if vetoed_items:
             filter_names = [f.value.split()[1] for f in allergy_filters]  # Extract just the constraint name
+            if budget_limit:
+                filter_names.append("budget")
             veto_text = f" I had to veto {len(vetoed_items)} items due to your {', '.join(filter_names)} constraints."
         
         if mode == SteeringMode.ZEN:
@@ -181,11 +171,16 @@ def get_decision_quality(decision):
 
 # Main App
 def main():
+    # Pick up keyword-file edits without a restart; one stat() per rerun
+    lexicons.reload_if_changed()
+    
     # Apply custom CSS
     UIComponents.render_custom_css()
     
-    # Initialize Free AI Referee (no API key needed!)
-    referee = FreeAIReferee()
+    # Initialize Free AI Referee (no API key needed!); one per session keeps its ConstraintIndex
+    if 'referee' not in st.session_state:
+        st.session_state.referee = FreeAIReferee()
+    referee = st.session_state.referee
     
     # Header
     UIComponents.render_header()
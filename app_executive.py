@@ -3,6 +3,8 @@ import os
 from dotenv import load_dotenv
 from src.executive_dashboard import ExecutiveDashboard
 from src.decision_engine import DecisionIntelligenceEngine
+from src.incremental import IncrementalAnalyzer
+from src.lexicon import lexicons
 from src.models import AllergyFilter
 
 # Load environment variables
@@ -19,11 +21,17 @@ st.set_page_config(
 def main():
     """Main executive dashboard application"""
     
+    # Pick up keyword-file edits without a restart; one stat() per rerun
+    lexicons.reload_if_changed()
+    
     # Apply professional styling
     ExecutiveDashboard.render_professional_css()
     
-    # Initialize decision engine
-    decision_engine = DecisionIntelligenceEngine()
+    # One analyzer per session: re-running the same menu with other sliders or
+    # filters reuses its parsed lines and answers constraints from a ConstraintIndex
+    if 'analyzer' not in st.session_state:
+        st.session_state.analyzer = IncrementalAnalyzer(DecisionIntelligenceEngine())
+    analyzer = st.session_state.analyzer
     
     # Executive Header
     ExecutiveDashboard.render_professional_header()
@@ -34,7 +42,7 @@ def main():
     st.markdown("---")
     
     # Hard Constraints
-    allergy_filters, time_constraint = ExecutiveDashboard.render_hard_constraints()
+    allergy_filters = ExecutiveDashboard.render_hard_constraints()
     
     st.markdown("---")
     
@@ -69,14 +77,14 @@ def main():
     if analyze_button and menu_text.strip():
         with st.spinner("🧠 Executing multi-dimensional decision intelligence analysis..."):
             
-            # Perform comprehensive analysis
-            analysis = decision_engine.analyze_menu(
+            # Perform comprehensive analysis; the slider's low end is Health Focus,
+            # the engine's nutrition_focus weights health
+            analysis = ExecutiveDashboard.build_decisions(analyzer.analyze(
                 menu_text=menu_text,
-                nutrition_axis=nutrition_axis,
-                budget_axis=budget_axis,
-                constraints=allergy_filters,
-                time_constraint=time_constraint
-            )
+                nutrition_focus=100 - nutrition_axis,
+                budget_focus=budget_axis,
+                allergy_filters=allergy_filters
+            ), allergy_filters)
         
         st.markdown("---")
         
@@ -1,6 +1,10 @@
 import streamlit as st
 import plotly.graph_objects as go
 from enum import Enum
+from src.decision_engine import DecisionIntelligenceEngine
+from src.executive_dashboard import ExecutiveDashboard
+from src.lexicon import get_kernel, lexicons
+from src.models import MenuParser
 
 # Simple enums
 class AllergyFilter(Enum):
@@ -100,6 +104,7 @@ def analyze_executive_menu(menu_text, nutrition_axis, budget_axis, constraints):
             'winner': {'name': 'No items found', 'health_score': 0, 'taste_score': 0, 'confidence': 0, 'description': 'Please provide menu items'},
             'alternative': {'name': 'No alternatives', 'health_score': 0, 'taste_score': 0, 'confidence': 0, 'description': 'No menu provided'},
             'compromise': {'name': 'No options', 'health_score': 0, 'taste_score': 0, 'confidence': 0, 'description': 'No items to analyze'},
+            'pareto_front': [],
             'vetoed_items': [],
             'veto_reasons': [],
             'reasoning': 'No menu items provided for analysis.',
@@ -140,6 +145,7 @@ def analyze_executive_menu(menu_text, nutrition_axis, budget_axis, constraints):
             'winner': {'name': 'No safe options', 'health_score': 0, 'taste_score': 0, 'confidence': 0, 'description': 'All items vetoed'},
             'alternative': {'name': 'All vetoed', 'health_score': 0, 'taste_score': 0, 'confidence': 0, 'description': 'Constraints too restrictive'},
             'compromise': {'name': 'No viable options', 'health_score': 0, 'taste_score': 0, 'confidence': 0, 'description': 'Adjust constraints'},
+            'pareto_front': [],
             'vetoed_items': vetoed_items,
             'veto_reasons': veto_reasons,
             'reasoning': 'All items excluded due to hard constraints.',
@@ -148,16 +154,10 @@ def analyze_executive_menu(menu_text, nutrition_axis, budget_axis, constraints):
     
     # Score items
     scored_items = []
-    health_keywords = ['salad', 'grilled', 'steamed', 'quinoa', 'salmon', 'vegetables', 'lean']
-    taste_keywords = ['burger', 'pizza', 'chocolate', 'cheese', 'bacon', 'fried', 'sauce']
-    premium_keywords = ['truffle', 'wagyu', 'artisan', 'premium', 'organic']
+    kernel = get_kernel('executive_simple')
     
     for item in safe_items:
-        item_lower = item.lower()
-        
-        health_score = min(10, max(1, sum(2 for kw in health_keywords if kw in item_lower) + 3))
-        taste_score = min(10, max(1, sum(2 for kw in taste_keywords if kw in item_lower) + 3))
-        premium_score = min(10, max(1, sum(2 for kw in premium_keywords if kw in item_lower) + 3))
+        health_score, taste_score, premium_score = kernel.score_item(item)
         
         scored_items.append({
             'name': clean_name(item),
@@ -165,20 +165,24 @@ def analyze_executive_menu(menu_text, nutrition_axis, budget_axis, constraints):
             'health_score': health_score,
             'taste_score': taste_score,
             'premium_score': premium_score,
+            'price': MenuParser.extract_price(item),
             'description': extract_description(item)
         })
     
     # Select winner based on dual-axis preferences
     winner = select_best_item(scored_items, nutrition_axis, budget_axis, 'optimal')
     alternative = select_best_item(scored_items, 100 - nutrition_axis, budget_axis, 'alternative')
-    compromise = select_best_item(scored_items, 50, 50, 'compromise')
+    
+    # The engine's trade-off analysis of the safe items supplies the compromise and the Pareto front
+    trade_offs = DecisionIntelligenceEngine().analyze_menu('\n'.join(safe_items), 100 - nutrition_axis, budget_axis, [])
     
     reasoning = f"Selected {winner['name']} based on {get_focus_description(nutrition_axis, budget_axis)}. This decision optimizes for your dual-axis preferences while respecting all safety constraints."
     
     return {
         'winner': winner,
         'alternative': alternative,
-        'compromise': compromise,
+        'compromise': ExecutiveDashboard.choice_card(trade_offs['compromise']),
+        'pareto_front': trade_offs['pareto_front'],
         'vetoed_items': vetoed_items,
         'veto_reasons': veto_reasons,
         'reasoning': reasoning,
@@ -194,19 +198,9 @@ def select_best_item(scored_items, nutrition_axis, budget_axis, category):
     best_score = -1
     
     for item in scored_items:
-        # Calculate weighted score
-        health_weight = (100 - nutrition_axis) / 100
-        taste_weight = nutrition_axis / 100
-        premium_weight = budget_axis / 100
-        
-        weighted_score = (
-            item['health_score'] * health_weight * 0.4 +
-            item['taste_score'] * taste_weight * 0.4 +
-            item['premium_score'] * premium_weight * 0.2
-        )
-        
-        if weighted_score > best_score:
-            best_score = weighted_score
+        score = weighted_score(item, nutrition_axis, budget_axis)
+        if score > best_score:
+            best_score = score
             best_item = item
     
     if best_item:
@@ -214,6 +208,18 @@ def select_best_item(scored_items, nutrition_axis, budget_axis, category):
     
     return best_item or scored_items[0]
 
+def weighted_score(item, nutrition_axis, budget_axis):
+    """Dual-axis weighted score of a scored item"""
+    health_weight = (100 - nutrition_axis) / 100
+    taste_weight = nutrition_axis / 100
+    premium_weight = budget_axis / 100
+    
+    return (
+        item['health_score'] * health_weight * 0.4 +
+        item['taste_score'] * taste_weight * 0.4 +
+        item['premium_score'] * premium_weight * 0.2
+    )
+
 def clean_name(item):
     """Clean item name"""
     clean = item.split('-')[0].strip()
@@ -352,6 +358,9 @@ def render_radar_chart(item_data):
 def main():
     """Main executive dashboard"""
     
+    # Pick up keyword-file edits without a restart; one stat() per rerun
+    lexicons.reload_if_changed()
+    
     # Executive Header
     st.markdown("""
     <div class="executive-header">
@@ -468,6 +477,15 @@ def main():
         
         st.markdown("---")
         
+        # Trade-off Frontier
+        if analysis['pareto_front']:
+            st.markdown("### 🧭 Trade-off Frontier")
+            st.caption("No other option beats these on health, taste and price at once; the compromise is the most balanced of them.")
+            for item in analysis['pareto_front']:
+                price = f"${item['price']:.2f}" if item['price'] is not None else "No price"
+                st.markdown(f"**{item['name']}** · Health {item['health']}/10 · Taste {item['taste']}/10 · {price}")
+            st.markdown("---")
+        
         # Trade-off Radar
         if analysis['winner']['health_score'] > 0:
             st.markdown("### 📊 Multi-Dimensional Trade-off Analysis")
@@ -1,6 +1,8 @@
 import streamlit as st
 import re
 from enum import Enum
+from src.mode_kernel import best_per_mode
+from src.lexicon import get_kernel, lexicons
 
 # Simple enums for the app
 class SteeringMode(Enum):
@@ -13,6 +15,12 @@ class AllergyFilter(Enum):
     DAIRY = "🥛 Dairy-Free"
     VEGAN = "🌱 Vegan"
 
+# (health weight, taste weight) per mode
+MODE_WEIGHTS = {
+    SteeringMode.ZEN: (0.8, 0.2),
+    SteeringMode.GREMLIN: (0.1, 0.9)
+}
+
 # Page config
 st.set_page_config(
     page_title="🥗 BiteBalance - The AI Menu Referee",
@@ -138,54 +146,17 @@ def analyze_menu_simple(menu_text, steering_mode, allergy_filters):
             "vetoed_items": vetoed_items
         }
     
-    # Simple scoring
-    health_keywords = ['salad', 'grilled', 'steamed', 'quinoa', 'salmon', 'vegetables', 'fruit', 'lean']
-    taste_keywords = ['burger', 'pizza', 'chocolate', 'cheese', 'bacon', 'fried', 'cake', 'sauce', 'crispy']
-    
-    best_item = safe_items[0]
-    best_score = 0
-    
-    for item in safe_items:
-        item_lower = item.lower()
-        health_score = min(10, max(1, sum(2 for kw in health_keywords if kw in item_lower) + 3))
-        taste_score = min(10, max(1, sum(2 for kw in taste_keywords if kw in item_lower) + 3))
-        
-        # Apply steering mode weights
-        if steering_mode == SteeringMode.ZEN:
-            final_score = (health_score * 0.8) + (taste_score * 0.2)
-        else:
-            final_score = (health_score * 0.1) + (taste_score * 0.9)
-        
-        if final_score > best_score:
-            best_score = final_score
-            best_item = item
-    
-    # Find parallel choice (opposite mode)
-    parallel_item = safe_items[0]
-    parallel_score = 0
-    
-    for item in safe_items:
-        item_lower = item.lower()
-        health_score = min(10, max(1, sum(2 for kw in health_keywords if kw in item_lower) + 3))
-        taste_score = min(10, max(1, sum(2 for kw in taste_keywords if kw in item_lower) + 3))
-        
-        # Opposite mode weights
-        if steering_mode == SteeringMode.ZEN:
-            final_score = (health_score * 0.1) + (taste_score * 0.9)  # Gremlin weights
-        else:
-            final_score = (health_score * 0.8) + (taste_score * 0.2)  # Zen weights
-        
-        if final_score > parallel_score:
-            parallel_score = final_score
-            parallel_item = item
+    # Score each safe item once and pick the best for both modes in the same pass
+    parallel_mode = SteeringMode.GREMLIN if steering_mode == SteeringMode.ZEN else SteeringMode.ZEN
+    best = best_per_mode(safe_items, get_kernel('simple').score_item, MODE_WEIGHTS)
+    best_index, best_scores = best[steering_mode]
+    parallel_index, _ = best[parallel_mode]
     
-    winner_name = clean_item_name(best_item)
-    parallel_name = clean_item_name(parallel_item)
+    winner_name = clean_item_name(safe_items[best_index])
+    parallel_name = clean_item_name(safe_items[parallel_index])
     
-    # Calculate final scores for display
-    winner_lower = best_item.lower()
-    final_health = min(10, max(1, sum(2 for kw in health_keywords if kw in winner_lower) + 3))
-    final_taste = min(10, max(1, sum(2 for kw in taste_keywords if kw in winner_lower) + 3))
+    # Scores for display come from the same pass
+    final_health, final_taste = best_scores
     
     # Generate responses based on mode
     if steering_mode == SteeringMode.ZEN:
@@ -219,6 +190,9 @@ def clean_item_name(item):
     return clean or item
 
 def main():
+    # Pick up keyword-file edits without a restart; one stat() per rerun
+    lexicons.reload_if_changed()
+    
     # Header
     st.markdown("""
     <div class="main-header">
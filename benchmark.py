@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the BiteBalance decision intelligence engine
+
+Times each pipeline stage (parse, constraint filtering, scoring, recommendation)
+on seeded synthetic menus using the engine's own stage timings and emits
+machine-readable JSON.
+
+Usage:
+    python benchmark.py
+    python benchmark.py --sizes 10,1000,100000 --repeats 5 --output bench.json
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+from datetime import datetime
+
+from src.decision_engine import DecisionIntelligenceEngine
+from src.menu_generator import SyntheticMenuGenerator
+from src.models import AllergyFilter
+
+DEFAULT_SIZES = [10, 100, 1_000, 10_000, 100_000, 1_000_000]
+DEFAULT_FILTERS = [AllergyFilter.NUTS, AllergyFilter.DAIRY]
+
+STAGES = ['parse', 'constraints', 'scoring', 'recommendations', 'total']
+
+def summarize(runs, stage):
+    """Summarize the timings collected for one stage across repeated runs"""
+    timings = [run[stage]['seconds'] for run in runs]
+    items = runs[-1][stage].get('items_in', runs[-1]['parse']['items_out'])
+    best = min(timings)
+    return {
+        'items': items,
+        'repeats': len(timings),
+        'min_seconds': best,
+        'median_seconds': statistics.median(timings),
+        'max_seconds': max(timings),
+        'us_per_item': (best / items * 1e6) if items else 0.0
+    }
+
+def benchmark_size(engine, generator, size, repeats, allergy_filters, budget_limit,
+                   nutrition_focus, budget_focus):
+    """Benchmark every pipeline stage on a menu of `size` items"""
+    menu_text = generator.generate(size)
+
+    runs = []
+    for _ in range(repeats):
+        analysis = engine.analyze_menu(menu_text, nutrition_focus, budget_focus, allergy_filters,
+                                       budget_limit, collect_timings=True)
+        runs.append(analysis['timings'])
+
+    return {
+        'size': size,
+        'menu_bytes': len(menu_text.encode('utf-8')),
+        'safe_items': size - len(analysis['vetoed_items']),
+        'vetoed_items': len(analysis['vetoed_items']),
+        'stages': {stage: summarize(runs, stage) for stage in STAGES if stage in runs[-1]}
+    }
+
+def repeats_for(size, requested):
+    """Keep the largest sizes to a single run so the suite stays tractable"""
+    if size >= 100_000:
+        return 1
+    return requested
+
+def run_benchmarks(sizes, seed=42, repeats=3, allergy_filters=None, budget_limit=25.0,
+                   nutrition_focus=60, budget_focus=40):
+    """Run the full suite and return the JSON-serializable report"""
+    allergy_filters = DEFAULT_FILTERS if allergy_filters is None else allergy_filters
+    engine = DecisionIntelligenceEngine()
+    generator = SyntheticMenuGenerator(seed=seed)
+
+    results = []
+    for size in sizes:
+        print(f"⏱️  Benchmarking {size:,} items...", file=sys.stderr)
+        results.append(benchmark_size(engine, generator, size, repeats_for(size, repeats),
+                                      allergy_filters, budget_limit, nutrition_focus, budget_focus))
+
+    return {
+        'benchmark': 'decision_engine',
+        'timestamp': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'config': {
+            'seed': seed,
+            'repeats': repeats,
+            'allergy_filters': [f.name for f in allergy_filters],
+            'budget_limit': budget_limit,
+            'nutrition_focus': nutrition_focus,
+            'budget_focus': budget_focus
+        },
+        'results': results
+    }
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the BiteBalance decision engine")
+    parser.add_argument('--sizes', default=','.join(str(s) for s in DEFAULT_SIZES),
+                        help="Comma-separated menu sizes (default: 10 to 1,000,000)")
+    parser.add_argument('--seed', type=int, default=42, help="Synthetic menu seed")
+    parser.add_argument('--repeats', type=int, default=3, help="Runs per stage (largest sizes run once)")
+    parser.add_argument('--budget-limit', type=float, default=25.0, help="Budget constraint in dollars")
+    parser.add_argument('--output', help="Write JSON here instead of stdout")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    sizes = [int(size.replace('_', '')) for size in args.sizes.split(',') if size.strip()]
+
+    report = run_benchmarks(sizes, seed=args.seed, repeats=args.repeats, budget_limit=args.budget_limit)
+    output = json.dumps(report, indent=2)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output)
+        print(f"✅ Results written to {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+if __name__ == "__main__":
+    main()
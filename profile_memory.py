@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Memory profiling harness for BiteBalance
+
+Uses tracemalloc to report peak and retained memory per item for
+DecisionIntelligenceEngine.analyze_menu (and each pipeline stage) on large
+synthetic menus, and tracks growth of the Streamlit session state
+(meal_history, health_profile) across simulated reruns.
+
+Usage:
+    python profile_memory.py
+    python profile_memory.py --sizes 1000,100000 --reruns 5000 --output memory.json
+"""
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import tracemalloc
+from datetime import datetime
+
+from src.decision_engine import DecisionIntelligenceEngine
+from src.menu_generator import SyntheticMenuGenerator
+from src.models import AllergyFilter
+from src.session import init_session_state, record_meal
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+DEFAULT_FILTERS = [AllergyFilter.NUTS, AllergyFilter.DAIRY]
+
+def measure(func):
+    """Run func under tracemalloc and return (result, peak bytes, retained bytes)
+
+    Retained bytes are what is still allocated while the result is alive.
+    """
+    gc.collect()
+    tracemalloc.reset_peak()
+    before, _ = tracemalloc.get_traced_memory()
+    result = func()
+    after, peak = tracemalloc.get_traced_memory()
+    return result, peak - before, after - before
+
+def per_item(peak, retained, items):
+    return {
+        'items': items,
+        'peak_bytes': peak,
+        'retained_bytes': retained,
+        'peak_bytes_per_item': round(peak / items, 1) if items else 0.0,
+        'retained_bytes_per_item': round(retained / items, 1) if items else 0.0
+    }
+
+def profile_engine_size(engine, generator, size, allergy_filters, budget_limit):
+    """Profile analyze_menu and each stage on a menu of `size` items"""
+    menu_text = generator.generate(size)
+
+    raw_items, peak, retained = measure(lambda: engine._parse_menu(menu_text))
+    stages = {'parse': per_item(peak, retained, len(raw_items))}
+
+    (safe_items, vetoed_items), peak, retained = measure(
+        lambda: engine._apply_constraints(raw_items, allergy_filters, budget_limit))
+    stages['constraints'] = per_item(peak, retained, len(raw_items))
+
+    scored_items, peak, retained = measure(lambda: engine._score_items(safe_items))
+    stages['scoring'] = per_item(peak, retained, len(safe_items))
+
+    _, peak, retained = measure(lambda: engine._generate_recommendations(scored_items, 50, 50))
+    stages['recommendations'] = per_item(peak, retained, len(scored_items))
+
+    del raw_items, safe_items, vetoed_items, scored_items
+
+    analysis, peak, retained = measure(
+        lambda: engine.analyze_menu(menu_text, 50, 50, allergy_filters, budget_limit))
+    del analysis
+
+    return {
+        'size': size,
+        'menu_bytes': len(menu_text.encode('utf-8')),
+        'analyze_menu': per_item(peak, retained, size),
+        'stages': stages
+    }
+
+def deep_sizeof(obj, seen=None):
+    """Approximate total size of an object graph of dicts, lists and scalars"""
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    return size
+
+def profile_session(reruns, checkpoint_every):
+    """Simulate Streamlit reruns against a plain dict standing in for st.session_state"""
+    session_state = {}
+    init_session_state(session_state)
+
+    gc.collect()
+    baseline, _ = tracemalloc.get_traced_memory()
+    checkpoints = []
+
+    for rerun in range(1, reruns + 1):
+        # The sidebar rebuilds the health profile on every rerun
+        session_state['health_profile'] = {
+            'allergies': ['Nuts'] if rerun % 2 else [],
+            'daily_calorie_limit': 2000,
+            'dietary_preference': 'None'
+        }
+
+        # Every rerun that analyzes a food records a meal
+        record_meal(session_state, {
+            'food': f"burger {rerun}",
+            'winner': 'Turkey Burger with Light Cheese',
+            'persona': '⚖️ The Balanced Coach',
+            'confidence': 85,
+            'timestamp': datetime.now().isoformat()
+        })
+
+        if rerun % checkpoint_every == 0 or rerun == reruns:
+            gc.collect()
+            current, _ = tracemalloc.get_traced_memory()
+            checkpoints.append({
+                'rerun': rerun,
+                'meal_history_len': len(session_state['meal_history']),
+                'session_state_bytes': deep_sizeof(session_state),
+                'traced_growth_bytes': current - baseline
+            })
+
+    return {'reruns': reruns, 'checkpoints': checkpoints}
+
+def run_profile(sizes, seed=42, reruns=1000, allergy_filters=None, budget_limit=25.0):
+    """Run the harness and return the JSON-serializable report"""
+    allergy_filters = DEFAULT_FILTERS if allergy_filters is None else allergy_filters
+    engine = DecisionIntelligenceEngine()
+    generator = SyntheticMenuGenerator(seed=seed)
+
+    tracemalloc.start()
+    try:
+        engine_results = []
+        for size in sizes:
+            print(f"🧠 Profiling {size:,} items...", file=sys.stderr)
+            engine_results.append(profile_engine_size(engine, generator, size, allergy_filters, budget_limit))
+
+        print(f"🔁 Simulating {reruns:,} reruns...", file=sys.stderr)
+        session = profile_session(reruns, checkpoint_every=max(1, reruns // 10))
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'profile': 'memory',
+        'timestamp': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'config': {
+            'seed': seed,
+            'allergy_filters': [f.name for f in allergy_filters],
+            'budget_limit': budget_limit
+        },
+        'engine': engine_results,
+        'session': session
+    }
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Profile BiteBalance memory usage")
+    parser.add_argument('--sizes', default=','.join(str(s) for s in DEFAULT_SIZES),
+                        help="Comma-separated menu sizes")
+    parser.add_argument('--seed', type=int, default=42, help="Synthetic menu seed")
+    parser.add_argument('--reruns', type=int, default=1000, help="Simulated Streamlit reruns")
+    parser.add_argument('--output', help="Write JSON here instead of stdout")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    sizes = [int(size.replace('_', '')) for size in args.sizes.split(',') if size.strip()]
+
+    report = run_profile(sizes, seed=args.seed, reruns=args.reruns)
+    output = json.dumps(report, indent=2)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output)
+        print(f"✅ Results written to {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+if __name__ == "__main__":
+    main()
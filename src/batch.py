@@ -0,0 +1,99 @@
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .models import AllergyFilter, AllergyChecker, PrepTimeEstimator
+
+# Per-worker engine, built once by the pool initializer
+_worker_engine = None
+
+def _init_worker(engine_class, locale: str, lexicon) -> None:
+    """Build the worker's engine on the parent's lexicon snapshot
+
+    The snapshot holds the engine keyword lists, allergy keywords and
+    prep-time tables; installing it on the engine, AllergyChecker and
+    PrepTimeEstimator leaves no table on the worker's own lexicon.
+    """
+    global _worker_engine
+    engine = engine_class(locale=locale)
+    engine.use_lexicon(lexicon)
+    AllergyChecker.use_lexicon(lexicon)
+    PrepTimeEstimator.use_lexicon(lexicon)
+    _worker_engine = engine
+
+def _analyze_chunk(method: str, chunk: List[Tuple[int, str]], args: Tuple) -> List[Tuple[int, Dict[str, Any]]]:
+    analyze = getattr(_worker_engine, method)
+    return [(index, analyze(source, *args)) for index, source in chunk]
+
+def _chunks(sources: Iterable[Any], chunksize: int) -> Iterator[List[Tuple[int, Any]]]:
+    indexed = enumerate(sources)
+    while True:
+        chunk = list(islice(indexed, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+def analyze_many(engine, menus: Iterable[str], nutrition_focus: float, budget_focus: float,
+                 allergy_filters: List[AllergyFilter], budget_limit: Optional[float] = None,
+                 workers: Optional[int] = None, chunksize: int = 64,
+                 ordered: bool = True) -> Iterator[Any]:
+    """Analyze many menus across a process pool
+
+    Menus are sent to workers in chunks of `chunksize` and at most a few
+    chunks per worker are in flight, so `menus` can be a lazy iterable of any
+    length. With `ordered=True` analyses are yielded in input order; otherwise
+    (index, analysis) pairs are yielded as chunks complete.
+    """
+    return run_pool(engine, 'analyze_menu', menus,
+                    (nutrition_focus, budget_focus, allergy_filters, budget_limit),
+                    workers=workers, chunksize=chunksize, ordered=ordered)
+
+def run_pool(engine, method: str, sources: Iterable[Any], args: Tuple,
+             workers: Optional[int] = None, chunksize: int = 64,
+             ordered: bool = True) -> Iterator[Any]:
+    """Call engine.<method>(source, *args) for every source across a process pool"""
+    workers = workers or os.cpu_count() or 1
+    if workers == 1:
+        # Nothing to fan out to; skip the pool and its pickling overhead
+        analyze = getattr(engine, method)
+        for index, source in enumerate(sources):
+            analysis = analyze(source, *args)
+            yield analysis if ordered else (index, analysis)
+        return
+
+    max_in_flight = workers * 2
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(type(engine), engine.locale, engine.snapshot())) as pool:
+        chunks = _chunks(sources, chunksize)
+        pending = deque()
+
+        def submit_next() -> bool:
+            chunk = next(chunks, None)
+            if chunk is None:
+                return False
+            pending.append(pool.submit(_analyze_chunk, method, chunk, args))
+            return True
+
+        while len(pending) < max_in_flight and submit_next():
+            pass
+
+        try:
+            if ordered:
+                while pending:
+                    for _, analysis in pending.popleft().result():
+                        yield analysis
+                    submit_next()
+            else:
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        pending.remove(future)
+                        yield from future.result()
+                        submit_next()
+        finally:
+            # A consumer that stops early should not wait on queued chunks
+            for future in pending:
+                future.cancel()
@@ -0,0 +1,181 @@
+import re
+import sqlite3
+from array import array
+from typing import Any, Dict, List, Optional
+
+from .lexicon import head_lines
+from .models import AllergyFilter, AllergyChecker, PrepTimeEstimator
+from .scored_menu import SCORE_FIELDS
+
+class DishCatalog:
+    """SQLite FTS5 index of dishes across many menus
+
+    Every dish is stored with its price, precomputed scores, allergen
+    bitmask (AllergyChecker.allergen_mask) and estimated prep time
+    (PrepTimeEstimator), and its text is indexed with
+    FTS5. search() combines a full-text query, price ceiling and allergy
+    filters in one SQL statement and ranks with an index-backed ORDER BY, so
+    nothing is scanned in Python.
+    """
+
+    def __init__(self, path: str = ':memory:'):
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.executescript(f"""
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE IF NOT EXISTS dishes (
+                id INTEGER PRIMARY KEY,
+                menu TEXT NOT NULL,
+                name TEXT NOT NULL,
+                item TEXT NOT NULL,
+                price REAL,
+                {', '.join(f'{field} INTEGER NOT NULL' for field in SCORE_FIELDS)},
+                allergens INTEGER NOT NULL,
+                prep_minutes INTEGER NOT NULL
+            );
+            CREATE VIRTUAL TABLE IF NOT EXISTS dishes_fts USING fts5(item, content='dishes', content_rowid='id');
+            CREATE INDEX IF NOT EXISTS dishes_menu ON dishes (menu);
+            CREATE INDEX IF NOT EXISTS dishes_price ON dishes (price);
+            CREATE INDEX IF NOT EXISTS dishes_prep ON dishes (prep_minutes);
+            {' '.join(f'CREATE INDEX IF NOT EXISTS dishes_{field} ON dishes ({field} DESC, price);'
+                      for field in SCORE_FIELDS)}
+        """)
+
+    @property
+    def lexicon_version(self) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = 'lexicon_version'").fetchone()
+        return row[0] if row else None
+
+    def add_menu(self, menu_id: str, menu_text: str, engine) -> int:
+        """Parse, score and index one menu, replacing any previous version; returns the dish count
+        
+        Scores, allergens and prep times use the lexicon the engine picks for
+        the menu's locale, as analyze_menu would.
+        """
+        lexicon_version = engine.lexicon_version
+        if self.lexicon_version not in (None, lexicon_version):
+            raise ValueError("Catalog was built with a different lexicon; rebuild it with clear()")
+
+        lexicon = engine.menu_lexicon(head_lines(menu_text))
+        items = engine._parse_menu(menu_text)
+        scored = engine._score_items(items, lexicon)
+        allergens = array('I', (AllergyChecker.allergen_mask(item, lexicon) for item in items))
+
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('lexicon_version', ?)", (lexicon_version,))
+            self._delete_menu(menu_id)
+            self.conn.executemany(
+                f"INSERT INTO dishes (menu, name, item, price, {', '.join(SCORE_FIELDS)}, allergens, prep_minutes) "
+                f"VALUES (?, ?, ?, ?, {', '.join('?' * len(SCORE_FIELDS))}, ?, ?)",
+                (
+                    (menu_id, scored.clean_name(index), scored.item_text(index), scored.price(index),
+                     *(column[index] for column in scored.columns.values()), allergens[index],
+                     PrepTimeEstimator.estimate_minutes(scored.item_text(index), lexicon))
+                    for index in range(len(scored))
+                )
+            )
+            self.conn.execute(
+                "INSERT INTO dishes_fts (rowid, item) SELECT id, item FROM dishes WHERE menu = ?", (menu_id,))
+        return len(scored)
+
+    def remove_menu(self, menu_id: str) -> None:
+        with self.conn:
+            self._delete_menu(menu_id)
+
+    def clear(self) -> None:
+        with self.conn:
+            self.conn.execute("DELETE FROM dishes")
+            self.conn.execute("INSERT INTO dishes_fts (dishes_fts) VALUES ('delete-all')")
+            self.conn.execute("DELETE FROM meta")
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM dishes").fetchone()[0]
+
+    def search(self, query: Optional[str] = None, max_price: Optional[float] = None,
+               allergy_filters: Optional[List[AllergyFilter]] = None, order_by: str = 'health',
+               menus: Optional[List[str]] = None, limit: int = 20,
+               max_prep_minutes: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Find dishes matching a full-text query and hard constraints
+
+        Args:
+            query: FTS5 query, e.g. 'grilled AND NOT cheese' or '"ice cream" OR cake'
+            max_price: Exclude dishes priced above this (unpriced dishes are kept)
+            allergy_filters: Exclude dishes AllergyChecker would veto
+            order_by: A score field (highest first), 'price' (cheapest first) or
+                'relevance' (best full-text match first; needs a query)
+            menus: Restrict to these menu ids
+            max_prep_minutes: Exclude dishes estimated to take longer than this
+                (AllergyFilter.QUICK implies PrepTimeEstimator.QUICK_SERVICE_MINUTES)
+        """
+        allergy_filters = allergy_filters or []
+        clauses, params = [], []
+
+        if query:
+            clauses.append("d.id IN (SELECT rowid FROM dishes_fts WHERE dishes_fts MATCH ?)")
+            params.append(self._fts_query(query))
+        if max_price is not None:
+            clauses.append("(d.price IS NULL OR d.price <= ?)")
+            params.append(max_price)
+        if AllergyFilter.QUICK in allergy_filters:
+            quick = PrepTimeEstimator.QUICK_SERVICE_MINUTES
+            max_prep_minutes = quick if max_prep_minutes is None else min(max_prep_minutes, quick)
+        if max_prep_minutes is not None:
+            clauses.append("d.prep_minutes <= ?")
+            params.append(max_prep_minutes)
+        if menus:
+            clauses.append(f"d.menu IN ({', '.join('?' * len(menus))})")
+            params.extend(menus)
+
+        mask = 0
+        for allergy_filter in allergy_filters:
+            if allergy_filter is not AllergyFilter.QUICK:
+                mask |= AllergyChecker.filter_bit(allergy_filter)
+        if mask:
+            clauses.append("(d.allergens & ?) = 0")
+            params.append(mask)
+
+        if order_by in SCORE_FIELDS:
+            order = f"d.{order_by} DESC, d.price IS NULL, d.price, d.id"
+        elif order_by == 'price':
+            order = "d.price IS NULL, d.price, d.id"
+        elif order_by == 'relevance':
+            if not query:
+                raise ValueError("order_by='relevance' requires a query")
+            order = "bm25(dishes_fts), d.id"
+        else:
+            raise ValueError(f"Unknown order_by '{order_by}'")
+
+        source = "dishes d"
+        if order_by == 'relevance':
+            # Relevance ranking needs the FTS row itself rather than an IN filter
+            source = "dishes_fts JOIN dishes d ON d.id = dishes_fts.rowid"
+            clauses[0] = "dishes_fts MATCH ?"
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = (f"SELECT d.menu, d.name, d.item, d.price, d.prep_minutes, {', '.join('d.' + f for f in SCORE_FIELDS)} "
+               f"FROM {source} {where} ORDER BY {order}")
+
+        results = []
+        for row in self.conn.execute(f"{sql} LIMIT {int(limit)}", params):
+            menu, name, item, price, prep_minutes, *scores = row
+            results.append({
+                'menu': menu,
+                'clean_name': name,
+                'item': item,
+                'price': price,
+                'prep_minutes': prep_minutes,
+                'scores': dict(zip(SCORE_FIELDS, scores))
+            })
+        return results
+
+    @staticmethod
+    def _fts_query(query: str) -> str:
+        # FTS5 spells "a AND NOT b" as "a NOT b"
+        return re.sub(r'\bAND\s+NOT\b', 'NOT', query)
+
+    def _delete_menu(self, menu_id: str) -> None:
+        self.conn.execute(
+            "INSERT INTO dishes_fts (dishes_fts, rowid, item) SELECT 'delete', id, item FROM dishes WHERE menu = ?",
+            (menu_id,))
+        self.conn.execute("DELETE FROM dishes WHERE menu = ?", (menu_id,))
@@ -1,19 +1,191 @@
+import math
+import os
+from array import array
 import plotly.graph_objects as go
 import pandas as pd
-from typing import Dict, List, Tuple, Any
-from .models import SteeringMode, AllergyFilter, AllergyChecker
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple, Any, Optional
+from .models import SteeringMode, AllergyFilter, AllergyChecker, PrepTimeEstimator, DecisionMetrics, RefereeChoice
+from .instrumentation import StageTimer, NullStageTimer, TimingHook
+from .scored_menu import SCORE_FIELDS, ScoredMenu
+from .diversity import SimilarityIndex, mmr_select, shortlist
+from .pareto import Objectives, closeness, knee_point, objective_points, pareto_front
+from .result_cache import ResultCache
+from .batch import analyze_many, run_pool
+from .streaming import analyze_stream
+from .ingest import MappedMenuFile, menu_files
+from .menu_table import MenuTable
+from .fingerprint import FingerprintMemo
+from .menu_store import ScoredMenuStore
+from .keyword_index import KeywordIndex, iter_bits
+from .lexicon import AUTO_LOCALE, DETECT_LINES, Lexicon, content_digest, head_lines, lexicons, packs
+from .scoring import ScoringKernel, compile_profile, engine_profile
+from .tokens import TOKENIZER_VERSION, tokenize
+
+def _keyword_list(name: str) -> property:
+    """One of the engine's keyword lists; reassigning it swaps the whole keyword state at once"""
+    def get(self) -> List[str]:
+        return self._keywords[1][name]
+    
+    def set(self, keywords: List[str]) -> None:
+        published, lists = self._keywords
+        self._keywords = (published, {**lists, name: keywords})
+    
+    return property(get, set)
 
 class DecisionIntelligenceEngine:
     """Professional decision intelligence engine for executive-level analysis"""
     
-    def __init__(self):
-        self.health_keywords = ['salad', 'grilled', 'steamed', 'quinoa', 'salmon', 'chicken breast', 'vegetables', 'fruit', 'lean', 'organic']
-        self.taste_keywords = ['burger', 'pizza', 'chocolate', 'cheese', 'bacon', 'fried', 'cake', 'ice cream', 'sauce', 'crispy', 'truffle']
-        self.premium_keywords = ['wagyu', 'truffle', 'lobster', 'caviar', 'aged', 'artisan', 'premium', 'organic', 'imported']
-        self.speed_keywords = ['quick', 'fast', 'ready', 'instant', 'express', 'wrap', 'sandwich']
+    LEXICON_FIELDS = ('health_keywords', 'taste_keywords', 'premium_keywords', 'speed_keywords',
+                      'satiety_keywords', 'light_keywords')
+    
+    # Editable in place; all six live in one (published Lexicon, lists) tuple swapped by use_lexicon
+    health_keywords = _keyword_list('health_keywords')
+    taste_keywords = _keyword_list('taste_keywords')
+    premium_keywords = _keyword_list('premium_keywords')
+    speed_keywords = _keyword_list('speed_keywords')
+    satiety_keywords = _keyword_list('satiety_keywords')
+    light_keywords = _keyword_list('light_keywords')
+    
+    def __init__(self, timing_hook: Optional[TimingHook] = None, cache: Optional[ResultCache] = None,
+                 store: Optional[ScoredMenuStore] = None, locale: str = AUTO_LOCALE):
+        self.timing_hook = timing_hook
+        self.cache = cache
+        self.store = store
+        # A locale from src/lexicons/locales.json, or AUTO_LOCALE to detect one per menu
+        self.locale = locale
+        self._kernel: Optional[ScoringKernel] = None
+        self._kernel_key: Optional[Tuple] = None
+        # (published Lexicon, its tables as edited, Lexicon of the edited tables)
+        self._edited: Optional[Tuple[Lexicon, Tuple, Lexicon]] = None
+        # Sets the keyword lists now and again whenever a new lexicon is published
+        lexicons.follow(self)
+    
+    @property
+    def lexicon_version(self) -> str:
+        """Fingerprint of every keyword list the analysis depends on
+        
+        The version of snapshot(), recomputed on each call so cached results
+        are invalidated as soon as any list is edited, even in place.
+        """
+        return self._version(self.snapshot())
+    
+    def lexicon(self) -> Dict[str, List[str]]:
+        """Snapshot of the engine's keyword lists, keyed by attribute name"""
+        lists = self._keywords[1]
+        return {name: list(lists[name]) for name in self.LEXICON_FIELDS}
+    
+    def use_lexicon(self, lexicon: Lexicon) -> None:
+        """Replace the keyword lists with fresh copies from a published Lexicon, in one swap"""
+        self._keywords = (lexicon, {name: list(lexicon.engine_keywords[name]) for name in self.LEXICON_FIELDS})
+    
+    def menu_lexicon(self, lines: Iterable[str]) -> Lexicon:
+        """Lexicon to analyze a menu with: the snapshot() or a locale pack
+        
+        `lines` are the menu's leading lines; with AUTO_LOCALE only the first
+        DETECT_LINES of them are read to pick the locale.
+        """
+        locale = packs.detect(lines) if self.locale == AUTO_LOCALE else self.locale
+        return self.snapshot() if locale == packs.default_locale else packs.get(locale)
+    
+    def snapshot(self) -> Lexicon:
+        """The engine's keyword lists, with allergy and prep-time keywords, as one Lexicon
+        
+        Analyses take this once and use it throughout, so a hot reload that
+        lands mid-analysis cannot mix keyword tables. The engine lists plus
+        AllergyChecker.ALLERGY_KEYWORDS and the PrepTimeEstimator tables are
+        read as they are now: unedited, they give the published Lexicon
+        itself; edited in place, a Lexicon built from them (with its own
+        digest), compiled once per edit.
+        """
+        published, lists = self._keywords
+        key = (tuple(tuple(lists[name]) for name in self.LEXICON_FIELDS),
+               tuple((f.name, tuple(keywords)) for f, keywords in AllergyChecker.ALLERGY_KEYWORDS.items()),
+               tuple(PrepTimeEstimator.FAST_KEYWORDS.items()),
+               tuple(PrepTimeEstimator.SLOW_KEYWORDS.items()))
+        if key == (tuple(published.engine_keywords[name] for name in self.LEXICON_FIELDS),
+                   tuple(published.allergy_keywords.items()),
+                   tuple(published.prep_fast.items()),
+                   tuple(published.prep_slow.items())):
+            return published
+        edited = self._edited
+        if edited is None or edited[0] is not published or edited[1] != key:
+            engine_keywords, allergy_keywords, fast, slow = key
+            data = {'version': published.version, 'locale': published.locale,
+                    'engine': dict(zip(self.LEXICON_FIELDS, engine_keywords)),
+                    'allergy': dict(allergy_keywords),
+                    'prep_time': {'fast': dict(fast), 'slow': dict(slow)}}
+            digest = content_digest(repr((published.digest, key)).encode('utf-8'))
+            edited = self._edited = (published, key, Lexicon(data, digest))
+        return edited[2]
+    
+    def _version(self, lexicon: Lexicon) -> str:
+        """Cache key part for the Lexicon a menu is analyzed with"""
+        return f"{TOKENIZER_VERSION}:{lexicon.locale}:{lexicon.digest}"
+    
+    def kernel(self) -> ScoringKernel:
+        """Shared compiled scoring kernel for the current keyword lists"""
+        lists = self._keywords[1]
+        key = tuple(tuple(lists[name]) for name in self.LEXICON_FIELDS)
+        if key != self._kernel_key:
+            self._kernel = compile_profile(engine_profile(dict(zip(self.LEXICON_FIELDS, key))))
+            self._kernel_key = key
+        return self._kernel
+    
+    def analyze_many(self, menus: Iterable[str], nutrition_focus: float, budget_focus: float,
+                     allergy_filters: List[AllergyFilter], budget_limit: float = None,
+                     workers: Optional[int] = None, chunksize: int = 64,
+                     ordered: bool = True) -> Iterator[Any]:
+        """
+        Analyze a batch of menus with the same steering across a process pool
+        
+        Each worker builds its engine once from this engine's lexicon. Yields
+        analyses in input order, or (index, analysis) pairs as they complete
+        when ordered=False. See src.batch.analyze_many.
+        """
+        return analyze_many(self, menus, nutrition_focus, budget_focus, allergy_filters, budget_limit,
+                            workers=workers, chunksize=chunksize, ordered=ordered)
+    
+    def analyze_stream(self, source, nutrition_focus: float, budget_focus: float,
+                       allergy_filters: List[AllergyFilter], budget_limit: float = None,
+                       veto_sample: int = 100) -> Dict[str, Any]:
+        """
+        Analyze a menu too large for memory from text, an open file or any line iterable
+        
+        Recommendations match analyze_menu while memory stays constant in menu
+        size. See src.streaming.analyze_stream for the veto fields.
+        """
+        return analyze_stream(self, source, nutrition_focus, budget_focus, allergy_filters, budget_limit,
+                              veto_sample=veto_sample)
+    
+    def analyze_file(self, path: str, nutrition_focus: float, budget_focus: float,
+                     allergy_filters: List[AllergyFilter], budget_limit: float = None) -> Dict[str, Any]:
+        """Stream one memory-mapped menu file through analyze_stream"""
+        with MappedMenuFile(path) as menu_file:
+            analysis = self.analyze_stream(menu_file.iter_items(), nutrition_focus, budget_focus,
+                                           allergy_filters, budget_limit)
+        analysis['source'] = path
+        return analysis
+    
+    def analyze_files(self, paths, nutrition_focus: float, budget_focus: float,
+                      allergy_filters: List[AllergyFilter], budget_limit: float = None,
+                      workers: Optional[int] = None, ordered: bool = True) -> Iterator[Any]:
+        """
+        Analyze menu files in parallel, one file per task
+        
+        `paths` is an iterable of file paths, a single menu file, or a
+        directory, whose .txt and .menu files are analyzed in name order.
+        Yields analyses like analyze_many; each carries its file in 'source'.
+        """
+        if isinstance(paths, (str, os.PathLike)):
+            # One path, never an iterable of characters
+            paths = menu_files(paths) if os.path.isdir(paths) else [paths]
+        return run_pool(self, 'analyze_file', paths,
+                        (nutrition_focus, budget_focus, allergy_filters, budget_limit),
+                        workers=workers, chunksize=1, ordered=ordered)
     
     def analyze_menu(self, menu_text: str, nutrition_focus: float, budget_focus: float, 
-                    allergy_filters: List[AllergyFilter], budget_limit: float = None) -> Dict[str, Any]:
+                    allergy_filters: List[AllergyFilter], budget_limit: float = None,
+                    collect_timings: bool = False) -> Dict[str, Any]:
         """
         Comprehensive menu analysis with executive-level decision intelligence
         
@@ -22,30 +194,205 @@ class DecisionIntelligenceEngine:
             budget_focus: 0-100 scale (0=Economy, 100=Premium)
             allergy_filters: Hard constraints
             budget_limit: Maximum price constraint
+            collect_timings: Include per-stage timings and item counts in the result
         """
         
+        # Stage timings are only recorded when requested or forwarded to a hook
+        if collect_timings or self.timing_hook:
+            timer = StageTimer(hook=self.timing_hook)
+        else:
+            timer = NullStageTimer()
+        
+        lexicon = self.menu_lexicon(head_lines(menu_text))
+        
+        # Serve repeated requests from the result cache
+        cache_key = None
+        if self.cache is not None:
+            timer.start()
+            cache_key = self.cache.make_key(menu_text, nutrition_focus, budget_focus, allergy_filters,
+                                            budget_limit, self._version(lexicon))
+            cached = self.cache.get(cache_key)
+            timer.stop('cache', 1, int(cached is not None))
+            if cached is not None:
+                return self._with_timings(cached, timer, collect_timings)
+        
+        analysis = self._run_pipeline(menu_text, nutrition_focus, budget_focus, allergy_filters,
+                                      budget_limit, timer, lexicon)
+        
+        if cache_key is not None:
+            self.cache.put(cache_key, analysis)
+        return self._with_timings(analysis, timer, collect_timings)
+    
+    def analyze_table(self, table: MenuTable, nutrition_focus: float, budget_focus: float,
+                      allergy_filters: List[AllergyFilter], budget_limit: float = None,
+                      collect_timings: bool = False) -> Dict[str, Any]:
+        """
+        Analyze a structured menu (see src.menu_table) without the text-parsing path
+        
+        Names and prices come straight from their columns; keyword and
+        allergen checks run on name, description and tags.
+        """
+        if collect_timings or self.timing_hook:
+            timer = StageTimer(hook=self.timing_hook)
+        else:
+            timer = NullStageTimer()
+        
+        if not len(table):
+            return self._with_timings(self._empty_analysis(), timer, collect_timings)
+        
+        lexicon = self.menu_lexicon(table.match_text(index) for index in range(min(len(table), DETECT_LINES)))
+        
+        timer.start()
+        safe_rows = []
+        vetoed_items = []
+        for index in range(len(table)):
+            text = table.match_text(index)
+            veto_reasons = self._veto_reasons(
+                allergy_filters, budget_limit, lambda f: AllergyChecker.violates_filter(text, f, lexicon),
+                table.price(index))
+            if veto_reasons:
+                vetoed_items.append({'item': table.names[index], 'reasons': veto_reasons})
+            else:
+                safe_rows.append((index, text))
+        timer.stop('constraints', len(table), len(safe_rows))
+        
+        if not safe_rows:
+            return self._with_timings(self._no_safe_options(vetoed_items, allergy_filters), timer, collect_timings)
+        
+        timer.start()
+        scored_items = ScoredMenu()
+        for index, text in safe_rows:
+            scored_items.append(text, table.names[index], table.price(index),
+                                self._score_text(text.lower(), lexicon))
+        timer.stop('scoring', len(safe_rows), len(scored_items))
+        
+        timer.start()
+        recommendations = self._generate_recommendations(scored_items, nutrition_focus, budget_focus)
+        trade_offs = self._trade_offs(scored_items, recommendations, budget_focus)
+        timer.stop('recommendations', len(scored_items), len(recommendations))
+        
+        analysis = self._analysis_result(recommendations, vetoed_items, len(table),
+                                         allergy_filters, nutrition_focus, budget_focus, trade_offs)
+        return self._with_timings(analysis, timer, collect_timings)
+    
+    def _run_pipeline(self, menu_text: str, nutrition_focus: float, budget_focus: float,
+                      allergy_filters: List[AllergyFilter], budget_limit: Optional[float],
+                      timer, lexicon: Optional[Lexicon] = None) -> Dict[str, Any]:
+        """Run parse, constraints, scoring and recommendation stages"""
+        if self.store is not None:
+            return self._run_stored_pipeline(menu_text, nutrition_focus, budget_focus, allergy_filters,
+                                             budget_limit, timer, lexicon)
+        
         # Parse and filter menu items
+        timer.start()
         raw_items = self._parse_menu(menu_text)
+        timer.stop('parse', menu_text.count('\n') + 1, len(raw_items))
         if not raw_items:
             return self._empty_analysis()
         
         # Apply hard constraints
-        safe_items, vetoed_items = self._apply_constraints(raw_items, allergy_filters, budget_limit)
+        timer.start()
+        safe_items, vetoed_items = self._apply_constraints(raw_items, allergy_filters, budget_limit, lexicon)
+        timer.stop('constraints', len(raw_items), len(safe_items))
         
         if not safe_items:
             return self._no_safe_options(vetoed_items, allergy_filters)
         
         # Score all safe items across multiple dimensions
-        scored_items = self._score_items(safe_items)
+        timer.start()
+        scored_items = self._score_items(safe_items, lexicon)
+        timer.stop('scoring', len(safe_items), len(scored_items))
         
         # Generate three distinct recommendations
+        timer.start()
         recommendations = self._generate_recommendations(scored_items, nutrition_focus, budget_focus)
+        trade_offs = self._trade_offs(scored_items, recommendations, budget_focus)
+        timer.stop('recommendations', len(scored_items), len(recommendations))
         
         # Create decision intelligence output
+        return self._analysis_result(recommendations, vetoed_items, len(raw_items),
+                                     allergy_filters, nutrition_focus, budget_focus, trade_offs)
+    
+    def _run_stored_pipeline(self, menu_text: str, nutrition_focus: float, budget_focus: float,
+                             allergy_filters: List[AllergyFilter], budget_limit: Optional[float],
+                             timer, lexicon: Optional[Lexicon] = None) -> Dict[str, Any]:
+        """Pipeline variant that loads parsed-and-scored menus from the persistent store"""
+        key = self.store.make_key(menu_text, self._version(lexicon))
+        
+        timer.start()
+        stored = self.store.get(key)
+        if stored is not None:
+            all_items, allergens = stored
+            timer.stop('load', menu_text.count('\n') + 1, len(all_items))
+        else:
+            # Score every parsed item once so the entry serves any set of constraints
+            raw_items = self._parse_menu(menu_text)
+            timer.stop('parse', menu_text.count('\n') + 1, len(raw_items))
+            timer.start()
+            all_items = self._score_items(raw_items, lexicon)
+            allergens = array('I', (AllergyChecker.allergen_mask(item, lexicon) for item in raw_items))
+            self.store.put(key, all_items, allergens)
+            timer.stop('scoring', len(raw_items), len(all_items))
+        
+        if not len(all_items):
+            return self._empty_analysis()
+        
+        # Apply hard constraints from the stored allergen masks and prices
+        timer.start()
+        keyword_filters = [f for f in allergy_filters if AllergyChecker.has_keywords(f, lexicon)]
+        required = 0
+        for allergy_filter in keyword_filters:
+            required |= AllergyChecker.filter_bit(allergy_filter)
+        # Filters without keywords fall back to the text check
+        text_checked = len(keyword_filters) < len(allergy_filters)
+        
+        safe_indices = []
+        vetoed_items = []
+        prices = all_items.prices
+        for index, mask in enumerate(allergens):
+            if not (mask & required or text_checked or
+                    (budget_limit and prices[index] > budget_limit)):
+                safe_indices.append(index)
+                continue
+            
+            def violates(allergy_filter, index=index, mask=mask):
+                if AllergyChecker.has_keywords(allergy_filter, lexicon):
+                    return bool(mask & AllergyChecker.filter_bit(allergy_filter))
+                return AllergyChecker.violates_filter(all_items.item_text(index), allergy_filter, lexicon)
+            
+            price = all_items.price(index) if budget_limit else None
+            veto_reasons = self._veto_reasons(allergy_filters, budget_limit, violates, price)
+            if veto_reasons:
+                vetoed_items.append({'item': all_items.clean_name(index), 'reasons': veto_reasons})
+            else:
+                safe_indices.append(index)
+        timer.stop('constraints', len(all_items), len(safe_indices))
+        
+        if not safe_indices:
+            return self._no_safe_options(vetoed_items, allergy_filters)
+        
+        timer.start()
+        scored_items = all_items.take(safe_indices) if len(safe_indices) < len(all_items) else all_items
+        timer.stop('select', len(all_items), len(scored_items))
+        
+        timer.start()
+        recommendations = self._generate_recommendations(scored_items, nutrition_focus, budget_focus)
+        trade_offs = self._trade_offs(scored_items, recommendations, budget_focus)
+        timer.stop('recommendations', len(scored_items), len(recommendations))
+        
+        return self._analysis_result(recommendations, vetoed_items, len(all_items),
+                                     allergy_filters, nutrition_focus, budget_focus, trade_offs)
+    
+    def _analysis_result(self, recommendations: List[RefereeChoice], vetoed_items: List[Dict],
+                         total_analyzed: int, allergy_filters: List[AllergyFilter],
+                         nutrition_focus: float, budget_focus: float,
+                         trade_offs: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Assemble the analyze_menu output dict"""
         return {
             'recommendations': recommendations,
+            **(trade_offs or {}),
             'vetoed_items': vetoed_items,
-            'total_analyzed': len(raw_items),
+            'total_analyzed': total_analyzed,
             'constraints_applied': len(allergy_filters),
             'steering_config': {
                 'nutrition_focus': nutrition_focus,
@@ -53,6 +400,13 @@ class DecisionIntelligenceEngine:
             }
         }
     
+    def _with_timings(self, analysis: Dict[str, Any], timer, collect_timings: bool) -> Dict[str, Any]:
+        """Close the stage timer and attach the timings section if requested"""
+        timings = timer.finish()
+        if collect_timings:
+            analysis['timings'] = timings
+        return analysis
+    
     def _parse_menu(self, menu_text: str) -> List[str]:
         """Parse menu text into clean items"""
         items = []
@@ -63,24 +417,26 @@ class DecisionIntelligenceEngine:
         return items
     
     def _apply_constraints(self, items: List[str], allergy_filters: List[AllergyFilter], 
-                          budget_limit: float = None) -> Tuple[List[str], List[Dict]]:
-        """Apply hard constraints and return safe items + veto log"""
+                          budget_limit: float = None,
+                          lexicon: Optional[Lexicon] = None) -> Tuple[List[str], List[Dict]]:
+        """Apply hard constraints and return safe items + veto log
+        
+        Allergy and quick-service filters are answered once for the whole
+        menu from a KeywordIndex; each item then only looks up its ids.
+        """
         safe_items = []
         vetoed_items = []
         
-        for item in items:
-            veto_reasons = []
-            
-            # Check allergy constraints
-            for allergy_filter in allergy_filters:
-                if AllergyChecker.violates_filter(item, allergy_filter):
-                    veto_reasons.append(f"Violates {allergy_filter.value} constraint")
-            
-            # Check budget constraint
-            if budget_limit:
-                price = self._extract_price(item)
-                if price and price > budget_limit:
-                    veto_reasons.append(f"Exceeds budget limit (${price} > ${budget_limit})")
+        flagged: Dict[AllergyFilter, set] = {}
+        if allergy_filters:
+            index = KeywordIndex(lexicon=lexicon)
+            index.extend(items)
+            flagged = {f: set(iter_bits(index.violating(f))) for f in allergy_filters}
+        
+        for item_id, item in enumerate(items):
+            price = self._extract_price(item) if budget_limit else None
+            veto_reasons = self._veto_reasons(
+                allergy_filters, budget_limit, lambda f: item_id in flagged[f], price)
             
             if veto_reasons:
                 vetoed_items.append({
@@ -92,191 +448,172 @@ class DecisionIntelligenceEngine:
         
         return safe_items, vetoed_items
     
-    def _score_items(self, items: List[str]) -> List[Dict]:
-        """Score items across all dimensions"""
-        scored_items = []
+    def _veto_reasons(self, allergy_filters: List[AllergyFilter], budget_limit: Optional[float],
+                      violates: Callable[[AllergyFilter], bool], price: Optional[float]) -> List[str]:
+        """Hard-constraint violations for one item, in filter order then budget"""
+        veto_reasons = []
+        
+        # Check allergy constraints
+        for allergy_filter in allergy_filters:
+            if violates(allergy_filter):
+                veto_reasons.append(f"Violates {allergy_filter.value} constraint")
+        
+        # Check budget constraint
+        if budget_limit:
+            if price and price > budget_limit:
+                veto_reasons.append(f"Exceeds budget limit (${price} > ${budget_limit})")
+        
+        return veto_reasons
+    
+    def _score_items(self, items: List[str], lexicon: Optional[Lexicon] = None) -> ScoredMenu:
+        """Score items across all dimensions into a columnar ScoredMenu"""
+        scored_items = ScoredMenu()
         
+        # Duplicate dishes (same text up to numbering, spacing or case) are scored once
+        score = FingerprintMemo(self._kernel_for(lexicon).score)
         for item in items:
-            item_lower = item.lower()
-            
-            # Multi-dimensional scoring
-            health_score = min(10, max(1, self._calculate_keyword_score(item_lower, self.health_keywords, base=4)))
-            taste_score = min(10, max(1, self._calculate_keyword_score(item_lower, self.taste_keywords, base=4)))
-            premium_score = min(10, max(1, self._calculate_keyword_score(item_lower, self.premium_keywords, base=3)))
-            speed_score = min(10, max(1, self._calculate_keyword_score(item_lower, self.speed_keywords, base=5)))
-            
-            # Satiety estimation (based on item characteristics)
-            satiety_score = self._estimate_satiety(item_lower)
-            
-            scored_items.append({
-                'item': item,
-                'clean_name': self._clean_item_name(item),
-                'price': self._extract_price(item),
-                'scores': {
-                    'health': health_score,
-                    'taste': taste_score,
-                    'premium': premium_score,
-                    'speed': speed_score,
-                    'satiety': satiety_score
-                }
-            })
+            scored_items.append(item, self._clean_item_name(item), self._extract_price(item), score(item))
         
         return scored_items
     
-    def _calculate_keyword_score(self, text: str, keywords: List[str], base: int = 3) -> int:
-        """Calculate score based on keyword matches"""
-        matches = sum(2 for keyword in keywords if keyword in text)
-        return base + matches
+    def _score_line(self, item: str, lexicon: Optional[Lexicon] = None) -> Tuple[str, Optional[float], Tuple[int, ...]]:
+        """Clean name, price and SCORE_FIELDS-ordered scores for one menu line"""
+        return self._clean_item_name(item), self._extract_price(item), self._score_text(item.lower(), lexicon)
     
-    def _estimate_satiety(self, item_text: str) -> int:
-        """Estimate satiety based on item characteristics"""
-        satiety_indicators = ['protein', 'meat', 'pasta', 'rice', 'bread', 'burger', 'steak']
-        light_indicators = ['salad', 'soup', 'appetizer', 'side']
-        
-        if any(indicator in item_text for indicator in satiety_indicators):
-            return 8
-        elif any(indicator in item_text for indicator in light_indicators):
-            return 4
-        else:
-            return 6
+    def _score_text(self, item_lower: str, lexicon: Optional[Lexicon] = None) -> Tuple[int, ...]:
+        """Scores in SCORE_FIELDS order for lowercased item text"""
+        return self._kernel_for(lexicon).score(item_lower)
+    
+    def _kernel_for(self, lexicon: Optional[Lexicon]) -> ScoringKernel:
+        """The engine's own kernel, or a locale pack's engine kernel"""
+        return self.kernel() if lexicon is None else lexicon.kernel('engine')
     
-    def _generate_recommendations(self, scored_items: List[Dict], nutrition_focus: float, 
-                                budget_focus: float) -> List[Dict]:
-        """Generate three distinct recommendations optimized for different priorities"""
+    def _generate_recommendations(self, scored_items: ScoredMenu, nutrition_focus: float, 
+                                budget_focus: float) -> List[RefereeChoice]:
+        """Generate three distinct recommendations optimized for different priorities
+        
+        Picks are made by maximal marginal relevance (src.diversity): the
+        primary choice is the steering optimum, then the health and taste
+        picks, chosen among the best few distinct dishes for each, trade
+        their score against similarity to the earlier picks, so near-identical
+        variants of one dish are not recommended twice.
+        """
         
         if len(scored_items) < 3:
             # Handle case with fewer than 3 items
             return self._handle_limited_items(scored_items, nutrition_focus, budget_focus)
         
-        recommendations = []
-        
-        # Recommendation 1: Optimized for current steering
-        primary = self._find_optimal_choice(scored_items, nutrition_focus, budget_focus)
-        recommendations.append(self._create_recommendation(primary, "Primary Choice", nutrition_focus, budget_focus))
-        
-        # Recommendation 2: Health-optimized alternative
-        health_optimal = self._find_health_optimal(scored_items, exclude=[primary])
-        recommendations.append(self._create_recommendation(health_optimal, "Health Optimized", 90, budget_focus))
-        
-        # Recommendation 3: Taste-optimized alternative
-        taste_optimal = self._find_taste_optimal(scored_items, exclude=[primary, health_optimal])
-        recommendations.append(self._create_recommendation(taste_optimal, "Indulgence Choice", 10, budget_focus))
-        
-        return recommendations
+        # Primary optimizes the current steering, then health and taste alternatives
+        objectives = (self._steering_scores(scored_items, nutrition_focus, budget_focus),
+                      scored_items.column('health'), scored_items.column('taste'))
+        # The primary pick is a plain argmax, so only the alternatives need a pool of candidates
+        pool = {scored_items.argmax(objectives[0])}
+        for values in objectives[1:]:
+            pool.update(shortlist(values, scored_items.clean_name))
+        pool = sorted(pool)
+        
+        names = [scored_items.clean_name(index) for index in pool]
+        vectors = zip(*([column[index] for index in pool]
+                        for column in map(scored_items.column, SCORE_FIELDS)))
+        similarity = SimilarityIndex(list(vectors), [frozenset(tokenize(name)) for name in names])
+        picks = mmr_select([[values[index] for index in pool] for values in objectives], similarity, names)
+        # Every remaining dish shares a name with an earlier pick: fall back to the first item
+        primary, health_optimal, taste_optimal = (
+            scored_items[pool[pick]] if pick is not None else scored_items[0] for pick in picks)
+        
+        return [
+            self._create_recommendation(primary, "Primary Choice", nutrition_focus, budget_focus),
+            self._create_recommendation(health_optimal, "Health Optimized", 90, budget_focus),
+            self._create_recommendation(taste_optimal, "Indulgence Choice", 10, budget_focus),
+        ]
     
-    def _find_optimal_choice(self, items: List[Dict], nutrition_focus: float, budget_focus: float) -> Dict:
-        """Find optimal choice based on current steering configuration"""
-        best_item = None
-        best_score = -1
-        
-        for item in items:
-            scores = item['scores']
-            
-            # Calculate weighted score based on steering
-            health_weight = nutrition_focus / 100
-            taste_weight = 1 - health_weight
-            premium_weight = budget_focus / 100
-            economy_weight = 1 - premium_weight
-            
-            # Composite scoring
-            primary_score = (scores['health'] * health_weight) + (scores['taste'] * taste_weight)
-            budget_score = (scores['premium'] * premium_weight) + ((10 - scores['premium']) * economy_weight)
-            
-            final_score = (primary_score * 0.7) + (budget_score * 0.2) + (scores['satiety'] * 0.1)
-            
-            if final_score > best_score:
-                best_score = final_score
-                best_item = item
-        
-        return best_item
+    def _steering_scores(self, items: ScoredMenu, nutrition_focus: float, budget_focus: float) -> List[float]:
+        """Composite score of every item under the current steering configuration"""
+        health_weight = nutrition_focus / 100
+        taste_weight = 1 - health_weight
+        premium_weight = budget_focus / 100
+        economy_weight = 1 - premium_weight
+        
+        # Composite scoring, evaluated column-wise over the whole menu
+        return [
+            ((health * health_weight) + (taste * taste_weight)) * 0.7 +
+            ((premium * premium_weight) + ((10 - premium) * economy_weight)) * 0.2 +
+            satiety * 0.1
+            for health, taste, premium, satiety in zip(
+                items.column('health'), items.column('taste'), items.column('premium'), items.column('satiety')
+            )
+        ]
     
-    def _find_health_optimal(self, items: List[Dict], exclude: List[Dict] = None) -> Dict:
-        """Find health-optimized choice"""
-        exclude = exclude or []
-        exclude_names = [item['clean_name'] for item in exclude]
-        
-        best_item = None
-        best_health = -1
-        
-        for item in items:
-            if item['clean_name'] in exclude_names:
-                continue
-            
-            if item['scores']['health'] > best_health:
-                best_health = item['scores']['health']
-                best_item = item
-        
-        return best_item or items[0]  # Fallback
+    def _pareto(self, scored_items: ScoredMenu) -> Tuple[List[int], List[Objectives]]:
+        """Pareto front over health, taste and price (see src.pareto) and the front members' objectives"""
+        points = objective_points(scored_items.column('health'), scored_items.column('taste'), scored_items.prices)
+        front = pareto_front(points)
+        return front, [points[index] for index in front]
     
-    def _find_taste_optimal(self, items: List[Dict], exclude: List[Dict] = None) -> Dict:
-        """Find taste-optimized choice"""
-        exclude = exclude or []
-        exclude_names = [item['clean_name'] for item in exclude]
-        
-        best_item = None
-        best_taste = -1
-        
-        for item in items:
-            if item['clean_name'] in exclude_names:
-                continue
-            
-            if item['scores']['taste'] > best_taste:
-                best_taste = item['scores']['taste']
-                best_item = item
-        
-        return best_item or items[0]  # Fallback
+    def _trade_offs(self, scored_items: ScoredMenu, recommendations: List[RefereeChoice], budget_focus: float,
+                    pareto: Optional[Tuple[List[int], List[Objectives]]] = None) -> Dict[str, Any]:
+        """Compromise pick and Pareto front members for the analysis output
+        
+        The front does not depend on the steering sliders, so callers that
+        keep the safe items between calls can pass a previously computed
+        `pareto`. The compromise is the knee of the front members not
+        already recommended (the whole front if none are left), and its
+        confidence is how close it comes to the ideal dish: 10/10 health and
+        taste at the cheapest price on the front.
+        """
+        front, points = pareto if pareto is not None else self._pareto(scored_items)
+        picked = {choice.name for choice in recommendations}
+        members = [position for position, index in enumerate(front)
+                   if scored_items.clean_name(index) not in picked] or list(range(len(front)))
+        knee = knee_point(points, members)
+        
+        prices = [point[2] for point in points if point[2] != -math.inf]
+        ideal = (10, 10, max(prices, default=-math.inf))
+        worst = (1, 1, min(prices, default=-math.inf))
+        confidence = int(closeness(points[knee], ideal, worst) * 100)
+        return {
+            'compromise': self._create_recommendation(scored_items[front[knee]], "Balanced Compromise", 50,
+                                                      budget_focus, confidence=confidence),
+            'pareto_front': [
+                {'name': scored_items.clean_name(index), 'price': scored_items.price(index),
+                 'health': scored_items.column('health')[index], 'taste': scored_items.column('taste')[index]}
+                for index in front
+            ],
+        }
     
     def _create_recommendation(self, item: Dict, category: str, nutrition_focus: float, 
-                             budget_focus: float) -> Dict:
+                             budget_focus: float, confidence: Optional[int] = None) -> RefereeChoice:
         """Create a professional recommendation with confidence metrics"""
         if not item:
-            return self._empty_recommendation(category)
+            return RefereeChoice.unavailable(category)
         
         scores = item['scores']
         
         # Calculate confidence based on score alignment with preferences
-        health_alignment = scores['health'] / 10 if nutrition_focus > 50 else (10 - scores['health']) / 10
-        taste_alignment = scores['taste'] / 10 if nutrition_focus < 50 else (10 - scores['taste']) / 10
-        confidence = int((health_alignment + taste_alignment) * 50)
-        
-        # Generate trade-off analysis
-        trade_offs = self._analyze_trade_offs(scores, nutrition_focus)
-        
-        return {
-            'name': item['clean_name'],
-            'category': category,
-            'scores': scores,
-            'confidence': confidence,
-            'price': item.get('price'),
-            'trade_offs': trade_offs,
-            'reasoning': self._generate_reasoning(item, category, nutrition_focus, budget_focus)
-        }
-    
-    def _analyze_trade_offs(self, scores: Dict, nutrition_focus: float) -> str:
-        """Generate trade-off analysis"""
-        if nutrition_focus > 70:
-            return f"Prioritized health ({scores['health']}/10) over indulgence ({scores['taste']}/10)"
-        elif nutrition_focus < 30:
-            return f"Prioritized taste satisfaction ({scores['taste']}/10) over nutrition ({scores['health']}/10)"
-        else:
-            return f"Balanced approach: Health {scores['health']}/10, Taste {scores['taste']}/10"
-    
-    def _generate_reasoning(self, item: Dict, category: str, nutrition_focus: float, 
-                          budget_focus: float) -> str:
-        """Generate executive-level reasoning"""
-        scores = item['scores']
-        name = item['clean_name']
-        
-        if category == "Primary Choice":
-            return f"Optimal alignment with your preferences. Delivers {scores['health']}/10 nutritional value and {scores['taste']}/10 satisfaction rating."
-        elif category == "Health Optimized":
-            return f"Maximum nutritional density at {scores['health']}/10. Ideal for long-term wellness objectives."
-        else:  # Indulgence Choice
-            return f"Peak satisfaction experience at {scores['taste']}/10. Perfect for reward-based dining."
+        if confidence is None:
+            health_alignment = scores['health'] / 10 if nutrition_focus > 50 else (10 - scores['health']) / 10
+            taste_alignment = scores['taste'] / 10 if nutrition_focus < 50 else (10 - scores['taste']) / 10
+            confidence = int((health_alignment + taste_alignment) * 50)
+        
+        # Trade-off analysis and reasoning are generated lazily by RefereeChoice
+        return RefereeChoice(
+            name=item['clean_name'],
+            metrics=DecisionMetrics(
+                health=scores['health'],
+                taste=scores['taste'],
+                satiety=scores['satiety'],
+                price=scores['premium'],
+                speed=scores['speed']
+            ),
+            confidence=confidence,
+            category=category,
+            price=item['price'],
+            nutrition_focus=nutrition_focus
+        )
     
-    def create_radar_chart(self, recommendation: Dict) -> go.Figure:
+    def create_radar_chart(self, recommendation: RefereeChoice) -> go.Figure:
         """Create professional radar chart for trade-off visualization"""
-        scores = recommendation['scores']
+        scores = recommendation.scores
         
         categories = ['Health', 'Taste', 'Premium', 'Speed', 'Satiety']
         values = [scores['health'], scores['taste'], scores['premium'], scores['speed'], scores['satiety']]
@@ -287,7 +624,7 @@ class DecisionIntelligenceEngine:
             r=values,
             theta=categories,
             fill='toself',
-            name=recommendation['name'],
+            name=recommendation.name,
             line_color='#10B981',
             fillcolor='rgba(16, 185, 129, 0.2)'
         ))
@@ -322,6 +659,8 @@ class DecisionIntelligenceEngine:
         """Return empty analysis structure"""
         return {
             'recommendations': [],
+            'compromise': None,
+            'pareto_front': [],
             'vetoed_items': [],
             'total_analyzed': 0,
             'constraints_applied': 0,
@@ -332,28 +671,18 @@ class DecisionIntelligenceEngine:
         """Handle case with no safe options"""
         return {
             'recommendations': [],
+            'compromise': None,
+            'pareto_front': [],
             'vetoed_items': vetoed_items,
             'total_analyzed': len(vetoed_items),
             'constraints_applied': len(allergy_filters),
             'error': "All menu items were vetoed due to safety constraints"
         }
     
-    def _handle_limited_items(self, items: List[Dict], nutrition_focus: float, budget_focus: float) -> List[Dict]:
+    def _handle_limited_items(self, items: ScoredMenu, nutrition_focus: float, budget_focus: float) -> List[RefereeChoice]:
         """Handle case with limited items"""
         recommendations = []
         for i, item in enumerate(items):
             category = ["Primary Choice", "Alternative", "Backup"][i] if i < 3 else "Option"
             recommendations.append(self._create_recommendation(item, category, nutrition_focus, budget_focus))
         return recommendations
-    
-    def _empty_recommendation(self, category: str) -> Dict:
-        """Create empty recommendation"""
-        return {
-            'name': 'No suitable option',
-            'category': category,
-            'scores': {'health': 0, 'taste': 0, 'premium': 0, 'speed': 0, 'satiety': 0},
-            'confidence': 0,
-            'price': None,
-            'trade_offs': 'Insufficient options available',
-            'reasoning': 'Unable to generate recommendation due to constraints'
-        }
\ No newline at end of file
@@ -0,0 +1,102 @@
+import math
+import operator
+from typing import Callable, FrozenSet, Hashable, List, Optional, Sequence, Tuple
+
+# Best distinct names kept per objective; MMR only chooses among these
+MMR_POOL = 8
+# Relevance points subtracted from an item identical (similarity 1) to an earlier pick
+MMR_PENALTY = 4.0
+# Share of similarity from score-vector cosine; the rest is token-set Jaccard
+SCORE_SIMILARITY_WEIGHT = 0.3
+
+def shortlist(values: Sequence[float], name_of: Callable[[int], Hashable], size: int = MMR_POOL) -> List[int]:
+    """Indices of the `size` best distinct names by value
+
+    Each name is represented by its first best item, and ties keep the
+    earlier item. Names are only materialized for items visited in value
+    order, which stops at `size` distinct names.
+    """
+    picked: List[int] = []
+    seen = set()
+    # Stable sort: equal values stay in input order
+    for index in sorted(range(len(values)), key=values.__getitem__, reverse=True):
+        name = name_of(index)
+        if name not in seen:
+            seen.add(name)
+            picked.append(index)
+            if len(picked) == size:
+                break
+    return picked
+
+class SimilarityIndex:
+    """Pairwise item similarity from score vectors and token sets
+
+    Score vectors are centered on their mean, so cosine measures whether two
+    items stand out from the pool in the same way (all raw scores are
+    positive and would look alike). Vectors are divided by their norms once
+    up front, so each cosine is a single dot product. Token
+    similarity is the Jaccard index of the name tokens, which catches
+    variants like "Grilled Salmon Bowl" and "Grilled Salmon Salad".
+    """
+
+    def __init__(self, vectors: Sequence[Sequence[float]], token_sets: Sequence[FrozenSet[str]],
+                 score_weight: float = SCORE_SIMILARITY_WEIGHT):
+        size = len(vectors)
+        means = [sum(column) / size for column in zip(*vectors)] if size else []
+        self.vectors: List[Tuple[float, ...]] = []
+        for vector in vectors:
+            centered = tuple(map(operator.sub, vector, means))
+            norm = math.sqrt(sum(map(operator.mul, centered, centered)))
+            # A pool-average item keeps a zero vector and resembles nothing by score
+            self.vectors.append(tuple(value / norm for value in centered) if norm else centered)
+        self.token_sets = token_sets
+        self.score_weight = score_weight
+
+    def __len__(self) -> int:
+        return len(self.vectors)
+
+    def similarity(self, a: int, b: int) -> float:
+        """Similarity in [0, 1]; 1 for identical items"""
+        if a == b:
+            return 1.0
+        cosine = max(0.0, sum(map(operator.mul, self.vectors[a], self.vectors[b])))
+        tokens_a, tokens_b = self.token_sets[a], self.token_sets[b]
+        union = len(tokens_a | tokens_b)
+        jaccard = len(tokens_a & tokens_b) / union if union else 1.0
+        return self.score_weight * cosine + (1 - self.score_weight) * jaccard
+
+def mmr_select(relevances: Sequence[Sequence[float]], index: SimilarityIndex, names: Sequence[Hashable],
+               penalty: float = MMR_PENALTY) -> List[Optional[int]]:
+    """
+    Maximal-marginal-relevance picks, one per relevance list, in order
+
+    Pick k maximizes relevances[k][i] - penalty * (max similarity of i to
+    picks 0..k-1), skipping items whose name was already picked; ties keep
+    the earliest item, so the first pick is a plain argmax. Each item's
+    max similarity to the picks so far is updated once per pick, so
+    selection is O(n * k) similarity evaluations.
+
+    Returns:
+        One index per relevance list, or None when every remaining item
+        shares a name with an earlier pick.
+    """
+    size = len(index)
+    max_similarity = [0.0] * size
+    picked_names = set()
+    picks: List[Optional[int]] = []
+
+    for position, relevance in enumerate(relevances):
+        best, best_value = None, -math.inf
+        for item in range(size):
+            value = relevance[item] - penalty * max_similarity[item]
+            if value > best_value and names[item] not in picked_names:
+                best, best_value = item, value
+        picks.append(best)
+        if best is None or position == len(relevances) - 1:
+            continue
+        picked_names.add(names[best])
+        for item in range(size):
+            similarity = index.similarity(item, best)
+            if similarity > max_similarity[item]:
+                max_similarity[item] = similarity
+    return picks
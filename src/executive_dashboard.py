@@ -1,8 +1,8 @@
 import streamlit as st
 import plotly.graph_objects as go
 import plotly.express as px
-from typing import Dict, List, Any, Tuple
-from .models import AllergyFilter
+from typing import Dict, List, Any, Optional, Tuple
+from .models import AllergyFilter, RefereeChoice
 
 class ExecutiveDashboard:
     """Professional Executive Dashboard for Decision Intelligence"""
@@ -85,7 +85,61 @@ class ExecutiveDashboard:
         """, unsafe_allow_html=True)
     
     @staticmethod
-    def render_hard_constraints() -> Tuple[List[AllergyFilter], bool]:
+    def build_decisions(analysis: Dict[str, Any], allergy_filters: List[AllergyFilter]) -> Dict[str, Any]:
+        """Shape a DecisionIntelligenceEngine.analyze_menu result for the dashboard renderers"""
+        recommendations = analysis['recommendations']
+        winner = recommendations[0] if recommendations else RefereeChoice.unavailable("Primary Choice")
+        alternative = recommendations[1] if len(recommendations) > 1 else RefereeChoice.unavailable("Alternative")
+        vetoed = analysis['vetoed_items']
+        safe_options = analysis['total_analyzed'] - len(vetoed)
+        
+        health, taste = winner.metrics.health, winner.metrics.taste
+        if health >= taste:
+            trade_offs = {'sacrificed': f"indulgence ({taste}/10)", 'gained': f"nutrition ({health}/10)"}
+        else:
+            trade_offs = {'sacrificed': f"nutrition ({health}/10)", 'gained': f"indulgence ({taste}/10)"}
+        health_weight = analysis.get('steering_config', {}).get('nutrition_focus', 50) / 100
+        
+        if safe_options >= 3:
+            risk_level = "Low - Multiple viable options"
+        elif safe_options:
+            risk_level = "Medium - Limited viable options"
+        else:
+            risk_level = "High - No viable options"
+        
+        return {
+            'winner': ExecutiveDashboard.choice_card(winner),
+            'alternative': ExecutiveDashboard.choice_card(alternative),
+            'compromise': ExecutiveDashboard.choice_card(analysis.get('compromise')),
+            'vetoed_items': [entry['item'] for entry in vetoed],
+            'veto_reasons': ['; '.join(entry['reasons']) for entry in vetoed],
+            'reasoning': analysis.get('error') or f"{winner.reasoning} {winner.trade_off_summary}.",
+            'trade_offs': trade_offs,
+            'risk_level': risk_level,
+            'alignment_score': int((health * health_weight + taste * (1 - health_weight)) * 10),
+            'total_options': analysis['total_analyzed'],
+            'safe_options': safe_options,
+            'active_constraints': [allergy_filter.value for allergy_filter in allergy_filters],
+        }
+    
+    @staticmethod
+    def choice_card(choice: Optional[RefereeChoice]) -> Dict[str, Any]:
+        """Card fields for one recommendation"""
+        choice = choice or RefereeChoice.unavailable("Balanced Compromise")
+        metrics = choice.metrics
+        return {
+            'name': choice.name,
+            'description': choice.reasoning,
+            'health_score': metrics.health,
+            'taste_score': metrics.taste,
+            'satiety_score': metrics.satiety,
+            'value_score': 10 - metrics.price if metrics.price else 0,
+            'speed_score': metrics.speed,
+            'confidence': choice.confidence,
+        }
+    
+    @staticmethod
+    def render_hard_constraints() -> List[AllergyFilter]:
         """Render professional constraint chips"""
         st.markdown("### 🛡️ Hard Constraints")
         st.markdown("*Executive dealbreakers - non-negotiable requirements*")
@@ -115,7 +169,11 @@ class ExecutiveDashboard:
             
             st.info(f"**Active Constraints:** {' • '.join(constraint_names)}")
         
-        return active_filters, time_constraint, time_constraint
+        # Quick service is enforced like any other hard constraint
+        if time_constraint:
+            active_filters.append(AllergyFilter.QUICK)
+        
+        return active_filters
     
     @staticmethod
     def render_decision_cards(decisions: Dict[str, Any]) -> None:
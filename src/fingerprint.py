@@ -0,0 +1,47 @@
+import hashlib
+import re
+from typing import Any, Callable, Dict
+
+# Leading list markers: "12.", "12)", "#12", "-", "*" or "•"
+ORDINAL_PATTERN = re.compile(r'^\s*(?:\d+[.)]|#\d+|[-*•])\s+')
+# Prices vary by branch but never affect scores
+PRICE_PATTERN = re.compile(r'\$\d+(?:\.\d+)?')
+
+def canonicalize(line: str) -> str:
+    """Line with its ordinal and prices stripped, whitespace collapsed and case folded"""
+    line = PRICE_PATTERN.sub(' ', ORDINAL_PATTERN.sub('', line, count=1))
+    return ' '.join(line.lower().split())
+
+def fingerprint(canonical: str) -> bytes:
+    """Compact 16-byte digest of a canonical line"""
+    return hashlib.blake2b(canonical.encode('utf-8'), digest_size=16).digest()
+
+class FingerprintMemo:
+    """Computes a value once per unique dish and fans it back out to duplicates
+
+    Lines are keyed by the fingerprint of their canonical form, and the value
+    is computed from that canonical form, so every duplicate gets exactly the
+    same result.
+    """
+
+    def __init__(self, compute: Callable[[str], Any]):
+        self.compute = compute
+        self.values: Dict[bytes, Any] = {}
+        self.lookups = 0
+
+    def __call__(self, line: str) -> Any:
+        self.lookups += 1
+        canonical = canonicalize(line)
+        key = fingerprint(canonical)
+        value = self.values.get(key)
+        if value is None:
+            value = self.values[key] = self.compute(canonical)
+        return value
+
+    @property
+    def unique(self) -> int:
+        return len(self.values)
+
+    @property
+    def duplicates(self) -> int:
+        return self.lookups - len(self.values)
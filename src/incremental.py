@@ -0,0 +1,169 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from .lexicon import head_lines
+from .models import AllergyFilter, AllergyChecker, PrepTimeEstimator
+from .instrumentation import StageTimer, NullStageTimer
+from .keyword_index import iter_bits
+from .price_index import ConstraintIndex
+from .scored_menu import ScoredMenu
+
+class LineAnalysis:
+    """Cached per-line results: price, allergen bitmask, prep time and (lazily) scores"""
+
+    __slots__ = ('clean_name', 'price', 'allergens', 'prep_minutes', 'scores')
+
+    def __init__(self, clean_name: str, price: Optional[float], allergens: int, prep_minutes: int):
+        self.clean_name = clean_name
+        self.price = price
+        self.allergens = allergens
+        self.prep_minutes = prep_minutes
+        self.scores: Optional[Tuple[int, ...]] = None
+
+class IncrementalAnalyzer:
+    """Re-analyzes an edited menu, re-scoring only inserted or changed lines
+
+    Lines are keyed by their stripped text, so unchanged lines reuse their
+    cached price, allergen, prep-time and score data wherever they move in the menu.
+    Lines that disappear are dropped on the next run, and the whole cache is
+    discarded when the engine's lexicon or the menu's locale changes. Once the same lines are
+    analyzed twice in a row (e.g. while a filter or budget slider moves),
+    constraints are answered from a ConstraintIndex instead of per line.
+    Keep one instance per user (e.g. in st.session_state); outputs match
+    engine.analyze_menu exactly.
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self._lines: Dict[str, LineAnalysis] = {}
+        self._lexicon_version: Optional[str] = None
+        self._lexicon = None
+        self._last_items: List[str] = []
+        self._constraints: Optional[ConstraintIndex] = None
+        # Safe items of the last analysis and their Pareto front, reused across steering changes
+        self._front_items: List[str] = []
+        self._pareto = None
+        self.reused = 0
+        self.rescored = 0
+
+    def analyze(self, menu_text: str, nutrition_focus: float, budget_focus: float,
+                allergy_filters: List[AllergyFilter], budget_limit: float = None,
+                collect_timings: bool = False) -> Dict[str, Any]:
+        """Same contract as DecisionIntelligenceEngine.analyze_menu"""
+        engine = self.engine
+        if collect_timings or engine.timing_hook:
+            timer = StageTimer(hook=engine.timing_hook)
+        else:
+            timer = NullStageTimer()
+
+        lexicon = engine.menu_lexicon(head_lines(menu_text))
+        lexicon_version = engine._version(lexicon)
+        if lexicon_version != self._lexicon_version:
+            self.clear()
+            self._lexicon_version = lexicon_version
+            self._lexicon = lexicon
+
+        # Diff against the previous parse: only new lines are analyzed
+        timer.start()
+        raw_items = engine._parse_menu(menu_text)
+        previous, current = self._lines, {}
+        reused = 0
+        for item in raw_items:
+            line = current.get(item) or previous.get(item)
+            if line is None:
+                line = self._analyze_line(item)
+            else:
+                reused += 1
+            current[item] = line
+        self._lines = current
+        self.reused = reused
+        self.rescored = 0
+        timer.stop('parse', menu_text.count('\n') + 1, len(raw_items))
+        if not raw_items:
+            return engine._with_timings(engine._empty_analysis(), timer, collect_timings)
+
+        # Apply hard constraints from the cached allergen and price data
+        timer.start()
+        if raw_items == self._last_items:
+            safe_items, vetoed_items = self._indexed_constraints(raw_items, allergy_filters, budget_limit)
+        else:
+            self._last_items = raw_items
+            self._constraints = None
+            safe_items = []
+            vetoed_items = []
+            for item in raw_items:
+                line = current[item]
+                veto_reasons = engine._veto_reasons(
+                    allergy_filters, budget_limit, lambda f: self._violates(item, line, f), line.price)
+                if veto_reasons:
+                    vetoed_items.append({'item': line.clean_name, 'reasons': veto_reasons})
+                else:
+                    safe_items.append(item)
+        timer.stop('constraints', len(raw_items), len(safe_items))
+
+        if not safe_items:
+            return engine._with_timings(engine._no_safe_options(vetoed_items, allergy_filters),
+                                        timer, collect_timings)
+
+        # Score only lines that have never been scored
+        timer.start()
+        scored_items = ScoredMenu()
+        for item in safe_items:
+            line = current[item]
+            if line.scores is None:
+                _, _, line.scores = engine._score_line(item, self._lexicon)
+                self.rescored += 1
+            scored_items.append(item, line.clean_name, line.price, line.scores)
+        timer.stop('scoring', len(safe_items), len(scored_items))
+
+        timer.start()
+        recommendations = engine._generate_recommendations(scored_items, nutrition_focus, budget_focus)
+        if self._pareto is None or safe_items != self._front_items:
+            self._front_items = safe_items
+            self._pareto = engine._pareto(scored_items)
+        trade_offs = engine._trade_offs(scored_items, recommendations, budget_focus, self._pareto)
+        timer.stop('recommendations', len(scored_items), len(recommendations))
+
+        analysis = engine._analysis_result(recommendations, vetoed_items, len(raw_items),
+                                           allergy_filters, nutrition_focus, budget_focus, trade_offs)
+        return engine._with_timings(analysis, timer, collect_timings)
+
+    def clear(self) -> None:
+        self._lines = {}
+        self._last_items = []
+        self._constraints = None
+        self._front_items = []
+        self._pareto = None
+
+    def _indexed_constraints(self, raw_items: List[str], allergy_filters: List[AllergyFilter],
+                             budget_limit: Optional[float]) -> Tuple[List[str], List[Dict]]:
+        """Safe items and veto log for an unchanged menu, via bitset algebra"""
+        lines = [self._lines[item] for item in raw_items]
+        if self._constraints is None:
+            self._constraints = ConstraintIndex([line.price for line in lines],
+                                                [line.allergens for line in lines], raw_items,
+                                                [line.prep_minutes for line in lines], self._lexicon)
+        vetoed = self._constraints.vetoed_bits(allergy_filters, budget_limit)
+
+        # Reasons are only built for vetoed items
+        vetoed_items = []
+        for item_id in iter_bits(vetoed):
+            item, line = raw_items[item_id], lines[item_id]
+            veto_reasons = self.engine._veto_reasons(
+                allergy_filters, budget_limit, lambda f: self._violates(item, line, f), line.price)
+            vetoed_items.append({'item': line.clean_name, 'reasons': veto_reasons})
+
+        safe_items = [raw_items[item_id] for item_id in iter_bits(self._constraints.all_bits & ~vetoed)]
+        return safe_items, vetoed_items
+
+    def _analyze_line(self, item: str) -> LineAnalysis:
+        lexicon = self._lexicon
+        return LineAnalysis(self.engine._clean_item_name(item), self.engine._extract_price(item),
+                            AllergyChecker.allergen_mask(item, lexicon),
+                            PrepTimeEstimator.estimate_minutes(item, lexicon))
+
+    def _violates(self, item: str, line: LineAnalysis, allergy_filter: AllergyFilter) -> bool:
+        if AllergyChecker.has_keywords(allergy_filter, self._lexicon):
+            return bool(line.allergens & AllergyChecker.filter_bit(allergy_filter))
+        if allergy_filter is AllergyFilter.QUICK:
+            return line.prep_minutes > PrepTimeEstimator.QUICK_SERVICE_MINUTES
+        return AllergyChecker.violates_filter(item, allergy_filter, self._lexicon)
@@ -0,0 +1,105 @@
+import mmap
+import os
+from array import array
+from typing import Iterator, List, Optional
+
+class MappedMenuFile:
+    """Read-only, memory-mapped view of a menu file
+
+    The file is never read into a Python string. Line boundaries are found
+    with mmap.find and kept as a compact offset index, and each record is
+    sliced and decoded only when it is accessed.
+    """
+
+    BLOCK_SIZE = 1 << 20
+
+    def __init__(self, path: str, encoding: str = 'utf-8'):
+        self.path = path
+        self.encoding = encoding
+        self._file = open(path, 'rb')
+        size = os.fstat(self._file.fileno()).st_size
+        # Zero-length files cannot be mapped
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        self._size = size
+        self._offsets: Optional[array] = None
+
+    def __enter__(self) -> 'MappedMenuFile':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    @property
+    def offsets(self) -> array:
+        """Start offset of every line, plus a final end offset"""
+        if self._offsets is None:
+            offsets = array('Q', [0])
+            for end in self._line_ends():
+                offsets.append(end + 1)
+            if offsets[-1] < self._size:
+                offsets.append(self._size + 1)
+            self._offsets = offsets
+        return self._offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        """Decoded text of one line, without its line ending"""
+        offsets = self.offsets
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self._decode(offsets[index], offsets[index + 1] - 1)
+
+    def __iter__(self) -> Iterator[str]:
+        """Every line in order; no offset index is built
+
+        Lines are decoded one block at a time, so at most `BLOCK_SIZE` bytes
+        (plus one line) are held as Python strings.
+        """
+        if self._map is None:
+            return
+        start = 0
+        while start < self._size:
+            end = self._map.rfind(b'\n', start, start + self.BLOCK_SIZE)
+            if end < 0:
+                # A single line longer than a block
+                end = self._map.find(b'\n', start + self.BLOCK_SIZE)
+            if end < 0:
+                end = self._size
+            yield from self._decode(start, end).split('\n')
+            start = end + 1
+
+    def iter_items(self) -> Iterator[str]:
+        """Stripped, non-empty, non-comment lines, as parsed by the engine"""
+        for line in self:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                yield line
+
+    def _line_ends(self) -> Iterator[int]:
+        if self._map is None:
+            return
+        find = self._map.find
+        end = find(b'\n')
+        while end >= 0:
+            yield end
+            end = find(b'\n', end + 1)
+
+    def _decode(self, start: int, end: int) -> str:
+        return self._map[start:end].decode(self.encoding, errors='replace')
+
+def menu_files(directory: str, suffixes: tuple = ('.txt', '.menu')) -> List[str]:
+    """Sorted paths of the menu files directly inside `directory`"""
+    return sorted(
+        entry.path for entry in os.scandir(directory)
+        if entry.is_file() and entry.name.endswith(suffixes)
+    )
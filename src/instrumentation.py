@@ -0,0 +1,107 @@
+import time
+from typing import Callable, Dict, Any, List, Optional
+
+TimingHook = Callable[[Dict[str, Dict[str, Any]]], None]
+
+class StageTimer:
+    """Records high-resolution timings and item counts for each pipeline stage"""
+
+    def __init__(self, hook: Optional[TimingHook] = None):
+        self.hook = hook
+        self.stages: Dict[str, Dict[str, Any]] = {}
+        self._started = time.perf_counter()
+        self._stage_start = self._started
+
+    def start(self) -> None:
+        """Mark the beginning of the next stage"""
+        self._stage_start = time.perf_counter()
+
+    def stop(self, stage: str, items_in: int, items_out: int) -> None:
+        """Record the stage that began at the last start()"""
+        self.stages[stage] = {
+            'seconds': time.perf_counter() - self._stage_start,
+            'items_in': items_in,
+            'items_out': items_out
+        }
+
+    def finish(self) -> Dict[str, Dict[str, Any]]:
+        """Close the run, forward it to the hook and return the timings section"""
+        timings = dict(self.stages)
+        timings['total'] = {'seconds': time.perf_counter() - self._started}
+        if self.hook:
+            self.hook(timings)
+        return timings
+
+class NullStageTimer:
+    """No-op stand-in used when timings are disabled"""
+
+    def start(self) -> None:
+        pass
+
+    def stop(self, stage: str, items_in: int, items_out: int) -> None:
+        pass
+
+    def finish(self) -> None:
+        return None
+
+class TraceRecorder:
+    """Records measured pipeline events for the AI Reasoning Trace panel
+
+    Steps are sequential: each call to step() closes the previous one, so a
+    step's elapsed time covers everything that ran until the next step() or
+    finish().
+    """
+
+    enabled = True
+
+    def __init__(self):
+        self.steps: List[Dict[str, Any]] = []
+        self._current: Optional[Dict[str, Any]] = None
+        self._step_start = 0.0
+
+    def step(self, title: str, **details: Any) -> None:
+        """Close the current step and open a new one with initial details"""
+        self._close_step()
+        self._current = {'title': title, 'details': dict(details), 'seconds': 0.0}
+        self._step_start = time.perf_counter()
+
+    def record(self, key: str, value: Any) -> None:
+        """Attach a measured value to the current step"""
+        if self._current is not None:
+            self._current['details'][key] = value
+
+    def finish(self) -> List[Dict[str, Any]]:
+        """Close the last step and return every recorded step"""
+        self._close_step()
+        return self.steps
+
+    @property
+    def total_seconds(self) -> float:
+        return sum(step['seconds'] for step in self.steps)
+
+    def _close_step(self) -> None:
+        if self._current is not None:
+            self._current['seconds'] = time.perf_counter() - self._step_start
+            self.steps.append(self._current)
+            self._current = None
+
+class NullTraceRecorder:
+    """No-op recorder used when the trace toggle is off
+
+    Callers should guard any work done only for the trace with `trace.enabled`.
+    """
+
+    enabled = False
+    steps: List[Dict[str, Any]] = []
+    total_seconds = 0.0
+
+    def step(self, title: str, **details: Any) -> None:
+        pass
+
+    def record(self, key: str, value: Any) -> None:
+        pass
+
+    def finish(self) -> List[Dict[str, Any]]:
+        return self.steps
+
+NULL_TRACE = NullTraceRecorder()
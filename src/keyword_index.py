@@ -0,0 +1,150 @@
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .models import AllergyFilter, AllergyChecker, PrepTimeEstimator
+from .tokens import PhraseMatcher, tokenize
+
+def iter_bits(bits: int) -> Iterator[int]:
+    """Positions of the set bits of a non-negative int, in ascending order"""
+    # Reversed binary string so position i is bit i; str.find does the scanning in C
+    digits = bin(bits)[:1:-1]
+    position = digits.find('1')
+    while position >= 0:
+        yield position
+        position = digits.find('1', position + 1)
+
+def bits_from_ids(ids: Iterable[int], size: int) -> int:
+    """Bitset with the given positions set"""
+    buffer = bytearray((size + 7) // 8)
+    for position in ids:
+        buffer[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(buffer, 'little')
+
+class KeywordIndex:
+    """Inverted index from lexicon keyword to the items containing it
+
+    Posting lists are int bitsets over item ids, so constraint queries are
+    set algebra instead of rescanning item text. Matching follows
+    AllergyChecker: a keyword matches whole stemmed tokens of the item, and
+    each item is tokenized once. Items can be added and removed
+    incrementally, and keywords that were not indexed up front are indexed
+    on first use. Items too slow for quick service (PrepTimeEstimator) get
+    their own posting list for the QUICK filter, built on its first query.
+    Keywords come from `lexicon` (e.g. a locale pack) when one is given.
+    """
+
+    def __init__(self, keywords: Optional[Iterable[str]] = None, lexicon=None):
+        self.lexicon = lexicon
+        if keywords is None:
+            keywords = (k for ks in self._allergy_keywords().values() for k in ks)
+        self.postings: Dict[str, int] = {keyword: 0 for keyword in keywords}
+        self.items: List[Optional[str]] = []
+        self._tokens: List[Optional[Tuple[str, ...]]] = []
+        self._matcher = PhraseMatcher(self.postings)
+        self.live = 0
+        self._slow: Optional[int] = None
+
+    def __len__(self) -> int:
+        return self.live.bit_count()
+
+    def add(self, item: str) -> int:
+        """Index an item and return its id"""
+        item_id = len(self.items)
+        tokens = tokenize(item)
+        self.items.append(item)
+        self._tokens.append(tokens)
+        bit = 1 << item_id
+        for keyword in self._matcher.match_tokens(tokens):
+            self.postings[keyword] |= bit
+        if self._slow is not None and not PrepTimeEstimator.is_quick(item, self.lexicon):
+            self._slow |= bit
+        self.live |= bit
+        return item_id
+
+    def extend(self, items: Iterable[str]) -> range:
+        """Index many items at once and return their ids"""
+        start = len(self.items)
+        hits: Dict[str, List[int]] = {keyword: [] for keyword in self.postings}
+        for item_id, item in enumerate(items, start):
+            tokens = tokenize(item)
+            self.items.append(item)
+            self._tokens.append(tokens)
+            for keyword in self._matcher.match_tokens(tokens):
+                hits[keyword].append(item_id)
+        end = len(self.items)
+
+        # Build each posting list once instead of growing a large int per item
+        for keyword, ids in hits.items():
+            if ids:
+                self.postings[keyword] |= bits_from_ids(ids, end)
+        if self._slow is not None:
+            self._slow |= self._slow_bits(range(start, end))
+        self.live |= ((1 << (end - start)) - 1) << start
+        return range(start, end)
+
+    def remove(self, item_id: int) -> None:
+        """Drop an item; its id is not reused"""
+        mask = ~(1 << item_id)
+        for keyword, bits in self.postings.items():
+            self.postings[keyword] = bits & mask
+        if self._slow is not None:
+            self._slow &= mask
+        self.live &= mask
+        self.items[item_id] = None
+        self._tokens[item_id] = None
+
+    def posting(self, keyword: str) -> int:
+        """Bitset of live items containing the keyword"""
+        if keyword not in self.postings:
+            self._index_keyword(keyword)
+        return self.postings[keyword]
+
+    def matching_any(self, keywords: Iterable[str]) -> int:
+        bits = 0
+        for keyword in keywords:
+            bits |= self.posting(keyword)
+        return bits
+
+    def violating(self, allergy_filter: AllergyFilter) -> int:
+        """Bitset of items AllergyChecker.violates_filter would flag"""
+        if allergy_filter is AllergyFilter.QUICK:
+            return self.slow
+        return self.matching_any(self._allergy_keywords()[allergy_filter])
+
+    @property
+    def slow(self) -> int:
+        """Bitset of live items too slow for quick service"""
+        if self._slow is None:
+            self._slow = self._slow_bits(iter_bits(self.live))
+        return self._slow
+
+    def safe_bits(self, allergy_filters: Iterable[AllergyFilter]) -> int:
+        unsafe = 0
+        for allergy_filter in allergy_filters:
+            unsafe |= self.violating(allergy_filter)
+        return self.live & ~unsafe
+
+    def safe_ids(self, allergy_filters: Iterable[AllergyFilter]) -> List[int]:
+        return list(iter_bits(self.safe_bits(allergy_filters)))
+
+    def safe_items(self, allergy_filters: Iterable[AllergyFilter]) -> List[str]:
+        """Same result as AllergyChecker.get_safe_items over the live items"""
+        return [self.items[item_id] for item_id in iter_bits(self.safe_bits(allergy_filters))]
+
+    def _allergy_keywords(self) -> Dict[AllergyFilter, Iterable[str]]:
+        if self.lexicon is None:
+            return AllergyChecker.ALLERGY_KEYWORDS
+        return {AllergyFilter[name]: keywords for name, keywords in self.lexicon.allergy_keywords.items()}
+
+    def _slow_bits(self, item_ids: Iterable[int]) -> int:
+        return bits_from_ids((item_id for item_id in item_ids
+                              if not PrepTimeEstimator.is_quick(self.items[item_id], self.lexicon)),
+                             len(self.items))
+
+    def _index_keyword(self, keyword: str) -> None:
+        matcher = PhraseMatcher([keyword])
+        self.postings[keyword] = bits_from_ids(
+            (item_id for item_id, tokens in enumerate(self._tokens)
+             if tokens is not None and matcher.match_tokens(tokens)),
+            len(self._tokens)
+        )
+        self._matcher = PhraseMatcher(self.postings)
@@ -0,0 +1,322 @@
+import hashlib
+import json
+import mmap
+import os
+import pickle
+import tempfile
+import threading
+import weakref
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .scoring import LexiconProfile, ScoringKernel, additive, compile_profile, engine_profile, register_kernel, tiered
+from .tokens import TOKENIZER_VERSION, PhraseMatcher, tokenize
+
+# Versioned keyword data; override with BITEBALANCE_LEXICON to point at another file
+LEXICON_PATH = os.environ.get(
+    'BITEBALANCE_LEXICON', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'lexicons', 'default.json'))
+# Locale packs and their detection markers, next to the default lexicon
+LOCALES_PATH = os.path.join(os.path.dirname(LEXICON_PATH), 'locales.json')
+# Bumped whenever the compiled artifact layout changes
+ARTIFACT_FORMAT = 2
+# DecisionIntelligenceEngine locale that detects each menu's locale
+AUTO_LOCALE = 'auto'
+# Locale detection reads only this many menu lines, and needs this many marker words
+DETECT_LINES = 8
+DETECT_MIN_HITS = 2
+
+def parse_dimension(spec: Dict[str, Any]):
+    if 'tiers' in spec:
+        return tiered(spec['name'], *((tier['keywords'], tier['value']) for tier in spec['tiers']),
+                      default=spec['default'])
+    return additive(spec['name'], spec['base'], *((term['keywords'], term['weight']) for term in spec['terms']),
+                    low=spec.get('low', 1), high=spec.get('high', 10))
+
+def _extend(base: Dict[str, Tuple[str, ...]], extra: Dict[str, List[str]]) -> Dict[str, Tuple[str, ...]]:
+    """Keyword lists of `base` with `extra` appended, keeping order and dropping repeats"""
+    merged = dict(base)
+    for name, keywords in extra.items():
+        merged[name] = tuple(dict.fromkeys((*merged[name], *keywords))) if name in merged else tuple(keywords)
+    return merged
+
+class Lexicon:
+    """One published version of every keyword list, compiled and never modified
+
+    Holds the engine's keyword lists, the named scoring profiles used by the
+    apps, allergy keywords by AllergyFilter name and prep-time adjustments,
+    plus their compiled kernels and matchers. Analyses that captured a
+    Lexicon keep using it even after a newer one is published.
+
+    A locale pack is built with `base` set: its keywords are appended to the
+    base lexicon's, so menus mixing languages still match both.
+    """
+
+    def __init__(self, data: Dict[str, Any], digest: str, base: Optional['Lexicon'] = None):
+        if not isinstance(data.get('version'), int):
+            raise ValueError("Lexicon data needs an integer 'version'")
+        self.version: int = data['version']
+        self.digest = digest
+        self.locale: Optional[str] = data.get('locale')
+        self.base_digest = base.digest if base is not None else None
+        self.engine_keywords: Dict[str, Tuple[str, ...]] = _extend(
+            base.engine_keywords if base is not None else {}, data.get('engine', {}))
+        self.profiles: Dict[str, LexiconProfile] = {'engine': engine_profile(self.engine_keywords)}
+        if base is not None:
+            self.profiles.update((name, profile) for name, profile in base.profiles.items() if name != 'engine')
+        for name, dimensions in data.get('profiles', {}).items():
+            self.profiles[name] = LexiconProfile(name, tuple(parse_dimension(spec) for spec in dimensions))
+        self.allergy_keywords: Dict[str, Tuple[str, ...]] = _extend(
+            base.allergy_keywords if base is not None else {}, data.get('allergy', {}))
+        prep_time = data.get('prep_time', {})
+        self.prep_fast: Dict[str, int] = {**(base.prep_fast if base is not None else {}), **prep_time.get('fast', {})}
+        self.prep_slow: Dict[str, int] = {**(base.prep_slow if base is not None else {}), **prep_time.get('slow', {})}
+
+        # Compiled eagerly so a published lexicon is complete before anyone sees it
+        self.kernels: Dict[str, ScoringKernel] = {
+            name: compile_profile(profile) for name, profile in self.profiles.items()}
+        self.allergy_matcher = PhraseMatcher(k for keywords in self.allergy_keywords.values() for k in keywords)
+        self.prep_matcher = PhraseMatcher([*self.prep_fast, *self.prep_slow])
+
+    def kernel(self, name: str) -> ScoringKernel:
+        return self.kernels[name]
+
+    @classmethod
+    def from_bytes(cls, raw: bytes) -> 'Lexicon':
+        return cls(json.loads(raw.decode('utf-8')), content_digest(raw))
+
+def content_digest(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()[:16]
+
+def write_artifact(lexicon: Lexicon, path: str) -> None:
+    """Atomically write a compiled lexicon; readers see the old file or the new one, never a partial one"""
+    payload = pickle.dumps((ARTIFACT_FORMAT, TOKENIZER_VERSION, lexicon.digest, lexicon),
+                           protocol=pickle.HIGHEST_PROTOCOL)
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.lexicon-', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as tmp:
+            tmp.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def read_artifact(path: str, digest: str) -> Optional[Lexicon]:
+    """Memory-map and load a compiled lexicon, or None if it is missing or stale"""
+    try:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            artifact_format, tokenizer_version, artifact_digest, lexicon = pickle.loads(mapped)
+    except (OSError, ValueError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return None
+    if (artifact_format, tokenizer_version, artifact_digest) != (ARTIFACT_FORMAT, TOKENIZER_VERSION, digest):
+        return None
+    # Profiles already compiled in this process (e.g. shared with the base lexicon) reuse that kernel
+    lexicon.kernels = {name: register_kernel(kernel) for name, kernel in lexicon.kernels.items()}
+    return lexicon
+
+def load_compiled(digest: str, artifact_path: str, build: Callable[[], Lexicon],
+                  reuse: bool = True) -> Tuple[Lexicon, bool]:
+    """Lexicon from its artifact when current, else built and cached; also returns whether it was compiled"""
+    lexicon = read_artifact(artifact_path, digest) if reuse else None
+    if lexicon is not None:
+        return lexicon, False
+    lexicon = build()
+    try:
+        write_artifact(lexicon, artifact_path)
+    except OSError:
+        pass  # Read-only deployments just compile at startup
+    return lexicon, True
+
+class LexiconRegistry:
+    """Process-wide active Lexicon with atomic hot reload
+
+    reload() builds the new Lexicon completely (from the compiled artifact
+    next to the data file when it matches, otherwise by compiling and then
+    writing that artifact), then publishes it with a single reference swap.
+    Readers never lock, so in-flight analyses are not blocked. Subscribers
+    (AllergyChecker, PrepTimeEstimator) and followed engines are switched
+    over right after the swap.
+    """
+
+    def __init__(self, path: str = LEXICON_PATH, artifact_path: Optional[str] = None):
+        self.path = path
+        self.artifact_path = artifact_path or f"{path}.compiled"
+        self._active: Optional[Lexicon] = None
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._lock = threading.Lock()
+        self._subscribers: List[Callable[[Lexicon], None]] = []
+        self._followers: 'weakref.WeakSet' = weakref.WeakSet()
+        self.loads = 0
+        self.compiles = 0
+
+    def active(self) -> Lexicon:
+        lexicon = self._active
+        if lexicon is None:
+            self.reload()
+            lexicon = self._active
+        return lexicon
+
+    def kernel(self, name: str) -> ScoringKernel:
+        return self.active().kernel(name)
+
+    def reload(self, force: bool = False) -> bool:
+        """Load the data file and publish it if its content changed; returns whether it did"""
+        with self._lock:
+            stamp = self._file_stamp()
+            with open(self.path, 'rb') as f:
+                raw = f.read()
+            digest = content_digest(raw)
+            current = self._active
+            if current is not None and current.digest == digest and not force:
+                self._stamp = stamp
+                return False
+
+            lexicon, compiled = load_compiled(digest, self.artifact_path, lambda: Lexicon.from_bytes(raw),
+                                              reuse=not force)
+            self.compiles += compiled
+            self.loads += 1
+
+            self._active = lexicon
+            self._stamp = stamp
+            subscribers, followers = list(self._subscribers), list(self._followers)
+        for subscriber in subscribers:
+            subscriber(lexicon)
+        for engine in followers:
+            engine.use_lexicon(lexicon)
+        return True
+
+    def reload_if_changed(self) -> bool:
+        """Cheap stat() check, e.g. once per Streamlit rerun"""
+        if self._active is not None and self._file_stamp() == self._stamp:
+            return False
+        return self.reload()
+
+    def subscribe(self, subscriber: Callable[[Lexicon], None]) -> None:
+        """Call `subscriber` with the active lexicon now and with every newly published one"""
+        self._subscribers.append(subscriber)
+        subscriber(self.active())
+
+    def follow(self, engine) -> None:
+        """Keep an engine's keyword lists on the active lexicon (held weakly)"""
+        self._followers.add(engine)
+        engine.use_lexicon(self.active())
+
+    def _file_stamp(self) -> Tuple[int, int]:
+        stat = os.stat(self.path)
+        return stat.st_mtime_ns, stat.st_size
+
+def head_lines(text: str, limit: int = DETECT_LINES) -> List[str]:
+    """First `limit` non-empty, non-comment lines of a menu, without splitting the rest"""
+    lines: List[str] = []
+    start, size = 0, len(text)
+    while len(lines) < limit and start <= size:
+        end = text.find('\n', start)
+        if end < 0:
+            end = size
+        line = text[start:end].strip()
+        if line and not line.startswith('#'):
+            lines.append(line)
+        start = end + 1
+    return lines
+
+class LocalePacks:
+    """Per-locale lexicon packs over the base lexicon, compiled on first use
+
+    The manifest (locales.json) names each locale's pack file and a few
+    marker words for detect(). A pack is only read and compiled the first
+    time a menu in its locale is analyzed, then shared by every engine in the
+    process until the base lexicon changes (or clear() is called), so only
+    locales actually in use cost memory. Compiled packs are cached on disk
+    next to their data file like the base lexicon.
+    """
+
+    def __init__(self, base: LexiconRegistry, manifest_path: str = LOCALES_PATH):
+        self.base = base
+        self.manifest_path = manifest_path
+        self._default: Optional[str] = None
+        self._files: Dict[str, str] = {}
+        self._markers: Dict[str, Tuple[str, ...]] = {}
+        self._packs: Dict[str, Lexicon] = {}
+        self._lock = threading.Lock()
+        self.compiles = 0
+
+    @property
+    def default_locale(self) -> str:
+        """Locale of the base lexicon itself"""
+        self._load_manifest()
+        return self._default
+
+    def locales(self) -> List[str]:
+        self._load_manifest()
+        return list(self._files)
+
+    def detect(self, lines: Iterable[str]) -> str:
+        """Locale whose marker words occur most in the first DETECT_LINES menu lines
+
+        Falls back to the default locale unless another locale has at least
+        DETECT_MIN_HITS markers and more than the default one.
+        """
+        self._load_manifest()
+        markers = self._markers
+        hits = dict.fromkeys(self._files, 0)
+        for count, line in enumerate(lines):
+            if count == DETECT_LINES:
+                break
+            for token in markers.keys() & tokenize(line):
+                for locale in markers[token]:
+                    hits[locale] += 1
+        best = max(hits, key=hits.get)
+        if hits[best] >= DETECT_MIN_HITS and hits[best] > hits[self._default]:
+            return best
+        return self._default
+
+    def get(self, locale: str) -> Lexicon:
+        """Compiled lexicon for a locale: the base lexicon or the base plus that locale's pack"""
+        base = self.base.active()
+        if locale == self.default_locale:
+            return base
+        pack = self._packs.get(locale)
+        if pack is None or pack.base_digest != base.digest:
+            with self._lock:
+                pack = self._packs.get(locale)
+                if pack is None or pack.base_digest != base.digest:
+                    pack = self._packs[locale] = self._compile(locale, base)
+        return pack
+
+    def loaded(self) -> List[str]:
+        """Locales whose packs are compiled in this process"""
+        return list(self._packs)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._packs = {}
+
+    def _compile(self, locale: str, base: Lexicon) -> Lexicon:
+        path = os.path.join(os.path.dirname(self.manifest_path), self._files[locale])
+        with open(path, 'rb') as f:
+            raw = f.read()
+        digest = content_digest(base.digest.encode('ascii') + raw)
+        pack, compiled = load_compiled(digest, f"{path}.compiled",
+                                       lambda: Lexicon(json.loads(raw.decode('utf-8')), digest, base))
+        self.compiles += compiled
+        return pack
+
+    def _load_manifest(self) -> None:
+        if self._default is not None:
+            return
+        with open(self.manifest_path, encoding='utf-8') as f:
+            manifest = json.load(f)
+        markers: Dict[str, Tuple[str, ...]] = {}
+        for locale, entry in manifest['locales'].items():
+            for marker in {token for word in entry['markers'] for token in tokenize(word)}:
+                markers[marker] = markers.get(marker, ()) + (locale,)
+        self._files = {locale: entry['file'] for locale, entry in manifest['locales'].items()}
+        self._markers = markers
+        self._default = manifest['default']
+
+lexicons = LexiconRegistry()
+packs = LocalePacks(lexicons)
+
+def get_kernel(name: str) -> ScoringKernel:
+    """Compiled kernel for a named profile of the active lexicon"""
+    return lexicons.kernel(name)
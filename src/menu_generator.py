@@ -0,0 +1,79 @@
+import random
+from typing import Iterator, List
+
+class SyntheticMenuGenerator:
+    """Seeded generator for realistic synthetic menus used by benchmarks and profiling"""
+
+    SECTIONS = ['Starters', 'Salads', 'Mains', 'Bowls', 'Sandwiches', 'Pizza', 'Desserts', 'Sides']
+
+    PREPARATIONS = ['Grilled', 'Steamed', 'Fried', 'Crispy', 'Roasted', 'Braised', 'Smoked', 'Seared',
+                    'Baked', 'Slow-Cooked', 'Pan-Fried', 'Charred', 'Poached', 'Classic', 'House']
+    PROTEINS = ['Salmon', 'Chicken', 'Beef', 'Pork', 'Tofu', 'Shrimp', 'Lamb', 'Turkey', 'Cod',
+                'Tuna', 'Duck', 'Mushroom', 'Chickpea', 'Lobster', 'Wagyu']
+    DISHES = ['Bowl', 'Salad', 'Burger', 'Wrap', 'Sandwich', 'Pizza', 'Pasta', 'Risotto', 'Tacos',
+              'Curry', 'Stir Fry', 'Platter', 'Soup', 'Skewers', 'Plate']
+
+    # Words drawn from the scoring lexicons so items actually move the scores
+    KEYWORD_INGREDIENTS = ['quinoa', 'vegetables', 'fruit', 'lean', 'organic', 'chicken breast',
+                           'cheese', 'bacon', 'chocolate', 'sauce', 'ice cream', 'truffle', 'caviar',
+                           'aged', 'artisan', 'premium', 'imported', 'express', 'quick', 'rice',
+                           'steak', 'protein', 'side']
+    ALLERGEN_INGREDIENTS = ['peanut', 'almond', 'walnut', 'cashew', 'bread', 'flour', 'wheat',
+                            'bun', 'crust', 'milk', 'butter', 'cream', 'yogurt', 'egg']
+    NEUTRAL_INGREDIENTS = ['lettuce', 'tomato', 'onion', 'garlic', 'herbs', 'lemon', 'olives',
+                           'cucumber', 'peppers', 'spinach', 'basil', 'ginger', 'sesame', 'lime',
+                           'cilantro', 'avocado', 'beans', 'corn', 'carrots', 'radish']
+
+    def __init__(self, seed: int = 42, keyword_density: float = 0.4, allergen_rate: float = 0.3,
+                 price_rate: float = 0.95, section_every: int = 25):
+        """
+        Args:
+            seed: Random seed; the same seed always yields the same menu
+            keyword_density: Share of description ingredients taken from the scoring lexicons
+            allergen_rate: Probability that an item mentions at least one allergen
+            price_rate: Probability that an item carries a "$" price
+            section_every: Emit a "# Section" header roughly every N items (0 disables)
+        """
+        self.seed = seed
+        self.keyword_density = keyword_density
+        self.allergen_rate = allergen_rate
+        self.price_rate = price_rate
+        self.section_every = section_every
+
+    def iter_lines(self, count: int) -> Iterator[str]:
+        """Yield `count` menu item lines (plus occasional section headers)"""
+        rng = random.Random(self.seed)
+
+        for number in range(1, count + 1):
+            if self.section_every and (number - 1) % self.section_every == 0:
+                yield f"# {rng.choice(self.SECTIONS)}"
+            yield self._build_line(rng, number)
+
+    def generate_lines(self, count: int) -> List[str]:
+        """Return the generated lines as a list"""
+        return list(self.iter_lines(count))
+
+    def generate(self, count: int) -> str:
+        """Return a complete menu as text, one item per line"""
+        return '\n'.join(self.iter_lines(count))
+
+    def _build_line(self, rng: random.Random, number: int) -> str:
+        """Build a single '1. Name - $Price - Description' line"""
+        name = f"{rng.choice(self.PREPARATIONS)} {rng.choice(self.PROTEINS)} {rng.choice(self.DISHES)}"
+
+        ingredients = []
+        for _ in range(rng.randint(3, 7)):
+            if rng.random() < self.keyword_density:
+                ingredients.append(rng.choice(self.KEYWORD_INGREDIENTS))
+            else:
+                ingredients.append(rng.choice(self.NEUTRAL_INGREDIENTS))
+        if rng.random() < self.allergen_rate:
+            ingredients.insert(rng.randrange(len(ingredients) + 1), rng.choice(self.ALLERGEN_INGREDIENTS))
+        description = ', '.join(ingredients).capitalize()
+
+        if rng.random() < self.price_rate:
+            # Log-normal prices cluster around $15 with a long premium tail
+            price = min(250.0, max(3.0, rng.lognormvariate(2.7, 0.45)))
+            cents = rng.choice(['00', '50', '95', '99'])
+            return f"{number}. {name} - ${int(price)}.{cents} - {description}"
+        return f"{number}. {name} - {description}"
@@ -0,0 +1,74 @@
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from typing import Optional, Tuple
+
+from .result_cache import ResultCache
+from .scored_menu import ScoredMenu
+
+class ScoredMenuStore:
+    """Persistent SQLite store of parsed-and-scored menus
+
+    Each entry holds every parsed item of a menu as a serialized ScoredMenu
+    plus a per-item allergen bitmask, keyed by the normalized menu's content
+    hash and the engine's lexicon version. Constraints are applied after
+    loading, so one entry serves every filter and budget combination, and
+    entries survive process restarts.
+    """
+
+    def __init__(self, path: str, max_entries: int = 10_000):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(menu_text: str, lexicon_version: str) -> str:
+        content = ResultCache.normalize_menu(menu_text)
+        return hashlib.sha256(f"{lexicon_version}\n{content}".encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Tuple[ScoredMenu, array]]:
+        """The stored (scored items, allergen masks) for a key, or None"""
+        with self._lock:
+            row = self._connection().execute(
+                'SELECT scored, allergens FROM menus WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        allergens = array('I')
+        allergens.frombytes(row[1])
+        return ScoredMenu.from_bytes(row[0]), allergens
+
+    def put(self, key: str, scored: ScoredMenu, allergens: array) -> None:
+        scored_blob = scored.to_bytes()
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute('INSERT OR REPLACE INTO menus (key, scored, allergens, created) VALUES (?, ?, ?, ?)',
+                             (key, scored_blob, allergens.tobytes(), time.time()))
+                # Periodically drop the oldest entries to keep the file bounded
+                if self._writes % 100 == 0:
+                    conn.execute('DELETE FROM menus WHERE key IN (SELECT key FROM menus ORDER BY created DESC '
+                                 'LIMIT -1 OFFSET ?)', (self.max_entries,))
+            self._writes += 1
+
+    def _connection(self) -> sqlite3.Connection:
+        """Per-process SQLite connection, reopened after a fork"""
+        if self._conn is None or self._conn_pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('CREATE TABLE IF NOT EXISTS menus '
+                         '(key TEXT PRIMARY KEY, scored BLOB, allergens BLOB, created REAL)')
+            conn.execute('CREATE INDEX IF NOT EXISTS menus_created ON menus (created)')
+            conn.commit()
+            self._conn = conn
+            self._conn_pid = os.getpid()
+        return self._conn
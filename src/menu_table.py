@@ -0,0 +1,175 @@
+import csv
+import json
+import math
+import os
+import re
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+COLUMN_ALIASES = {
+    'name': ('name', 'item', 'item_name', 'title', 'dish'),
+    'price': ('price', 'cost', 'amount'),
+    'description': ('description', 'desc', 'ingredients', 'details'),
+    'tags': ('tags', 'labels', 'categories')
+}
+
+class MenuTable:
+    """Typed, columnar menu loaded from a structured export
+
+    One column per field: names, descriptions and tags as lists of str and
+    prices as a float sequence with NaN for missing values. Arrow loads
+    keep the price column as a view over the Arrow buffer.
+    """
+
+    __slots__ = ('names', 'prices', 'descriptions', 'tags')
+
+    def __init__(self, names: List[str], prices: Sequence[float], descriptions: List[str], tags: List[str]):
+        if not len(names) == len(prices) == len(descriptions) == len(tags):
+            raise ValueError("All menu columns must have the same length")
+        self.names = names
+        self.prices = prices
+        self.descriptions = descriptions
+        self.tags = tags
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def price(self, index: int) -> Optional[float]:
+        price = self.prices[index]
+        return None if math.isnan(price) else price
+
+    def match_text(self, index: int) -> str:
+        """Text the keyword and allergen checks run against"""
+        parts = [self.names[index], self.descriptions[index], self.tags[index]]
+        return ' - '.join(part for part in parts if part)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]],
+                     columns: Optional[Dict[str, str]] = None) -> 'MenuTable':
+        """Build a table from row dicts, mapping source keys onto menu fields"""
+        names, descriptions, tags = [], [], []
+        prices = array('d')
+        mapping = None
+        for record in records:
+            if mapping is None:
+                mapping = resolve_columns(record.keys(), columns)
+            names.append(_text(record.get(mapping['name'])))
+            prices.append(parse_price(record.get(mapping['price'])))
+            descriptions.append(_text(record.get(mapping['description'])))
+            tags.append(_tags(record.get(mapping['tags'])))
+        return cls(names, prices, descriptions, tags)
+
+def resolve_columns(available: Iterable[str], columns: Optional[Dict[str, str]] = None) -> Dict[str, Optional[str]]:
+    """Map each menu field to a source column, by explicit mapping or known aliases"""
+    by_lower = {key.strip().lower(): key for key in available}
+    mapping = {}
+    for field, aliases in COLUMN_ALIASES.items():
+        if columns and field in columns:
+            mapping[field] = columns[field]
+            continue
+        mapping[field] = next((by_lower[alias] for alias in aliases if alias in by_lower), None)
+    if mapping['name'] is None:
+        raise ValueError(f"No name column found in {sorted(by_lower)}")
+    return mapping
+
+def parse_price(value: Any) -> float:
+    """Numeric, "$12.50"- or "12,50 €"-style price, NaN when missing or unparseable
+    
+    A last comma followed by one or two digits, with no dot after it, is a
+    decimal separator (dots are then thousands separators); any other comma
+    separates thousands.
+    """
+    if value is None or value == '':
+        return math.nan
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = str(value)
+    if re.search(r',\d{1,2}(?![\d,.])[^,.]*$', text):
+        text = text.replace('.', '').replace(',', '.')
+    else:
+        text = text.replace(',', '')
+    match = re.search(r'\d+(?:\.\d+)?', text)
+    return float(match.group(0)) if match else math.nan
+
+def _text(value: Any) -> str:
+    return '' if value is None else str(value).strip()
+
+def _tags(value: Any) -> str:
+    if value is None:
+        return ''
+    if isinstance(value, (list, tuple)):
+        return ', '.join(str(tag).strip() for tag in value if tag)
+    return ', '.join(tag.strip() for tag in re.split(r'[;,|]', str(value)) if tag.strip())
+
+def load_csv(path: str, columns: Optional[Dict[str, str]] = None, **reader_options) -> MenuTable:
+    with open(path, newline='', encoding='utf-8') as f:
+        return MenuTable.from_records(csv.DictReader(f, **reader_options), columns)
+
+def load_json(path: str, columns: Optional[Dict[str, str]] = None) -> MenuTable:
+    """A list of row objects, or an object holding one under 'items' or 'menu'"""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    if isinstance(data, dict):
+        data = data.get('items', data.get('menu', []))
+    return MenuTable.from_records(data, columns)
+
+def load_jsonl(path: str, columns: Optional[Dict[str, str]] = None) -> MenuTable:
+    with open(path, encoding='utf-8') as f:
+        return MenuTable.from_records((json.loads(line) for line in f if line.strip()), columns)
+
+def load_arrow(path: str, columns: Optional[Dict[str, str]] = None) -> MenuTable:
+    """Arrow IPC file or stream; a float64 price column without nulls is not copied"""
+    try:
+        import pyarrow as pa
+        import pyarrow.compute as pc
+    except ImportError as e:
+        raise ImportError("Loading Arrow menus requires pyarrow (pip install pyarrow)") from e
+
+    with pa.memory_map(path) as source:
+        try:
+            table = pa.ipc.open_file(source).read_all()
+        except pa.ArrowInvalid:
+            source.seek(0)
+            table = pa.ipc.open_stream(source).read_all()
+
+    mapping = resolve_columns(table.column_names, columns)
+    rows = table.num_rows
+
+    def strings(field, convert=_text):
+        name = mapping[field]
+        if name is None:
+            return [''] * rows
+        return [convert(value) for value in table.column(name).to_pylist()]
+
+    price_name = mapping['price']
+    if price_name is None:
+        prices = array('d', [math.nan]) * rows
+    else:
+        column = table.column(price_name)
+        if pa.types.is_floating(column.type) or pa.types.is_integer(column.type):
+            column = column.cast(pa.float64()).combine_chunks()
+            if column.null_count:
+                column = pc.fill_null(column, math.nan)
+            # The values buffer is viewed in place rather than copied into Python floats
+            prices = memoryview(column.buffers()[1]).cast('d')[column.offset:column.offset + rows]
+        else:
+            prices = array('d', (parse_price(value) for value in column.to_pylist()))
+
+    return MenuTable(strings('name'), prices, strings('description'), strings('tags', _tags))
+
+LOADERS = {
+    '.csv': load_csv,
+    '.json': load_json,
+    '.jsonl': load_jsonl,
+    '.ndjson': load_jsonl,
+    '.arrow': load_arrow,
+    '.feather': load_arrow,
+    '.ipc': load_arrow
+}
+
+def load_menu_table(path: str, columns: Optional[Dict[str, str]] = None) -> MenuTable:
+    """Load a structured menu export, picking the loader from the file extension"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in LOADERS:
+        raise ValueError(f"Unsupported menu format '{extension}' (expected one of {sorted(LOADERS)})")
+    return LOADERS[extension](path, columns)
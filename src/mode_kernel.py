@@ -0,0 +1,34 @@
+from typing import Callable, Dict, Hashable, Mapping, Optional, Sequence, Tuple
+
+from .scoring import Scores
+
+def best_per_mode(items: Sequence[str], score: Callable[[str], Scores],
+                  weights: Mapping[Hashable, Sequence[float]]) -> Dict[Hashable, Tuple[int, Optional[Scores]]]:
+    """
+    Best item for every weight vector, scoring each item only once
+
+    Each mode (Zen, Gremlin or any persona) is a weight vector over the
+    scorer's outputs. Comparisons match the apps' original per-mode loops:
+    an item must beat the running best strictly, starting from 0, so ties
+    keep the earliest item.
+
+    Returns:
+        Mode -> (index of its best item, that item's scores). The scores are
+        None if no item scored above 0, in which case the index is 0.
+    """
+    modes = list(weights)
+    vectors = [tuple(weights[mode]) for mode in modes]
+    best_values = [0.0] * len(modes)
+    best = [(0, None)] * len(modes)
+
+    for index, item in enumerate(items):
+        scores = score(item)
+        for slot, vector in enumerate(vectors):
+            value = 0.0
+            for weight, component in zip(vector, scores):
+                value += component * weight
+            if value > best_values[slot]:
+                best_values[slot] = value
+                best[slot] = (index, scores)
+
+    return dict(zip(modes, best))
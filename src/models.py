@@ -1,6 +1,11 @@
-from dataclasses import dataclass
-from typing import List, Optional, Dict
+import re
+import weakref
+from functools import lru_cache
+from dataclasses import dataclass, field
+from typing import List, Optional, Dict, Tuple
 from enum import Enum
+from .lexicon import get_kernel, lexicons
+from .tokens import PhraseMatcher
 
 class SteeringMode(Enum):
     ZEN = "Zen Mode"
@@ -17,7 +22,9 @@ class AllergyFilter(Enum):
     VEGAN = "🌱 Vegan"
     QUICK = "⚡ Under 20 mins"
 
-@dataclass
+_FILTER_BITS = {allergy_filter: 1 << index for index, allergy_filter in enumerate(AllergyFilter)}
+
+@dataclass(frozen=True, slots=True)
 class DecisionMetrics:
     """5-dimensional analysis metrics"""
     health: int  # 1-10
@@ -26,17 +33,72 @@ class DecisionMetrics:
     price: int   # 1-10 (10 = expensive)
     speed: int   # 1-10 (10 = very fast)
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RefereeChoice:
-    """Professional referee recommendation"""
+    """Professional referee recommendation
+    
+    trade_off_summary and reasoning are formatted on first access only, so
+    recommendations that are never displayed cost no string formatting.
+    """
     name: str
     metrics: DecisionMetrics
     confidence: float  # 0-100%
-    trade_off_summary: str
-    reasoning: str
-    category: str  # "optimizer", "alternative", "compromise"
+    category: str  # "Primary Choice", "Health Optimized", "Indulgence Choice", ...
+    price: Optional[float] = None
+    nutrition_focus: float = 50.0
+    _trade_off_summary: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _reasoning: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    @classmethod
+    def unavailable(cls, category: str) -> 'RefereeChoice':
+        """Placeholder used when constraints leave nothing to recommend"""
+        choice = cls(name='No suitable option', metrics=DecisionMetrics(0, 0, 0, 0, 0), confidence=0, category=category)
+        object.__setattr__(choice, '_trade_off_summary', 'Insufficient options available')
+        object.__setattr__(choice, '_reasoning', 'Unable to generate recommendation due to constraints')
+        return choice
+    
+    @property
+    def scores(self) -> Dict[str, int]:
+        """Scores keyed the way the decision engine and charts name them"""
+        return {
+            'health': self.metrics.health,
+            'taste': self.metrics.taste,
+            'premium': self.metrics.price,
+            'speed': self.metrics.speed,
+            'satiety': self.metrics.satiety
+        }
+    
+    @property
+    def trade_off_summary(self) -> str:
+        """Trade-off analysis for the steering this choice was made under"""
+        if self._trade_off_summary is None:
+            health, taste = self.metrics.health, self.metrics.taste
+            if self.nutrition_focus > 70:
+                summary = f"Prioritized health ({health}/10) over indulgence ({taste}/10)"
+            elif self.nutrition_focus < 30:
+                summary = f"Prioritized taste satisfaction ({taste}/10) over nutrition ({health}/10)"
+            else:
+                summary = f"Balanced approach: Health {health}/10, Taste {taste}/10"
+            object.__setattr__(self, '_trade_off_summary', summary)
+        return self._trade_off_summary
+    
+    @property
+    def reasoning(self) -> str:
+        """Executive-level reasoning for the category this choice fills"""
+        if self._reasoning is None:
+            health, taste = self.metrics.health, self.metrics.taste
+            if self.category == "Primary Choice":
+                reasoning = f"Optimal alignment with your preferences. Delivers {health}/10 nutritional value and {taste}/10 satisfaction rating."
+            elif self.category == "Health Optimized":
+                reasoning = f"Maximum nutritional density at {health}/10. Ideal for long-term wellness objectives."
+            elif self.category == "Balanced Compromise":
+                reasoning = f"Most balanced trade-off: {health}/10 nutrition and {taste}/10 satisfaction, and no dish beats it on health, taste and price at once."
+            else:  # Indulgence Choice
+                reasoning = f"Peak satisfaction experience at {taste}/10. Perfect for reward-based dining."
+            object.__setattr__(self, '_reasoning', reasoning)
+        return self._reasoning
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class DecisionIntelligence:
     """Complete decision analysis output"""
     optimizer: RefereeChoice
@@ -46,7 +108,7 @@ class DecisionIntelligence:
     constraint_summary: str
     methodology_note: str
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MenuItem:
     """Represents a single menu item"""
     name: str
@@ -56,7 +118,7 @@ class MenuItem:
     taste_score: int = 0
     final_score: float = 0.0
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RefereeDecision:
     """The AI referee's final decision with parallel universe comparison"""
     winner: str
@@ -66,8 +128,8 @@ class RefereeDecision:
     modification: str
     parallel_choice: str = ""
     parallel_explanation: str = ""
-    vetoed_items: List[str] = None
-    active_filters: List[str] = None
+    vetoed_items: Optional[List[str]] = None
+    active_filters: Optional[List[str]] = None
 
 class DualAxisCalculator:
     """Handles dual-axis steering calculations"""
@@ -149,61 +211,8 @@ class ProfessionalAnalyzer:
     
     @staticmethod
     def analyze_menu_item(item_text: str) -> DecisionMetrics:
-        """Analyze a menu item and return 5D metrics"""
-        item_lower = item_text.lower()
-        
-        # Health analysis (1-10)
-        health_keywords = ['salad', 'grilled', 'steamed', 'quinoa', 'salmon', 'lean', 'vegetables', 'fruit', 'whole grain']
-        unhealthy_keywords = ['fried', 'deep', 'butter', 'cream', 'sugar', 'processed']
-        
-        health_score = 5  # baseline
-        health_score += sum(1 for kw in health_keywords if kw in item_lower)
-        health_score -= sum(1 for kw in unhealthy_keywords if kw in item_lower)
-        health_score = max(1, min(10, health_score))
-        
-        # Taste analysis (1-10)
-        taste_keywords = ['cheese', 'bacon', 'chocolate', 'sauce', 'crispy', 'rich', 'decadent', 'signature']
-        bland_keywords = ['plain', 'steamed', 'boiled']
-        
-        taste_score = 5  # baseline
-        taste_score += sum(1 for kw in taste_keywords if kw in item_lower)
-        taste_score -= sum(1 for kw in bland_keywords if kw in item_lower)
-        taste_score = max(1, min(10, taste_score))
-        
-        # Satiety analysis (1-10)
-        filling_keywords = ['protein', 'meat', 'pasta', 'rice', 'bread', 'burger', 'large']
-        light_keywords = ['salad', 'soup', 'appetizer', 'small']
-        
-        satiety_score = 5  # baseline
-        satiety_score += sum(1 for kw in filling_keywords if kw in item_lower)
-        satiety_score -= sum(1 for kw in light_keywords if kw in item_lower)
-        satiety_score = max(1, min(10, satiety_score))
-        
-        # Price analysis (1-10, where 10 = expensive)
-        expensive_keywords = ['lobster', 'truffle', 'wagyu', 'premium', 'organic', 'artisan']
-        cheap_keywords = ['basic', 'simple', 'classic']
-        
-        price_score = 5  # baseline
-        price_score += sum(2 for kw in expensive_keywords if kw in item_lower)
-        price_score -= sum(1 for kw in cheap_keywords if kw in item_lower)
-        price_score = max(1, min(10, price_score))
-        
-        # Speed analysis (1-10, where 10 = very fast)
-        fast_keywords = ['sandwich', 'wrap', 'salad', 'ready', 'quick']
-        slow_keywords = ['braised', 'slow', 'roasted', 'baked']
-        
-        speed_score = 5  # baseline
-        speed_score += sum(1 for kw in fast_keywords if kw in item_lower)
-        speed_score -= sum(1 for kw in slow_keywords if kw in item_lower)
-        speed_score = max(1, min(10, speed_score))
-        
-        return DecisionMetrics(
-            health=health_score,
-            taste=taste_score,
-            satiety=satiety_score,
-            price=price_score,
-            speed=speed_score
-        )
+        """Analyze a menu item and return 5D metrics (price: 10 = expensive, speed: 10 = very fast)"""
+        return DecisionMetrics(**get_kernel('professional').score_dict(item_text))
 
 class PromptBuilder:
     """Builds AI prompts based on steering mode"""
@@ -247,49 +256,201 @@ class PromptBuilder:
         
         return f"{base_prompt}\n{mode_prompt}\n{output_format}{budget_constraint}"
 
+class PrepTimeEstimator:
+    """Estimates an item's preparation time in minutes from its text"""
+    
+    QUICK_SERVICE_MINUTES = 20
+    BASE_MINUTES = 25
+    MIN_MINUTES = 5
+    # "10 min", "15-20 mins", "ready in 12 minutes": the upper bound wins
+    EXPLICIT_MINUTES = re.compile(r'(\d+)(?:\s*-\s*(\d+))?\s*min(?:ute)?s?\b', re.IGNORECASE)
+    
+    # Loaded from the active lexicon (see use_lexicon); may be edited in place
+    FAST_KEYWORDS: Dict[str, int] = {}
+    SLOW_KEYWORDS: Dict[str, int] = {}
+    
+    @staticmethod
+    def estimate_minutes(item_text: str, lexicon=None) -> int:
+        """Stated prep time if the item gives one, otherwise a keyword estimate
+        
+        Keywords come from FAST_KEYWORDS and SLOW_KEYWORDS, or from `lexicon`
+        (e.g. a locale pack) when one is given.
+        """
+        match = PrepTimeEstimator.EXPLICIT_MINUTES.search(item_text)
+        if match:
+            return int(match.group(2) or match.group(1))
+        matcher, adjustments = PrepTimeEstimator._matcher(lexicon)
+        minutes = PrepTimeEstimator.BASE_MINUTES
+        minutes += sum(adjustments[keyword] for keyword in matcher.match(item_text))
+        return max(PrepTimeEstimator.MIN_MINUTES, minutes)
+    
+    @staticmethod
+    def is_quick(item_text: str, lexicon=None) -> bool:
+        return PrepTimeEstimator.estimate_minutes(item_text, lexicon) <= PrepTimeEstimator.QUICK_SERVICE_MINUTES
+    
+    _compiled: Optional[Tuple] = None
+    # Compiled tables of other lexicons in use, dropped with the Lexicon
+    _lexicon_compiled: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+    
+    @staticmethod
+    def use_lexicon(lexicon) -> None:
+        """Switch to a published Lexicon, reusing its precompiled matcher
+        
+        The tables are published before the matcher compiled from them, and
+        _matcher reads the matcher first, so a reader never pairs the new
+        matcher with old tables.
+        """
+        fast, slow = dict(lexicon.prep_fast), dict(lexicon.prep_slow)
+        compiled = PrepTimeEstimator._compile(fast, slow, lexicon.prep_matcher)
+        PrepTimeEstimator.FAST_KEYWORDS, PrepTimeEstimator.SLOW_KEYWORDS = fast, slow
+        PrepTimeEstimator._compiled = compiled
+    
+    @staticmethod
+    def _matcher(lexicon=None) -> Tuple[PhraseMatcher, Dict[str, int]]:
+        """Keyword matcher and signed minute adjustments, recompiled when either table is edited"""
+        if lexicon is not None:
+            compiled = PrepTimeEstimator._lexicon_compiled.get(lexicon)
+            if compiled is None:
+                compiled = PrepTimeEstimator._lexicon_compiled[lexicon] = PrepTimeEstimator._compile(
+                    lexicon.prep_fast, lexicon.prep_slow, lexicon.prep_matcher)
+            return compiled[1], compiled[2]
+        compiled = PrepTimeEstimator._compiled
+        fast, slow = PrepTimeEstimator.FAST_KEYWORDS, PrepTimeEstimator.SLOW_KEYWORDS
+        if compiled is None or compiled[0] != PrepTimeEstimator._key(fast, slow):
+            compiled = PrepTimeEstimator._compiled = PrepTimeEstimator._compile(fast, slow)
+        return compiled[1], compiled[2]
+    
+    @staticmethod
+    def _key(fast: Dict[str, int], slow: Dict[str, int]) -> Tuple:
+        return tuple(fast.items()), tuple(slow.items())
+    
+    @staticmethod
+    def _compile(fast: Dict[str, int], slow: Dict[str, int], matcher: Optional[PhraseMatcher] = None) -> Tuple:
+        adjustments: Dict[str, int] = {}
+        for keyword, cut in fast.items():
+            adjustments[keyword] = adjustments.get(keyword, 0) - cut
+        for keyword, extra in slow.items():
+            adjustments[keyword] = adjustments.get(keyword, 0) + extra
+        return PrepTimeEstimator._key(fast, slow), matcher or PhraseMatcher(adjustments), adjustments
+
 class AllergyChecker:
-    """Checks menu items against allergy filters"""
+    """Checks menu items against allergy filters
     
-    ALLERGY_KEYWORDS = {
-        AllergyFilter.NUTS: ['nut', 'almond', 'peanut', 'walnut', 'pecan', 'cashew', 'pistachio'],
-        AllergyFilter.GLUTEN: ['wheat', 'bread', 'pasta', 'flour', 'gluten', 'bun', 'crust'],
-        AllergyFilter.DAIRY: ['milk', 'cheese', 'butter', 'cream', 'yogurt', 'dairy'],
-        AllergyFilter.VEGAN: ['meat', 'chicken', 'beef', 'pork', 'fish', 'salmon', 'cheese', 'milk', 'egg']
-    }
+    Keywords match whole words after light stemming (tokens.PhraseMatcher),
+    so "nut" catches "nuts" but not "donut" or "coconut". Compound words
+    that contain an allergen are therefore listed explicitly.
+    """
+    
+    # Loaded from the active lexicon (see use_lexicon); may be edited in place
+    ALLERGY_KEYWORDS: Dict[AllergyFilter, List[str]] = {}
+    
+    _compiled: Optional[Tuple] = None
+    # Mask functions of other lexicons in use, dropped with the Lexicon
+    _lexicon_masks: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+    
+    @staticmethod
+    def violates_filter(item_text: str, allergy_filter: AllergyFilter, lexicon=None) -> bool:
+        """Check if an item violates an allergy filter, by `lexicon`'s keywords if given"""
+        if allergy_filter is AllergyFilter.QUICK:
+            return not PrepTimeEstimator.is_quick(item_text, lexicon)
+        if not AllergyChecker.has_keywords(allergy_filter, lexicon):
+            raise KeyError(allergy_filter)
+        return bool(AllergyChecker.allergen_mask(item_text, lexicon) & AllergyChecker.filter_bit(allergy_filter))
+    
+    @staticmethod
+    def has_keywords(allergy_filter: AllergyFilter, lexicon=None) -> bool:
+        """Whether a filter is keyword-backed, i.e. has a bit in allergen_mask"""
+        if lexicon is None:
+            return allergy_filter in AllergyChecker.ALLERGY_KEYWORDS
+        return allergy_filter.name in lexicon.allergy_keywords
+    
+    @staticmethod
+    def allergen_mask(item_text: str, lexicon=None) -> int:
+        """Bitmask of every keyword-backed filter the item violates (see filter_bit)"""
+        if lexicon is None:
+            return AllergyChecker._compiled_mask()(item_text)
+        mask = AllergyChecker._lexicon_masks.get(lexicon)
+        if mask is None:
+            allergy_keywords = {AllergyFilter[name]: keywords for name, keywords in lexicon.allergy_keywords.items()}
+            mask = AllergyChecker._lexicon_masks[lexicon] = AllergyChecker._compile(
+                allergy_keywords, lexicon.allergy_matcher)[1]
+        return mask(item_text)
+    
+    @staticmethod
+    def use_lexicon(lexicon) -> None:
+        """Switch to a published Lexicon, reusing its precompiled matcher
+        
+        The keywords are published before the matcher compiled from them, and
+        _compiled_mask reads the matcher first, so a reader never pairs the
+        new matcher with old keywords.
+        """
+        allergy_keywords = {AllergyFilter[name]: list(keywords) for name, keywords in lexicon.allergy_keywords.items()}
+        compiled = AllergyChecker._compile(allergy_keywords, lexicon.allergy_matcher)
+        AllergyChecker.ALLERGY_KEYWORDS = allergy_keywords
+        AllergyChecker._compiled = compiled
     
     @staticmethod
-    def violates_filter(item_text: str, allergy_filter: AllergyFilter) -> bool:
-        """Check if an item violates an allergy filter"""
-        item_lower = item_text.lower()
-        keywords = AllergyChecker.ALLERGY_KEYWORDS[allergy_filter]
-        return any(keyword in item_lower for keyword in keywords)
+    def _compiled_mask():
+        """Memoized mask function over one matcher for every allergy keyword, recompiled on edits"""
+        compiled = AllergyChecker._compiled
+        allergy_keywords = AllergyChecker.ALLERGY_KEYWORDS
+        if compiled is None or compiled[0] != AllergyChecker._key(allergy_keywords):
+            compiled = AllergyChecker._compiled = AllergyChecker._compile(allergy_keywords)
+        return compiled[1]
+    
+    @staticmethod
+    def _key(allergy_keywords: Dict[AllergyFilter, List[str]]) -> Tuple:
+        return tuple(allergy_keywords), tuple(map(tuple, allergy_keywords.values()))
+    
+    @staticmethod
+    def _compile(allergy_keywords: Dict[AllergyFilter, List[str]], matcher: Optional[PhraseMatcher] = None) -> Tuple:
+        keyword_masks: Dict[str, int] = {}
+        for allergy_filter, keywords in allergy_keywords.items():
+            for keyword in keywords:
+                keyword_masks[keyword] = keyword_masks.get(keyword, 0) | _FILTER_BITS[allergy_filter]
+        matcher = matcher or PhraseMatcher(keyword_masks)
+        
+        @lru_cache(maxsize=16384)
+        def mask(item_text: str) -> int:
+            bits = 0
+            for keyword in matcher.match(item_text):
+                bits |= keyword_masks[keyword]
+            return bits
+        
+        return AllergyChecker._key(allergy_keywords), mask
+    
+    @staticmethod
+    def filter_bit(allergy_filter: AllergyFilter) -> int:
+        return _FILTER_BITS[allergy_filter]
     
     @staticmethod
     def get_safe_items(items: List[str], active_filters: List[AllergyFilter]) -> List[str]:
-        """Filter items that are safe given active allergy filters"""
-        safe_items = []
-        for item in items:
-            is_safe = True
-            for allergy_filter in active_filters:
-                if AllergyChecker.violates_filter(item, allergy_filter):
-                    is_safe = False
-                    break
-            if is_safe:
-                safe_items.append(item)
-        return safe_items
+        """Filter items that are safe given active allergy filters
+        
+        Each item is tokenized once into a KeywordIndex and the filters are
+        answered with bitset algebra over its posting lists.
+        """
+        if not active_filters:
+            return list(items)
+        from .keyword_index import KeywordIndex  # keyword_index builds on this module
+        index = KeywordIndex()
+        index.extend(items)
+        return index.safe_items(active_filters)
 
 class ScoreCalculator:
     """Handles scoring logic based on steering mode"""
     
-    @staticmethod
-    def calculate_final_score(health_score: int, taste_score: int, mode: SteeringMode) -> float:
+    # (health weight, taste weight) per mode
+    MODE_WEIGHTS = {
+        SteeringMode.ZEN: (0.8, 0.2),      # Zen Mode: 80% health, 20% taste
+        SteeringMode.GREMLIN: (0.1, 0.9),  # Gremlin Mode: 10% health, 90% taste
+    }
+    
+    @classmethod
+    def calculate_final_score(cls, health_score: int, taste_score: int, mode: SteeringMode) -> float:
         """Calculate final score based on steering mode weights"""
-        if mode == SteeringMode.ZEN:
-            # Zen Mode: 80% health, 20% taste
-            return (health_score * 0.8) + (taste_score * 0.2)
-        else:  # Gremlin Mode
-            # Gremlin Mode: 10% health, 90% taste
-            return (health_score * 0.1) + (taste_score * 0.9)
+        health_weight, taste_weight = cls.MODE_WEIGHTS[mode]
+        return (health_score * health_weight) + (taste_score * taste_weight)
     
     @staticmethod
     def get_mode_description(mode: SteeringMode) -> dict:
@@ -341,4 +502,8 @@ class MenuParser:
         price_match = re.search(r'\$(\d+(?:\.\d{2})?)', item_text)
         if price_match:
             return float(price_match.group(1))
-        return None
\ No newline at end of file
+        return None
+
+# Keyword tables follow the published lexicon, including hot reloads
+lexicons.subscribe(AllergyChecker.use_lexicon)
+lexicons.subscribe(PrepTimeEstimator.use_lexicon)
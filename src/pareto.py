@@ -0,0 +1,114 @@
+import math
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+# (health, taste, -price); a missing price is -inf, worse than any price
+Objectives = Tuple[float, float, float]
+
+def price_objective(price: Optional[float]) -> float:
+    """Price as a maximized objective; a missing (None or NaN) price is worst"""
+    return -math.inf if price is None or price != price else -price
+
+def objective_points(health: Iterable[float], taste: Iterable[float],
+                     prices: Iterable[Optional[float]]) -> List[Objectives]:
+    """Objective vectors from parallel score and price columns"""
+    return list(zip(health, taste, map(price_objective, prices)))
+
+def pareto_front(points: Sequence[Objectives]) -> List[int]:
+    """
+    Indices of the non-dominated points, in input order
+
+    A point is dominated when another is at least as good in every
+    coordinate and better in one. Points equal in every coordinate count
+    once, as their first index. Only the best third coordinate per
+    (first, second) pair can be on the front, so one dict pass reduces the
+    points to one per pair. Those are visited best-first, so a point can
+    only be dominated by one already visited; the visited front is kept as
+    a staircase over the second and third coordinates (second ascending,
+    third descending) and each query is one bisect, O(n log n) overall.
+    """
+    best: Dict[Tuple[float, float], int] = {}
+    for index, (first, second, third) in enumerate(points):
+        held = best.get((first, second))
+        if held is None or third > points[held][2]:
+            best[(first, second)] = index
+
+    seconds: List[float] = []
+    thirds: List[float] = []
+    front: List[int] = []
+    for index in sorted(best.values(), key=points.__getitem__, reverse=True):
+        _, second, third = points[index]
+        position = bisect_left(seconds, second)
+        # Best third among visited points with a second at least as good
+        if position < len(seconds) and thirds[position] >= third:
+            continue
+        front.append(index)
+
+        # Replace the steps this point now covers: lower seconds with lower thirds, and an equal second
+        start = position
+        while start and thirds[start - 1] <= third:
+            start -= 1
+        end = position + 1 if position < len(seconds) and seconds[position] == second else position
+        seconds[start:end] = [second]
+        thirds[start:end] = [third]
+
+    front.sort()
+    return front
+
+def knee_point(points: Sequence[Objectives], front: Sequence[int]) -> Optional[int]:
+    """
+    Front member with the best balance between the objectives
+
+    Coordinates are scaled to [0, 1] over the front (see scaled_front). The
+    knee is the member farthest beyond the plane through the three
+    single-objective extremes, i.e. the one giving up the least on any
+    objective. When the extremes do not span a plane, the member closest to
+    the ideal point (1, 1, 1) is used. Ties keep the earliest member.
+    """
+    if not front:
+        return None
+    scaled = scaled_front(points, front)
+
+    extremes = [scaled[max(front, key=lambda index: scaled[index][axis])] for axis in range(3)]
+    normal = _cross(_sub(extremes[1], extremes[0]), _sub(extremes[2], extremes[0]))
+    if max(map(abs, normal)) < 1e-12:
+        return min(front, key=lambda index: sum((1 - value) ** 2 for value in scaled[index]))
+    # Point the normal towards the ideal point
+    if _dot(normal, _sub((1.0, 1.0, 1.0), extremes[0])) < 0:
+        normal = tuple(-value for value in normal)
+    return max(front, key=lambda index: _dot(normal, _sub(scaled[index], extremes[0])))
+
+def closeness(point: Objectives, ideal: Objectives, worst: Objectives) -> float:
+    """
+    How close a point comes to the ideal, from 0 (the worst corner) to 1 (ideal)
+
+    Each coordinate is scaled to [0, 1] between `worst` and `ideal` (clamped;
+    -inf is 0, a coordinate whose bounds coincide is 1), and the Euclidean
+    distance to (1, 1, 1) is divided by its maximum.
+    """
+    scaled = [1.0 if high == low else 0.0 if value == -math.inf else min(1.0, max(0.0, (value - low) / (high - low)))
+              for value, high, low in zip(point, ideal, worst)]
+    return 1 - math.sqrt(sum((1 - value) ** 2 for value in scaled)) / math.sqrt(len(scaled))
+
+def scaled_front(points: Sequence[Objectives], front: Sequence[int]) -> Dict[int, Tuple[float, ...]]:
+    """Front members' coordinates scaled to [0, 1] over the front
+
+    1 is the best value on the front, -inf is 0, and a coordinate without
+    spread is 1.
+    """
+    return dict(zip(front, zip(*(_scale([points[index][axis] for index in front]) for axis in range(3)))))
+
+def _scale(values: List[float]) -> List[float]:
+    finite = [value for value in values if value != -math.inf]
+    low, high = (min(finite), max(finite)) if finite else (0.0, 0.0)
+    return [0.0 if value == -math.inf else (value - low) / (high - low) if high > low else 1.0
+            for value in values]
+
+def _sub(a: Sequence[float], b: Sequence[float]) -> Tuple[float, ...]:
+    return tuple(x - y for x, y in zip(a, b))
+
+def _dot(a: Sequence[float], b: Sequence[float]) -> float:
+    return sum(x * y for x, y in zip(a, b))
+
+def _cross(a: Sequence[float], b: Sequence[float]) -> Tuple[float, float, float]:
+    return (a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0])
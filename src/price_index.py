@@ -0,0 +1,129 @@
+import math
+from array import array
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from .keyword_index import bits_from_ids, iter_bits
+from .models import AllergyFilter, AllergyChecker, MenuParser, PrepTimeEstimator
+
+class SortedIndex:
+    """Item ids sorted by a numeric value, for O(log n) threshold lookups
+
+    A threshold resolves to a position by binary search. Items above it are
+    returned as a bitset built from precomputed suffix bitsets at evenly
+    spaced checkpoints, plus the few ids between the position and the next
+    checkpoint. Items with a zero, missing or NaN value are never above any
+    threshold.
+    """
+
+    def __init__(self, values: Sequence[Optional[float]], checkpoints: int = 64):
+        valued = sorted(
+            (value, item_id) for item_id, value in enumerate(values)
+            if value and not math.isnan(value)
+        )
+        self.size = len(values)
+        self.sorted_values = array('d', (value for value, _ in valued))
+        self.sorted_ids = array('Q', (item_id for _, item_id in valued))
+
+        # suffix[k] holds every id at sorted position >= k * step
+        self.step = max(1, -(-len(valued) // checkpoints))
+        self._suffix: List[int] = []
+        bits = 0
+        for start in reversed(range(0, len(valued), self.step)):
+            bits |= bits_from_ids(self.sorted_ids[start:start + self.step], self.size)
+            self._suffix.append(bits)
+        self._suffix.reverse()
+
+    def __len__(self) -> int:
+        return self.size
+
+    def position(self, limit: float) -> int:
+        """Sorted position of the first item valued above `limit`"""
+        return bisect_right(self.sorted_values, limit)
+
+    def count_above(self, limit: float) -> int:
+        return len(self.sorted_values) - self.position(limit)
+
+    def bits_above(self, limit: float) -> int:
+        """Bitset of item ids valued above `limit`"""
+        position = self.position(limit)
+        checkpoint = -(-position // self.step)
+        bits = self._suffix[checkpoint] if checkpoint < len(self._suffix) else 0
+        head = self.sorted_ids[position:checkpoint * self.step]
+        if len(head):
+            bits |= bits_from_ids(head, self.size)
+        return bits
+
+class PriceIndex(SortedIndex):
+    """SortedIndex over item prices; unpriced items are never over budget"""
+
+    over_budget_count = SortedIndex.count_above
+    over_budget_bits = SortedIndex.bits_above
+
+class ConstraintIndex:
+    """Per-menu allergen bitsets plus price and prep-time indexes, combined into safe sets
+
+    Built once per menu from prices, AllergyChecker.allergen_mask values and
+    PrepTimeEstimator minutes, then answers any combination of allergy
+    filters, the quick-service filter and a budget limit with bitset
+    algebra, matching the engine's _apply_constraints. IncrementalAnalyzer
+    keeps one for the menu it last saw, so the executive dashboard's
+    filter and slider changes on an unchanged menu are answered from it.
+    """
+
+    def __init__(self, prices: Sequence[Optional[float]], allergen_masks: Sequence[int],
+                 items: Optional[Sequence[str]] = None, prep_minutes: Optional[Sequence[int]] = None,
+                 lexicon=None):
+        self.size = len(prices)
+        self.items = items
+        self.lexicon = lexicon
+        self.prices = PriceIndex(prices)
+        if prep_minutes is None and items is not None:
+            prep_minutes = [PrepTimeEstimator.estimate_minutes(item, lexicon) for item in items]
+        self.prep_minutes = SortedIndex(prep_minutes) if prep_minutes is not None else None
+        self.all_bits = (1 << self.size) - 1
+        self._filter_bits: Dict[AllergyFilter, int] = {}
+        for allergy_filter in AllergyFilter:
+            if not AllergyChecker.has_keywords(allergy_filter, lexicon):
+                continue
+            bit = AllergyChecker.filter_bit(allergy_filter)
+            self._filter_bits[allergy_filter] = bits_from_ids(
+                (item_id for item_id, mask in enumerate(allergen_masks) if mask & bit), self.size)
+
+    @classmethod
+    def from_items(cls, items: Sequence[str]) -> 'ConstraintIndex':
+        """Extract prices, allergen masks and prep times once from raw item text"""
+        return cls([MenuParser.extract_price(item) for item in items],
+                   [AllergyChecker.allergen_mask(item) for item in items], items)
+
+    def violating_bits(self, allergy_filter: AllergyFilter) -> int:
+        if allergy_filter is AllergyFilter.QUICK and self.prep_minutes is not None:
+            return self.slower_than_bits(PrepTimeEstimator.QUICK_SERVICE_MINUTES)
+        if allergy_filter not in self._filter_bits:
+            # Filters without keyword lists need the item text
+            if self.items is None:
+                raise KeyError(allergy_filter)
+            self._filter_bits[allergy_filter] = bits_from_ids(
+                (item_id for item_id, item in enumerate(self.items)
+                 if AllergyChecker.violates_filter(item, allergy_filter, self.lexicon)), self.size)
+        return self._filter_bits[allergy_filter]
+
+    def slower_than_bits(self, minutes: float) -> int:
+        """Bitset of items estimated to take longer than `minutes` to prepare"""
+        if self.prep_minutes is None:
+            raise KeyError(AllergyFilter.QUICK)
+        return self.prep_minutes.bits_above(minutes)
+
+    def vetoed_bits(self, allergy_filters: Iterable[AllergyFilter], budget_limit: Optional[float] = None) -> int:
+        bits = 0
+        for allergy_filter in allergy_filters:
+            bits |= self.violating_bits(allergy_filter)
+        if budget_limit:
+            bits |= self.prices.over_budget_bits(budget_limit)
+        return bits
+
+    def safe_bits(self, allergy_filters: Iterable[AllergyFilter], budget_limit: Optional[float] = None) -> int:
+        return self.all_bits & ~self.vetoed_bits(allergy_filters, budget_limit)
+
+    def safe_ids(self, allergy_filters: Iterable[AllergyFilter], budget_limit: Optional[float] = None) -> List[int]:
+        return list(iter_bits(self.safe_bits(allergy_filters, budget_limit)))
@@ -0,0 +1,151 @@
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from .models import AllergyFilter
+
+class ResultCache:
+    """Multi-tier cache for full DecisionIntelligenceEngine.analyze_menu outputs
+
+    Tier 1 is an in-process LRU bounded by the pickled size of its entries.
+    Tier 2 is an optional SQLite file that every worker process on a host can
+    share. Entries are stored pickled, so callers always get a private copy
+    they are free to mutate.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, disk_path: Optional[str] = None,
+                 max_disk_entries: int = 100_000):
+        self.max_bytes = max_bytes
+        self.disk_path = disk_path
+        self.max_disk_entries = max_disk_entries
+
+        self._entries: 'OrderedDict[str, bytes]' = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_hits = 0
+        self.disk_writes = 0
+
+    @staticmethod
+    def normalize_menu(menu_text: str) -> str:
+        """Canonical menu text: stripped, non-empty, non-comment lines"""
+        lines = (line.strip() for line in menu_text.split('\n'))
+        return '\n'.join(line for line in lines if line and not line.startswith('#'))
+
+    @classmethod
+    def make_key(cls, menu_text: str, nutrition_focus: float, budget_focus: float,
+                 allergy_filters: List[AllergyFilter], budget_limit: Optional[float],
+                 lexicon_version: str) -> str:
+        """Cache key over the normalized menu and every input that changes the output"""
+        menu_hash = hashlib.sha256(cls.normalize_menu(menu_text).encode('utf-8')).hexdigest()
+        filters = ','.join(sorted(f.name for f in allergy_filters))
+        # Filter count is reported in the output, so duplicates are part of the key
+        parts = [menu_hash, repr(float(nutrition_focus)), repr(float(budget_focus)),
+                 f"{filters}#{len(allergy_filters)}", repr(budget_limit), lexicon_version]
+        return hashlib.sha256('|'.join(parts).encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a fresh copy of the cached analysis, or None"""
+        with self._lock:
+            blob = self._entries.get(key)
+            if blob is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        if blob is not None:
+            return pickle.loads(blob)
+
+        blob = self._disk_get(key)
+        with self._lock:
+            if blob is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.disk_hits += 1
+            self._memory_put(key, blob)
+        return pickle.loads(blob)
+
+    def put(self, key: str, analysis: Dict[str, Any]) -> None:
+        """Store an analysis in both tiers"""
+        blob = pickle.dumps(analysis, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._memory_put(key, blob)
+        self._disk_put(key, blob)
+
+    def clear(self) -> None:
+        """Drop the in-process tier (the shared disk tier is left alone)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'disk_hits': self.disk_hits,
+                'disk_writes': self.disk_writes,
+                'entries': len(self._entries),
+                'bytes': self._bytes
+            }
+
+    def _memory_put(self, key: str, blob: bytes) -> None:
+        if len(blob) > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= len(previous)
+        self._entries[key] = blob
+        self._bytes += len(blob)
+
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted)
+            self.evictions += 1
+
+    def _connection(self) -> Optional[sqlite3.Connection]:
+        """Per-process SQLite connection, reopened after a fork"""
+        if not self.disk_path:
+            return None
+        if self._conn is None or self._conn_pid != os.getpid():
+            conn = sqlite3.connect(self.disk_path, timeout=30, check_same_thread=False)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value BLOB, created REAL)')
+            conn.execute('CREATE INDEX IF NOT EXISTS results_created ON results (created)')
+            conn.commit()
+            self._conn = conn
+            self._conn_pid = os.getpid()
+        return self._conn
+
+    def _disk_get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return None
+            row = conn.execute('SELECT value FROM results WHERE key = ?', (key,)).fetchone()
+        return row[0] if row else None
+
+    def _disk_put(self, key: str, blob: bytes) -> None:
+        with self._lock:
+            conn = self._connection()
+            if conn is None:
+                return
+            with conn:
+                conn.execute('INSERT OR REPLACE INTO results (key, value, created) VALUES (?, ?, ?)',
+                             (key, blob, time.time()))
+                # Periodically keep the shared tier bounded by dropping the oldest entries
+                if self.disk_writes % 100 == 0:
+                    conn.execute('DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY created DESC '
+                                 'LIMIT -1 OFFSET ?)', (self.max_disk_entries,))
+            self.disk_writes += 1
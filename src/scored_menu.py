@@ -0,0 +1,229 @@
+import math
+import struct
+import sys
+from array import array
+from collections.abc import Mapping
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+SCORE_FIELDS = ('health', 'taste', 'premium', 'speed', 'satiety')
+
+# Serialized layout: header, the arrays in _array_layout() order, then UTF-8 text
+_HEADER = struct.Struct('<4sBQQ')
+_MAGIC = b'SMN1'
+
+class ScoredMenu:
+    """Columnar store of scored menu items
+
+    Scores live in one unsigned byte array per dimension, prices in a float
+    array (NaN when the item has no price) and the raw item text in a single
+    string buffer. Clean names are stored as offsets into that buffer. Items
+    are exposed to the UI as lazy, read-only dict-like views.
+    """
+
+    __slots__ = ('columns', 'prices', '_item_offsets', '_item_ends', '_name_starts', '_name_ends',
+                 '_parts', '_buffer')
+
+    def __init__(self):
+        self.columns: Dict[str, array] = {field: array('B') for field in SCORE_FIELDS}
+        self.prices = array('d')
+        self._item_offsets = array('Q', [0])
+        self._item_ends = array('Q')
+        self._name_starts = array('Q')
+        self._name_ends = array('Q')
+        self._parts: List[str] = []
+        self._buffer: Optional[str] = ''
+
+    def append(self, item: str, clean_name: str, price: Optional[float], scores: Sequence[int]) -> int:
+        """Add one scored item and return its index
+
+        `scores` follows SCORE_FIELDS order.
+        """
+        start = self._item_offsets[-1]
+        self._item_ends.append(start + len(item))
+        name_at = item.find(clean_name)
+        if name_at < 0:
+            # Names derived from the item are substrings of it; anything else is stored after it
+            name_at = len(item)
+            item = item + clean_name
+
+        self._parts.append(item)
+        self._buffer = None
+        self._item_offsets.append(start + len(item))
+        self._name_starts.append(start + name_at)
+        self._name_ends.append(start + name_at + len(clean_name))
+        self.prices.append(math.nan if price is None else price)
+        for column, score in zip(self.columns.values(), scores):
+            column.append(score)
+        return len(self._name_starts) - 1
+
+    def extend(self, rows: Iterable[Tuple[str, str, Optional[float], Sequence[int]]]) -> None:
+        for item, clean_name, price, scores in rows:
+            self.append(item, clean_name, price, scores)
+
+    def __len__(self) -> int:
+        return len(self._name_starts)
+
+    def __getitem__(self, index: int) -> 'ScoredItemView':
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return ScoredItemView(self, index)
+
+    def __iter__(self) -> Iterator['ScoredItemView']:
+        for index in range(len(self)):
+            yield ScoredItemView(self, index)
+
+    @property
+    def text(self) -> str:
+        """The shared text buffer, joined on first access after appends"""
+        if self._buffer is None:
+            self._buffer = ''.join(self._parts)
+            self._parts = [self._buffer]
+        return self._buffer
+
+    def item_text(self, index: int) -> str:
+        return self.text[self._item_offsets[index]:self._item_ends[index]]
+
+    def clean_name(self, index: int) -> str:
+        return self.text[self._name_starts[index]:self._name_ends[index]]
+
+    def price(self, index: int) -> Optional[float]:
+        price = self.prices[index]
+        return None if math.isnan(price) else price
+
+    def scores(self, index: int) -> Dict[str, int]:
+        return {field: column[index] for field, column in self.columns.items()}
+
+    def column(self, field: str) -> array:
+        return self.columns[field]
+
+    def weighted_scores(self, weights: Dict[str, float], constant: float = 0.0) -> List[float]:
+        """Column-wise linear score: constant + sum(weight * column) for every item"""
+        fields = [field for field, weight in weights.items() if weight]
+        if not fields:
+            return [constant] * len(self)
+        factors = [weights[field] for field in fields]
+        columns = [self.columns[field] for field in fields]
+
+        if len(fields) == 1:
+            factor = factors[0]
+            return [constant + factor * value for value in columns[0]]
+        return [constant + sum(f * v for f, v in zip(factors, row)) for row in zip(*columns)]
+
+    def argmax(self, values: Sequence[float]) -> Optional[int]:
+        """Index of the first maximum of `values` (None when empty)"""
+        if not values:
+            return None
+        return max(range(len(values)), key=values.__getitem__)
+
+    def take(self, indices: Iterable[int]) -> 'ScoredMenu':
+        """New ScoredMenu holding only the given items, in the given order"""
+        indices = list(indices)
+        subset = ScoredMenu()
+        text = self.text
+        item_offsets = self._item_offsets
+        parts = []
+        start = 0
+        for index in indices:
+            # Copy each item's segment (item text plus any stored name) and rebase its offsets
+            begin = item_offsets[index]
+            end = item_offsets[index + 1]
+            shift = start - begin
+            parts.append(text[begin:end])
+            subset._item_ends.append(self._item_ends[index] + shift)
+            subset._name_starts.append(self._name_starts[index] + shift)
+            subset._name_ends.append(self._name_ends[index] + shift)
+            start += end - begin
+            subset._item_offsets.append(start)
+        
+        subset.prices = array('d', [self.prices[index] for index in indices])
+        for field, column in self.columns.items():
+            subset.columns[field] = array('B', [column[index] for index in indices])
+        subset._parts = parts
+        subset._buffer = None
+        return subset
+
+    def to_records(self) -> List[Dict]:
+        """Materialize the legacy list-of-dicts shape"""
+        return [dict(view) for view in self]
+
+    def to_bytes(self) -> bytes:
+        """Compact binary form: raw array buffers followed by the text buffer"""
+        text = self.text.encode('utf-8')
+        parts = [_HEADER.pack(_MAGIC, sys.byteorder == 'little', len(self), len(text))]
+        parts.extend(a.tobytes() for a in self._array_layout())
+        parts.append(text)
+        return b''.join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'ScoredMenu':
+        magic, little_endian, count, text_length = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise ValueError("Not a serialized ScoredMenu")
+        menu = cls()
+        view = memoryview(data)
+        position = _HEADER.size
+        for a in menu._array_layout():
+            length = count + 1 if a is menu._item_offsets else count
+            del a[:]
+            end = position + a.itemsize * length
+            a.frombytes(view[position:end])
+            if bool(little_endian) != (sys.byteorder == 'little'):
+                a.byteswap()
+            position = end
+        menu._buffer = bytes(view[position:position + text_length]).decode('utf-8')
+        menu._parts = [menu._buffer]
+        return menu
+
+    def _array_layout(self) -> List[array]:
+        return [self.prices, self._item_offsets, self._item_ends, self._name_starts, self._name_ends,
+                *self.columns.values()]
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate payload size of the columnar storage"""
+        return sum(a.itemsize * len(a) for a in self._array_layout()) + len(self.text)
+
+class ScoredItemView(Mapping):
+    """Lazy dict-like view of one ScoredMenu row
+
+    Supports the keys of the legacy scored item dict: 'item', 'clean_name',
+    'price' and 'scores'. Values are materialized on access.
+    """
+
+    __slots__ = ('menu', 'index')
+
+    KEYS = ('item', 'clean_name', 'price', 'scores')
+
+    def __init__(self, menu: ScoredMenu, index: int):
+        self.menu = menu
+        self.index = index
+
+    def __getitem__(self, key: str):
+        if key == 'item':
+            return self.menu.item_text(self.index)
+        if key == 'clean_name':
+            return self.menu.clean_name(self.index)
+        if key == 'price':
+            return self.menu.price(self.index)
+        if key == 'scores':
+            return self.menu.scores(self.index)
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self.KEYS)
+
+    def __len__(self) -> int:
+        return len(self.KEYS)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, ScoredItemView):
+            return self.menu is other.menu and self.index == other.index
+        return Mapping.__eq__(self, other)
+
+    def __hash__(self) -> int:
+        return hash((id(self.menu), self.index))
+
+    def __repr__(self) -> str:
+        return f"ScoredItemView({dict(self)!r})"
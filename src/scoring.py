@@ -0,0 +1,158 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union
+
+from .tokens import PhraseMatcher
+
+Scores = Tuple[int, ...]
+
+@dataclass(frozen=True)
+class Dimension:
+    """Additive score: base plus a weight per matching keyword, clamped to [low, high]
+
+    Each (keywords, weight) term adds `weight` for every keyword found in the
+    text, so a keyword listed twice counts twice, as in the original loops.
+    Keywords match whole stemmed tokens (see tokens.PhraseMatcher).
+    """
+    name: str
+    base: int
+    terms: Tuple[Tuple[Tuple[str, ...], int], ...]
+    low: int = 1
+    high: int = 10
+
+@dataclass(frozen=True)
+class TieredDimension:
+    """First-match score: the value of the first tier with a keyword in the text, else default"""
+    name: str
+    tiers: Tuple[Tuple[Tuple[str, ...], int], ...]
+    default: int
+
+@dataclass(frozen=True)
+class LexiconProfile:
+    """Named set of scoring dimensions; scores come back in dimension order"""
+    name: str
+    dimensions: Tuple[Union[Dimension, TieredDimension], ...]
+
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        return tuple(dimension.name for dimension in self.dimensions)
+
+def additive(name: str, base: int, *terms: Tuple[Sequence[str], int], low: int = 1, high: int = 10) -> Dimension:
+    return Dimension(name, base, tuple((tuple(keywords), weight) for keywords, weight in terms), low, high)
+
+def tiered(name: str, *tiers: Tuple[Sequence[str], int], default: int) -> TieredDimension:
+    return TieredDimension(name, tuple((tuple(keywords), value) for keywords, value in tiers), default)
+
+class ScoringKernel:
+    """A LexiconProfile compiled for fast repeated scoring
+
+    Every distinct keyword across all dimensions goes into one PhraseMatcher,
+    so a text is tokenized once and matched in a single pass regardless of
+    lexicon size. Each hit applies its precomputed contributions, so keywords
+    shared between dimensions (e.g. 'salad' for health and lightness) cost
+    one lookup. Results are memoized per text in a bounded LRU cache, shared
+    by every caller of the same kernel.
+    """
+
+    def __init__(self, profile: LexiconProfile, cache_size: int = 4096):
+        self.profile = profile
+        self.fields = profile.fields
+        self._bases: List[int] = []
+        self._clamps: List[Optional[Tuple[int, int]]] = []
+        self._tiers: List[Tuple[int, Tuple[int, ...], int]] = []
+
+        contributions: Dict[str, Dict[int, int]] = {}
+        tier_bits: Dict[str, int] = {}
+        tier_count = 0
+        for index, dimension in enumerate(profile.dimensions):
+            if isinstance(dimension, TieredDimension):
+                self._bases.append(0)
+                self._clamps.append(None)
+                values = []
+                for keywords, value in dimension.tiers:
+                    for keyword in keywords:
+                        tier_bits[keyword] = tier_bits.get(keyword, 0) | (1 << tier_count)
+                    values.append(value)
+                    tier_count += 1
+                self._tiers.append((index, tuple(values), dimension.default))
+            else:
+                self._bases.append(dimension.base)
+                self._clamps.append((dimension.low, dimension.high))
+                for keywords, weight in dimension.terms:
+                    for keyword in keywords:
+                        per_dimension = contributions.setdefault(keyword, {})
+                        per_dimension[index] = per_dimension.get(index, 0) + weight
+
+        # Per distinct keyword: (additive contributions, tier bits)
+        self._effects = {
+            keyword: (tuple(contributions.get(keyword, {}).items()), tier_bits.get(keyword, 0))
+            for keyword in dict.fromkeys([*contributions, *tier_bits])
+        }
+        self._matcher = PhraseMatcher(self._effects)
+        self._tier_offsets = []
+        offset = 0
+        for _, values, _ in self._tiers:
+            self._tier_offsets.append(offset)
+            offset += len(values)
+        self._cache_size = cache_size
+        self.score = lru_cache(maxsize=cache_size)(self._score)
+
+    def __getstate__(self) -> Dict:
+        # The memo cache is per process and is rebuilt empty on load
+        state = dict(self.__dict__)
+        del state['score']
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self.score = lru_cache(maxsize=self._cache_size)(self._score)
+
+    def _score(self, item_lower: str) -> Scores:
+        """Scores in profile field order for lowercased item text"""
+        totals = list(self._bases)
+        tiers_hit = 0
+        effects = self._effects
+        for keyword in self._matcher.match(item_lower):
+            contributions, bits = effects[keyword]
+            for index, weight in contributions:
+                totals[index] += weight
+            tiers_hit |= bits
+
+        for index, clamp in enumerate(self._clamps):
+            if clamp is not None:
+                totals[index] = min(clamp[1], max(clamp[0], totals[index]))
+        for (index, values, default), offset in zip(self._tiers, self._tier_offsets):
+            hit = (tiers_hit >> offset) & ((1 << len(values)) - 1)
+            totals[index] = values[(hit & -hit).bit_length() - 1] if hit else default
+        return tuple(totals)
+
+    def score_item(self, item: str) -> Scores:
+        return self.score(item.lower())
+
+    def score_dict(self, item: str) -> Dict[str, int]:
+        return dict(zip(self.fields, self.score_item(item)))
+
+def engine_profile(lexicon: Mapping[str, Sequence[str]]) -> LexiconProfile:
+    """The engine's SCORE_FIELDS profile over (possibly edited) keyword lists"""
+    return LexiconProfile('engine', (
+        additive('health', 4, (lexicon['health_keywords'], 2)),
+        additive('taste', 4, (lexicon['taste_keywords'], 2)),
+        additive('premium', 3, (lexicon['premium_keywords'], 2)),
+        additive('speed', 5, (lexicon['speed_keywords'], 2)),
+        tiered('satiety', (lexicon['satiety_keywords'], 8), (lexicon['light_keywords'], 4), default=6),
+    ))
+
+_kernels: Dict[LexiconProfile, ScoringKernel] = {}
+
+def compile_profile(profile: LexiconProfile) -> ScoringKernel:
+    """Shared kernel for a profile; equal profiles share one kernel and its cache"""
+    kernel = _kernels.get(profile)
+    if kernel is None:
+        if len(_kernels) >= 32:
+            _kernels.clear()
+        kernel = _kernels[profile] = ScoringKernel(profile)
+    return kernel
+
+def register_kernel(kernel: ScoringKernel) -> ScoringKernel:
+    """Share an already compiled kernel (e.g. unpickled from an artifact) through compile_profile"""
+    return _kernels.setdefault(kernel.profile, kernel)
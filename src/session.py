@@ -0,0 +1,30 @@
+from typing import Any, Dict, MutableMapping
+
+MEAL_HISTORY_LIMIT = 10
+
+def default_health_profile() -> Dict[str, Any]:
+    """Health profile used before the user touches the sidebar"""
+    return {
+        'allergies': [],
+        'daily_calorie_limit': 2000,
+        'dietary_preference': 'None'
+    }
+
+def init_session_state(session_state: MutableMapping[str, Any]) -> None:
+    """Seed the session keys shared by the persona apps on the first run"""
+    if 'show_reasoning' not in session_state:
+        session_state['show_reasoning'] = False
+    if 'meal_history' not in session_state:
+        session_state['meal_history'] = []
+    if 'health_profile' not in session_state:
+        session_state['health_profile'] = default_health_profile()
+
+def record_meal(session_state: MutableMapping[str, Any], meal_record: Dict[str, Any],
+                limit: int = MEAL_HISTORY_LIMIT) -> None:
+    """Append a meal to the history, keeping only the last `limit` records"""
+    history = session_state['meal_history']
+    history.append(meal_record)
+    
+    # Trim in place so reruns don't allocate a fresh list each time
+    if len(history) > limit:
+        del history[:-limit]
@@ -0,0 +1,215 @@
+import io
+from collections import Counter
+from itertools import chain, islice
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+from .diversity import MMR_POOL
+from .lexicon import DETECT_LINES
+from .pareto import price_objective
+from .models import AllergyFilter, AllergyChecker
+from .scored_menu import ScoredMenu
+
+# (item, clean_name, price, scores) in SCORE_FIELDS order
+ScoredRow = Tuple[str, str, Optional[float], Tuple[int, ...]]
+
+class TopK:
+    """Bounded accumulator keeping the k best rows seen so far
+
+    Rows must be offered in input order; ties keep the earlier row, matching
+    the first-maximum rule of the in-memory pipeline. With `distinct=True`
+    only the best row per name is kept, so the winner after excluding any
+    k - 1 names is always retained.
+    """
+
+    __slots__ = ('k', 'distinct', 'entries')
+
+    def __init__(self, k: int, distinct: bool = False):
+        self.k = k
+        self.distinct = distinct
+        self.entries: List[Tuple[float, int, Hashable, Any]] = []
+
+    def offer(self, value: float, index: int, name: Hashable, row: Any) -> None:
+        entries = self.entries
+        if len(entries) == self.k and value <= entries[-1][0]:
+            # Cannot enter, and cannot improve a held name either (held values are all higher)
+            return
+        if self.distinct:
+            for position, (held_value, _, held_name, _) in enumerate(entries):
+                if held_name == name:
+                    if value > held_value:
+                        entries[position] = (value, index, name, row)
+                        self._sort()
+                    return
+        if len(entries) < self.k:
+            entries.append((value, index, name, row))
+            self._sort()
+        elif value > entries[-1][0]:
+            entries[-1] = (value, index, name, row)
+            self._sort()
+
+    def _sort(self) -> None:
+        self.entries.sort(key=lambda entry: (-entry[0], entry[1]))
+
+    def __iter__(self) -> Iterator[Tuple[int, Any]]:
+        for _, index, _, row in self.entries:
+            yield index, row
+
+class FrontCells:
+    """Cheapest row per (health, taste) pair, which holds every Pareto front member
+
+    Any other row in a pair is dominated by, or equal to, the cheapest one
+    (ties keep the earlier row), so the in-memory front over the kept rows
+    is the front of the whole stream. Memory is bounded by the number of
+    score pairs, not the number of rows.
+    """
+
+    __slots__ = ('cells',)
+
+    def __init__(self):
+        self.cells: Dict[Tuple[int, int], Tuple[float, int, Any]] = {}
+
+    def offer(self, index: int, row: ScoredRow) -> None:
+        health, taste = row[3][0], row[3][1]
+        value = price_objective(row[2])
+        held = self.cells.get((health, taste))
+        if held is None or value > held[0]:
+            self.cells[(health, taste)] = (value, index, row)
+
+    def __iter__(self) -> Iterator[Tuple[int, Any]]:
+        for _, index, row in self.cells.values():
+            yield index, row
+
+class VetoCounter:
+    """Counts vetoed items by reason and keeps only the first few in full"""
+
+    def __init__(self, sample_size: int = 100):
+        self.sample_size = sample_size
+        self.count = 0
+        self.reasons: Counter = Counter()
+        self.sample: List[Dict[str, Any]] = []
+
+    def add(self, clean_name: str, reasons: List[str]) -> None:
+        self.count += 1
+        # Budget reasons embed the price; count them under their fixed prefix
+        self.reasons.update(reason.partition(' ($')[0] for reason in reasons)
+        if len(self.sample) < self.sample_size:
+            self.sample.append({'item': clean_name, 'reasons': reasons})
+
+def iter_menu_lines(source) -> Iterator[str]:
+    """Stripped, non-empty, non-comment lines from text, a file object or any iterable of lines"""
+    if isinstance(source, str):
+        source = io.StringIO(source)
+    for line in source:
+        line = line.strip()
+        if line and not line.startswith('#'):
+            yield line
+
+def iter_safe_items(engine, items: Iterable[str], allergy_filters: List[AllergyFilter],
+                    budget_limit: Optional[float], vetoes: VetoCounter, lexicon=None) -> Iterator[str]:
+    """Yield items that pass the hard constraints, counting the rest"""
+    for item in items:
+        price = engine._extract_price(item) if budget_limit else None
+        veto_reasons = engine._veto_reasons(
+            allergy_filters, budget_limit, lambda f: AllergyChecker.violates_filter(item, f, lexicon), price)
+        if veto_reasons:
+            vetoes.add(engine._clean_item_name(item), veto_reasons)
+        else:
+            yield item
+
+def iter_scored_rows(engine, items: Iterable[str], lexicon=None) -> Iterator[ScoredRow]:
+    for item in items:
+        yield (item, *engine._score_line(item, lexicon))
+
+def select_candidates(rows: Iterable[ScoredRow], nutrition_focus: float,
+                      budget_focus: float) -> Tuple[ScoredMenu, int]:
+    """Reduce a scored stream to the rows any recommendation could pick
+
+    Returns the candidates as a ScoredMenu in input order, plus the number of
+    rows consumed. Running _generate_recommendations and _trade_offs on the
+    candidates gives the same picks and Pareto front as the whole menu.
+    """
+    health_weight = nutrition_focus / 100
+    taste_weight = 1 - health_weight
+    premium_weight = budget_focus / 100
+    economy_weight = 1 - premium_weight
+
+    first_rows: List[Tuple[int, ScoredRow]] = []
+    primary = TopK(1)
+    # The diversity pools of the alternatives (see src.diversity.shortlist)
+    health = TopK(MMR_POOL, distinct=True)
+    taste = TopK(MMR_POOL, distinct=True)
+    front = FrontCells()
+
+    count = 0
+    for index, row in enumerate(rows):
+        count += 1
+        # The first rows cover the small-menu path and the fallback pick
+        if index < 3:
+            first_rows.append((index, row))
+        health_score, taste_score, premium, _, satiety = row[3]
+        final_score = (
+            ((health_score * health_weight) + (taste_score * taste_weight)) * 0.7 +
+            ((premium * premium_weight) + ((10 - premium) * economy_weight)) * 0.2 +
+            satiety * 0.1
+        )
+        primary.offer(final_score, index, None, row)
+        health.offer(health_score, index, row[1], row)
+        taste.offer(taste_score, index, row[1], row)
+        front.offer(index, row)
+
+    candidates = dict(first_rows)
+    for accumulator in (primary, health, taste, front):
+        candidates.update(accumulator)
+
+    menu = ScoredMenu()
+    menu.extend(candidates[index] for index in sorted(candidates))
+    return menu, count
+
+def analyze_stream(engine, source, nutrition_focus: float, budget_focus: float,
+                   allergy_filters: List[AllergyFilter], budget_limit: Optional[float] = None,
+                   veto_sample: int = 100) -> Dict[str, Any]:
+    """Constant-memory analyze_menu over a stream of menu lines
+
+    Parsing, constraint filtering and scoring are chained generators feeding
+    bounded top-k accumulators and a veto counter. Recommendations match
+    analyze_menu; 'vetoed_items' holds the first `veto_sample` vetoes, with
+    the full count in 'vetoed_count' and per-reason counts in 'veto_reasons'.
+    """
+    vetoes = VetoCounter(veto_sample)
+    lines = iter_menu_lines(source)
+    # The locale is detected from the first lines, which are then replayed
+    head = list(islice(lines, DETECT_LINES))
+    lexicon = engine.menu_lexicon(head)
+    items = _Counted(chain(head, lines))
+    safe_items = iter_safe_items(engine, items, allergy_filters, budget_limit, vetoes, lexicon)
+    candidates, safe_count = select_candidates(iter_scored_rows(engine, safe_items, lexicon),
+                                               nutrition_focus, budget_focus)
+
+    if not items.count:
+        analysis = engine._empty_analysis()
+    elif not safe_count:
+        analysis = engine._no_safe_options(vetoes.sample, allergy_filters)
+        analysis['total_analyzed'] = items.count
+    else:
+        recommendations = engine._generate_recommendations(candidates, nutrition_focus, budget_focus)
+        analysis = engine._analysis_result(recommendations, vetoes.sample, items.count,
+                                           allergy_filters, nutrition_focus, budget_focus,
+                                           engine._trade_offs(candidates, recommendations, budget_focus))
+    analysis['vetoed_count'] = vetoes.count
+    analysis['veto_reasons'] = dict(vetoes.reasons)
+    return analysis
+
+class _Counted:
+    """Iterator wrapper that counts the items it yields"""
+
+    def __init__(self, iterable: Iterable):
+        self._iterator = iter(iterable)
+        self.count = 0
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        item = next(self._iterator)
+        self.count += 1
+        return item
@@ -0,0 +1,112 @@
+import re
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple
+
+# Bumped whenever tokenization or stemming changes, so derived caches are invalidated
+TOKENIZER_VERSION = 2
+
+# Letters and digits; hyphens, punctuation and "_" separate tokens ("Pan-Fried" -> pan, fried)
+TOKEN_PATTERN = re.compile(r'[^\W_]+')
+
+# (suffix, replacement), first applicable rule wins; stems keep at least 3 characters
+_SUFFIX_RULES = (
+    ('ies', 'y'),   # berries -> berry, fries -> fry
+    ('ied', 'y'),   # fried -> fry
+    ('ing', ''),    # roasting -> roast
+    ('ed', ''),     # grilled -> grill
+    ('sses', 'ss'),
+    ('shes', 'sh'),
+    ('ches', 'ch'),  # sandwiches -> sandwich
+    ('xes', 'x'),
+    ('s', ''),      # nuts -> nut
+)
+_KEEP_S = ('ss', 'us', 'is')
+_MIN_STEM = 3
+_VOWELS = 'aeiouy'
+# Doubled letters kept when a -y is dropped, as in "grilled" -> grill
+_KEEP_DOUBLE = 'lsz'
+
+def stem(token: str) -> str:
+    """Light suffix-stripping stemmer: plurals, -ed and -ing, then a trailing y or e
+
+    Keywords and menu text go through the same function, so stems only need
+    to be consistent, not real words: "grilled", "grill" and "grilling" all
+    become "grill", "cheese", "cheeses" and "cheesy" become "chees". A -y
+    after a consonant is dropped along with a doubled letter before it, so
+    adjectives meet their noun ("nutty" -> nut, "milky" -> milk).
+    """
+    for suffix, replacement in _SUFFIX_RULES:
+        if token.endswith(suffix) and len(token) - len(suffix) + len(replacement) >= _MIN_STEM:
+            if suffix == 's' and token.endswith(_KEEP_S):
+                break
+            token = token[:-len(suffix)] + replacement
+            break
+    if len(token) > _MIN_STEM:
+        if token.endswith('y') and token[-2] not in _VOWELS:
+            token = token[:-1]         # creamy -> cream, berry / berries -> berr
+            if token[-1] == token[-2] and token[-1] not in _KEEP_DOUBLE and len(token) > _MIN_STEM:
+                token = token[:-1]     # nutty -> nut, berr -> ber
+        elif token.endswith('y'):
+            token = token[:-1] + 'i'   # turkey -> turkei
+        elif token.endswith('e'):
+            token = token[:-1]         # bake / baked -> bak
+    elif token.endswith('y') and len(token) == _MIN_STEM:
+        token = token[:-1] + 'i'       # fry / fried / fries -> fri
+    return token
+
+# Menu vocabularies are small, so each distinct word is stemmed once per process
+_stems: Dict[str, str] = {}
+
+def _stem_new(token: str) -> str:
+    if len(_stems) > 65536:
+        _stems.clear()
+    stemmed = _stems[token] = stem(token)
+    return stemmed
+
+@lru_cache(maxsize=16384)
+def tokenize(text: str) -> Tuple[str, ...]:
+    """Stemmed lowercase tokens of a text, in order"""
+    stems = _stems
+    return tuple([stems[token] if token in stems else _stem_new(token)
+                  for token in TOKEN_PATTERN.findall(text.lower())])
+
+class PhraseMatcher:
+    """Finds which keyword phrases occur in a text as whole (stemmed) tokens
+
+    Single-word phrases are looked up in a token table and multi-word
+    phrases ("ice cream", "chicken breast") in an n-gram table, so matching
+    costs one pass over the text's tokens however many phrases there are.
+    "nut" matches "nuts" but not "donut" or "coconut".
+    """
+
+    def __init__(self, phrases: Iterable[str]):
+        self.phrases: List[str] = list(dict.fromkeys(phrases))
+        self._unigrams: Dict[str, List[str]] = {}
+        self._ngrams: Dict[Tuple[str, ...], List[str]] = {}
+        for phrase in self.phrases:
+            key = tokenize(phrase)
+            if len(key) == 1:
+                self._unigrams.setdefault(key[0], []).append(phrase)
+            elif key:
+                self._ngrams.setdefault(key, []).append(phrase)
+        self._lengths = sorted({len(key) for key in self._ngrams})
+        self._first_tokens: FrozenSet[str] = frozenset(key[0] for key in self._ngrams)
+
+    def match(self, text: str) -> Set[str]:
+        return self.match_tokens(tokenize(text))
+
+    def match_tokens(self, tokens: Tuple[str, ...]) -> Set[str]:
+        """Phrases present in an already tokenized text, each reported once"""
+        found: Set[str] = set()
+        unigrams = self._unigrams
+        for token in set(tokens).intersection(unigrams):
+            found.update(unigrams[token])
+        if self._lengths:
+            first_tokens, ngrams = self._first_tokens, self._ngrams
+            for position, token in enumerate(tokens):
+                if token in first_tokens:
+                    for length in self._lengths:
+                        phrases = ngrams.get(tokens[position:position + length])
+                        if phrases:
+                            found.update(phrases)
+        return found
@@ -2,7 +2,7 @@ import streamlit as st
 import plotly.graph_objects as go
 import plotly.express as px
 from typing import Dict, Any, List, Tuple
-from .models import AllergyFilter, DualAxisCalculator, DecisionIntelligence, RefereeChoice
+from .models import AllergyFilter, DualAxisCalculator, DecisionIntelligence, RefereeChoice, ScoreCalculator, SteeringMode
 
 class UIComponents:
     """Reusable UI components for the BiteBalance app"""
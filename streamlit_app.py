@@ -2,6 +2,8 @@ import streamlit as st
 import json
 from datetime import datetime
 from enum import Enum
+from src.instrumentation import TraceRecorder, NULL_TRACE
+from src.session import init_session_state, record_meal
 
 # Professional Referee Personas
 class RefereePersona(Enum):
@@ -10,6 +12,14 @@ class RefereePersona(Enum):
     BUDGET_ANALYST = "💰 The Budget Analyst"
     BALANCED_COACH = "⚖️ The Balanced Coach"
 
+# Health / taste / value weights applied by each persona
+PERSONA_WEIGHTS = {
+    RefereePersona.STRICT_DOCTOR: {'health': 0.8, 'taste': 0.1, 'value': 0.1},
+    RefereePersona.GOURMET_CRITIC: {'health': 0.1, 'taste': 0.8, 'value': 0.1},
+    RefereePersona.BUDGET_ANALYST: {'health': 0.3, 'taste': 0.2, 'value': 0.5},
+    RefereePersona.BALANCED_COACH: {'health': 0.4, 'taste': 0.4, 'value': 0.2}
+}
+
 # Page config for Vercel deployment
 st.set_page_config(
     page_title="BiteBalance - AI Food Referee",
@@ -19,16 +29,7 @@ st.set_page_config(
 )
 
 # Initialize session state
-if 'show_reasoning' not in st.session_state:
-    st.session_state.show_reasoning = False
-if 'meal_history' not in st.session_state:
-    st.session_state.meal_history = []
-if 'health_profile' not in st.session_state:
-    st.session_state.health_profile = {
-        'allergies': [],
-        'daily_calorie_limit': 2000,
-        'dietary_preference': 'None'
-    }
+init_session_state(st.session_state)
 
 # Professional CSS
 st.markdown("""
@@ -99,25 +100,36 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-def generate_reasoning_trace(food_input, persona, health_profile):
-    """Generate AI reasoning trace for transparency"""
+TRACE_ICONS = {
+    'Input Analysis': '🔍',
+    'Persona Weighting': '⚖️',
+    'Constraint Evaluation': '🧮',
+    'Final Selection': '✅'
+}
+
+def generate_reasoning_trace(trace):
+    """Format the events measured during analysis as reasoning trace steps"""
     
-    trace_steps = [
-        f"🔍 **Step 1: Input Analysis**\n   - Food requested: {food_input}\n   - Persona: {persona.value}\n   - Active constraints: {len(health_profile['allergies'])} allergies",
-        
-        f"🧮 **Step 2: Constraint Evaluation**\n   - Dietary preference: {health_profile['dietary_preference']}\n   - Calorie target: {health_profile['daily_calorie_limit']} cal/day\n   - Allergen screening: {'Active' if health_profile['allergies'] else 'None'}",
-        
-        f"⚖️ **Step 3: Persona Weighting**\n   - {persona.value} priorities applied\n   - Health vs Taste weighting calculated\n   - Budget considerations: {'High' if persona == RefereePersona.BUDGET_ANALYST else 'Standard'}",
-        
-        f"🎯 **Step 4: Option Generation**\n   - Generated 3 preparation variants\n   - Scored each option (Health/Taste/Value)\n   - Applied persona-specific ranking",
-        
-        f"✅ **Step 5: Final Selection**\n   - Winner selected based on weighted scores\n   - Confidence calculated: 85-95%\n   - Modifications suggested for optimization"
-    ]
+    trace_steps = []
+    for i, step in enumerate(trace.finish(), 1):
+        icon = TRACE_ICONS.get(step['title'], '🎯')
+        lines = [f"{icon} **Step {i}: {step['title']}**"]
+        for key, value in step['details'].items():
+            lines.append(f"   - {key.replace('_', ' ').capitalize()}: {value}")
+        lines.append(f"   - Elapsed: {step['seconds'] * 1000:.3f} ms")
+        trace_steps.append('\n'.join(lines))
     
     return trace_steps
 
-def analyze_food_with_persona(food_input, persona, health_profile):
-    """Analyze food with persona-specific logic"""
+def analyze_food_with_persona(food_input, persona, health_profile, trace=NULL_TRACE):
+    """Analyze food with persona-specific logic, recording each step on `trace`"""
+    
+    trace.step(
+        'Input Analysis',
+        food_requested=food_input,
+        persona=persona.value,
+        active_constraints=f"{len(health_profile['allergies'])} allergies"
+    )
     
     food_lower = food_input.lower()
     
@@ -196,22 +208,35 @@ def analyze_food_with_persona(food_input, persona, health_profile):
             }
         ]
     
+    trace.record('candidates_generated', len(base_options))
+    
     # Apply persona-specific weighting
+    weights = PERSONA_WEIGHTS[persona]
+    trace.step('Persona Weighting', weights=weights)
+    
     for option in base_options:
-        if persona == RefereePersona.STRICT_DOCTOR:
-            option['final_score'] = option['health_score'] * 0.8 + option['taste_score'] * 0.1 + option['value_score'] * 0.1
-        elif persona == RefereePersona.GOURMET_CRITIC:
-            option['final_score'] = option['health_score'] * 0.1 + option['taste_score'] * 0.8 + option['value_score'] * 0.1
-        elif persona == RefereePersona.BUDGET_ANALYST:
-            option['final_score'] = option['health_score'] * 0.3 + option['taste_score'] * 0.2 + option['value_score'] * 0.5
-        else:  # Balanced Coach
-            option['final_score'] = option['health_score'] * 0.4 + option['taste_score'] * 0.4 + option['value_score'] * 0.2
+        option['final_score'] = (
+            option['health_score'] * weights['health'] +
+            option['taste_score'] * weights['taste'] +
+            option['value_score'] * weights['value']
+        )
+    
+    if trace.enabled:
+        trace.record('option_scores', ', '.join(f"{option['name']} = {option['final_score']:.2f}" for option in base_options))
     
     # Sort by final score
     base_options.sort(key=lambda x: x['final_score'], reverse=True)
     
     # Filter based on health profile
+    trace.step(
+        'Constraint Evaluation',
+        dietary_preference=health_profile['dietary_preference'],
+        calorie_target=f"{health_profile['daily_calorie_limit']} cal/day",
+        candidates_in=len(base_options)
+    )
+    
     filtered_options = []
+    vetoes = []
     for option in base_options:
         is_valid = True
         
@@ -220,16 +245,38 @@ def analyze_food_with_persona(food_input, persona, health_profile):
         for allergy in health_profile['allergies']:
             if allergy.lower() in option_text:
                 is_valid = False
+                if trace.enabled:
+                    vetoes.append(f"{option['name']} ({allergy})")
                 break
         
         # Check dietary preferences
-        if health_profile['dietary_preference'] == 'Vegan' and any(word in option_text for word in ['cheese', 'meat', 'chicken', 'beef']):
+        if is_valid and health_profile['dietary_preference'] == 'Vegan' and any(word in option_text for word in ['cheese', 'meat', 'chicken', 'beef']):
             is_valid = False
+            if trace.enabled:
+                vetoes.append(f"{option['name']} (Vegan)")
         
         if is_valid:
             filtered_options.append(option)
     
-    return filtered_options[:3] if filtered_options else base_options[:3]
+    trace.record('candidates_remaining', len(filtered_options))
+    trace.record('vetoed', ', '.join(vetoes) or 'None')
+    
+    options = filtered_options[:3] if filtered_options else base_options[:3]
+    
+    trace.step(
+        'Final Selection',
+        winner=f"{options[0]['name']} ({options[0]['final_score']:.2f})",
+        fallback_to_unfiltered=not filtered_options
+    )
+    trace.record('confidence', f"{winner_confidence(options[0])}%")
+    # Close the last step here so its time excludes the UI rendering that follows
+    trace.finish()
+    
+    return options
+
+def winner_confidence(option):
+    """Confidence shown for the winning option"""
+    return min(95, int(option['final_score'] * 10 + 15))
 
 def render_sidebar():
     """Render the control tower sidebar"""
@@ -390,27 +437,30 @@ def main():
     # Process Analysis
     if analyze_button and food_input.strip():
         
+        # Analyze options, recording the reasoning trace only when enabled
+        trace = TraceRecorder() if show_reasoning else NULL_TRACE
+        with st.spinner(f"🤔 {selected_persona.value} is analyzing your options..."):
+            options = analyze_food_with_persona(food_input, selected_persona, st.session_state.health_profile, trace)
+        
+        winner = options[0]
+        confidence = winner_confidence(winner)
+        
         # Show reasoning trace if enabled
         if show_reasoning:
             st.markdown("### 🧠 AI Reasoning Trace")
             
-            reasoning_steps = generate_reasoning_trace(food_input, selected_persona, st.session_state.health_profile)
+            reasoning_steps = generate_reasoning_trace(trace)
             
             for i, step in enumerate(reasoning_steps, 1):
                 with st.expander(f"Step {i}: {step.split('**')[1].split('**')[0]}", expanded=i==1):
                     st.markdown(f'<div class="reasoning-trace">{step}</div>', unsafe_allow_html=True)
-        
-        # Analyze options
-        with st.spinner(f"🤔 {selected_persona.value} is analyzing your options..."):
-            options = analyze_food_with_persona(food_input, selected_persona, st.session_state.health_profile)
+            
+            st.caption(f"⏱️ Traced analysis time: {trace.total_seconds * 1000:.3f} ms")
         
         st.markdown("---")
         st.markdown(f"### 🏆 {selected_persona.value}'s Recommendation")
         
         # Winner Card
-        winner = options[0]
-        confidence = min(95, int(winner['final_score'] * 10 + 15))
-        
         st.markdown(f"""
         <div class="winner-card">
             <h3>🥇 OPTIMAL CHOICE</h3>
@@ -474,11 +524,8 @@ def main():
             'timestamp': datetime.now().isoformat()
         }
         
-        st.session_state.meal_history.append(meal_record)
-        
-        # Keep only last 10 records
-        if len(st.session_state.meal_history) > 10:
-            st.session_state.meal_history = st.session_state.meal_history[-10:]
+        # Keep only the most recent records
+        record_meal(st.session_state, meal_record)
     
     elif analyze_button and not food_input.strip():
         st.error("Please tell me what food you're considering!")
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Test script for the analyze_many batch API
+"""
+
+import json
+import os
+import tempfile
+
+from src.decision_engine import DecisionIntelligenceEngine
+from src.lexicon import LEXICON_PATH, LexiconRegistry, lexicons
+from src.menu_generator import SyntheticMenuGenerator
+from src.models import AllergyChecker, AllergyFilter, PrepTimeEstimator
+
+def names(analysis):
+    return [r.name for r in analysis['recommendations']]
+
+def test_analyze_many_matches_analyze_menu():
+    """Pool results match sequential analysis, in order or as completed"""
+    engine = DecisionIntelligenceEngine()
+    engine.health_keywords.append('tofu')  # workers must see the parent's lexicon
+    generator = SyntheticMenuGenerator(seed=7)
+    menus = [generator.generate(20) for _ in range(40)]
+    filters = [AllergyFilter.DAIRY]
+    expected = [names(engine.analyze_menu(menu, 65, 35, filters, 22.0)) for menu in menus]
+    
+    ordered = engine.analyze_many(menus, 65, 35, filters, 22.0, workers=2, chunksize=6)
+    assert [names(a) for a in ordered] == expected
+    
+    completed = dict(engine.analyze_many(iter(menus), 65, 35, filters, 22.0, workers=2, chunksize=6, ordered=False))
+    assert [names(completed[i]) for i in range(len(menus))] == expected
+
+def test_single_worker_runs_in_process():
+    """workers=1 analyzes in-process without starting a pool"""
+    engine = DecisionIntelligenceEngine()
+    results = list(engine.analyze_many(["Grilled Salmon - $20", "Veggie Wrap - $9"], 50, 50, [], workers=1, ordered=False))
+    assert [index for index, _ in results] == [0, 1]
+
+def test_workers_use_the_whole_lexicon():
+    """Allergy and prep-time tables of the engine's lexicon reach the workers too"""
+    with open(LEXICON_PATH, encoding='utf-8') as f:
+        data = json.load(f)
+    data['allergy']['VEGAN'].append('tofu')
+    data['prep_time']['slow']['tagine'] = 30
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'menu.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        custom = LexiconRegistry(path).active()
+    engine = DecisionIntelligenceEngine(locale='en')
+    engine.use_lexicon(custom)
+    AllergyChecker.use_lexicon(custom)
+    PrepTimeEstimator.use_lexicon(custom)
+    try:
+        menus = ["Tofu Bowl - $9\nQuick Chicken Wrap - $8\nLamb Tagine Wrap - $15"] * 4
+        filters = [AllergyFilter.VEGAN, AllergyFilter.QUICK]
+        expected = [engine.analyze_menu(menu, 50, 50, filters) for menu in menus]
+        assert [v['item'] for v in expected[0]['vetoed_items']] == ['Tofu Bowl', 'Quick Chicken Wrap', 'Lamb Tagine Wrap']
+        assert list(engine.analyze_many(menus, 50, 50, filters, workers=2, chunksize=1)) == expected
+    finally:
+        AllergyChecker.use_lexicon(lexicons.active())
+        PrepTimeEstimator.use_lexicon(lexicons.active())
+
+if __name__ == "__main__":
+    test_analyze_many_matches_analyze_menu()
+    test_single_worker_runs_in_process()
+    test_workers_use_the_whole_lexicon()
+    print("✅ Batch analysis tests passed!")
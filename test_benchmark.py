@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Test script for the BiteBalance benchmark suite, memory harness and synthetic menu generator
+"""
+
+import json
+
+from benchmark import run_benchmarks
+from profile_memory import run_profile
+from src.menu_generator import SyntheticMenuGenerator
+
+def test_generator_is_reproducible():
+    """Same seed, same menu; different seed, different menu"""
+    first = SyntheticMenuGenerator(seed=7).generate(200)
+    second = SyntheticMenuGenerator(seed=7).generate(200)
+    other = SyntheticMenuGenerator(seed=8).generate(200)
+    
+    assert first == second
+    assert first != other
+    
+    items = [line for line in first.split('\n') if not line.startswith('#')]
+    assert len(items) == 200
+    assert sum('$' in line for line in items) > 150
+
+def test_benchmark_report_is_json():
+    """The suite emits one result per size with every stage timed"""
+    report = run_benchmarks([10, 50], repeats=1)
+    decoded = json.loads(json.dumps(report))
+    
+    assert [result['size'] for result in decoded['results']] == [10, 50]
+    for result in decoded['results']:
+        assert set(result['stages']) == {'parse', 'constraints', 'scoring', 'recommendations', 'total'}
+        assert result['stages']['scoring']['items'] == result['safe_items']
+        assert result['safe_items'] + result['vetoed_items'] == result['size']
+
+def test_memory_profile_report():
+    """The harness reports per-item memory and a bounded session history"""
+    report = run_profile([100], reruns=50)
+    
+    engine = report['engine'][0]
+    assert engine['analyze_menu']['peak_bytes'] > 0
+    assert engine['stages']['scoring']['retained_bytes_per_item'] > 0
+    
+    checkpoints = report['session']['checkpoints']
+    assert checkpoints[-1]['rerun'] == 50
+    assert all(checkpoint['meal_history_len'] <= 10 for checkpoint in checkpoints)
+    json.dumps(report)
+
+if __name__ == "__main__":
+    test_generator_is_reproducible()
+    test_benchmark_report_is_json()
+    test_memory_profile_report()
+    print("✅ Benchmark tests passed!")
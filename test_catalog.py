@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Test script for the SQLite FTS5 dish catalog
+"""
+
+import pytest
+
+from src.catalog import DishCatalog
+from src.decision_engine import DecisionIntelligenceEngine
+from src.models import AllergyFilter
+
+DOWNTOWN = """1. Grilled Chicken Salad - $14 - greens, vegetables
+2. Grilled Cheese Sandwich - $9 - cheddar, bread
+3. Grilled Salmon - $26 - quinoa, vegetables
+4. Almond Crusted Grilled Trout - $18 - green beans"""
+
+AIRPORT = """1. Grilled Veggie Wrap - $11 - hummus, quick
+2. Bacon Burger - $15 - fried onions"""
+
+def build_catalog():
+    engine = DecisionIntelligenceEngine()
+    catalog = DishCatalog()
+    catalog.add_menu('downtown', DOWNTOWN, engine)
+    catalog.add_menu('airport', AIRPORT, engine)
+    return catalog
+
+def test_query_price_and_allergy_constraints():
+    """'grilled AND NOT cheese under $20, best health' with nut vetoes applied in SQL"""
+    catalog = build_catalog()
+    results = catalog.search('grilled AND NOT cheese', max_price=20,
+                             allergy_filters=[AllergyFilter.NUTS], order_by='health')
+    
+    assert [(r['menu'], r['clean_name']) for r in results] == [
+        ('downtown', 'Grilled Chicken Salad'), ('airport', 'Grilled Veggie Wrap')
+    ]
+    assert results[0]['scores']['health'] >= results[1]['scores']['health']
+
+def test_reindexing_a_menu_replaces_its_dishes():
+    engine = DecisionIntelligenceEngine()
+    catalog = build_catalog()
+    catalog.add_menu('airport', "Grilled Halloumi - $12", engine)
+    
+    assert len(catalog) == 5
+    assert [r['clean_name'] for r in catalog.search('grilled', menus=['airport'])] == ['Grilled Halloumi']
+    assert catalog.search('burger') == []
+    assert catalog.search(order_by='price', limit=1)[0]['clean_name'] == 'Grilled Cheese Sandwich'
+
+def test_relevance_needs_a_query():
+    catalog = build_catalog()
+    assert catalog.search('salmon', order_by='relevance')[0]['clean_name'] == 'Grilled Salmon'
+    with pytest.raises(ValueError, match="requires a query"):
+        catalog.search(order_by='relevance')
+
+def test_menus_are_indexed_with_their_locale():
+    """A Spanish menu gets the Spanish pack's scores and allergens"""
+    catalog = DishCatalog()
+    catalog.add_menu('madrid', """Ensalada de quinoa con verduras - $11
+Tarta de almendra casera - $7
+Pollo a la plancha con arroz - $13""", DecisionIntelligenceEngine())
+    
+    safe = catalog.search(allergy_filters=[AllergyFilter.NUTS], order_by='health')
+    assert [r['clean_name'] for r in safe] == ['Ensalada de quinoa con verduras', 'Pollo a la plancha con arroz']
+    assert safe[0]['scores']['health'] == 10
+
+if __name__ == "__main__":
+    test_query_price_and_allergy_constraints()
+    test_reindexing_a_menu_replaces_its_dishes()
+    test_relevance_needs_a_query()
+    test_menus_are_indexed_with_their_locale()
+    print("✅ Dish catalog tests passed!")
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Test script for diversity-aware (MMR) recommendation selection
+"""
+
+from src.decision_engine import DecisionIntelligenceEngine
+from src.diversity import SimilarityIndex, mmr_select, shortlist
+from src.menu_generator import SyntheticMenuGenerator
+from src.tokens import tokenize
+
+def index_for(names, vectors):
+    return SimilarityIndex(vectors, [frozenset(tokenize(name)) for name in names])
+
+def test_shortlist_keeps_first_best_per_name():
+    values = [5, 9, 9, 7, 9, 3]
+    names = ['a', 'b', 'c', 'b', 'b', 'd']
+    assert shortlist(values, names.__getitem__, 3) == [1, 2, 0]
+    assert shortlist(values, names.__getitem__, 10) == [1, 2, 0, 5]
+
+def test_similarity():
+    names = ["Grilled Salmon Salad", "Grilled Salmon Bowl", "Bacon Cheeseburger", "Plain Rice"]
+    index = index_for(names, [(9, 3, 5), (9, 3, 5), (2, 9, 4), (5, 5, 5)])
+    assert index.similarity(0, 0) == 1.0
+    assert index.similarity(0, 1) > 0.6
+    assert index.similarity(0, 2) == 0.0
+    assert index.similarity(1, 0) == index.similarity(0, 1)
+
+def test_mmr_prefers_different_dishes():
+    names = ["Grilled Salmon Salad", "Grilled Salmon Bowl", "Steamed Tofu Wrap", "Bacon Cheeseburger"]
+    vectors = [(9, 4, 5), (9, 4, 5), (8, 4, 6), (2, 9, 7)]
+    index = index_for(names, vectors)
+    health = [v[0] for v in vectors]
+    taste = [v[1] for v in vectors]
+    # The first pick is a plain argmax; the salmon variant loses to a slightly less healthy dish
+    assert mmr_select([health, health, taste], index, names) == [0, 2, 3]
+    # Without a penalty only names are excluded
+    assert mmr_select([health, health, taste], index, names, penalty=0) == [0, 1, 3]
+    # Nothing left with a new name
+    soups = ["Soup", "Soup"]
+    assert mmr_select([[5, 6], [5, 6]], index_for(soups, [(5,), (6,)]), soups) == [1, None]
+
+def test_engine_recommendations_are_diverse():
+    engine = DecisionIntelligenceEngine()
+    menu = "\n".join([
+        "Grilled Salmon Bowl - $17 - quinoa, vegetables, rice",
+        "Grilled Salmon Salad - $18 - quinoa, vegetables",
+        "Steamed Vegetable Dumplings - $12 - quinoa",
+        "Bacon Cheese Burger - $15 - fried onions",
+        "Plain Rice - $4",
+    ])
+    names = [r.name for r in engine.analyze_menu(menu, 90, 50, [])['recommendations']]
+    # Name exclusion alone would recommend the salmon salad next to the salmon bowl
+    assert names == ["Grilled Salmon Bowl", "Steamed Vegetable Dumplings", "Bacon Cheese Burger"]
+
+    # Streaming keeps the diversity pools and still matches
+    for seed in range(3):
+        menu = SyntheticMenuGenerator(seed=seed).generate(300)
+        expected = engine.analyze_menu(menu, 40, 60, [])['recommendations']
+        assert engine.analyze_stream(menu, 40, 60, [])['recommendations'] == expected
+
+if __name__ == "__main__":
+    test_shortlist_keeps_first_best_per_name()
+    test_similarity()
+    test_mmr_prefers_different_dishes()
+    test_engine_recommendations_are_diverse()
+    print("✅ Diversity selection tests passed!")
@@ -4,6 +4,8 @@ Test script for BiteBalance Executive Dashboard
 """
 
 from src.decision_engine import DecisionIntelligenceEngine
+from src.executive_dashboard import ExecutiveDashboard
+from src.incremental import IncrementalAnalyzer
 from src.models import AllergyFilter
 
 def test_executive_functionality():
@@ -25,62 +27,133 @@ def test_executive_functionality():
     6. Chocolate Lava Cake - $12 - Warm chocolate cake, vanilla bean ice cream, berry coulis
     """
     
-    # Test Health-Focused Analysis (Nutrition=20, Budget=50)
+    # Test Health-Focused Analysis (Nutrition=80, Budget=50)
     print("\n🧘‍♂️ Testing Health-Focused Analysis...")
     health_analysis = engine.analyze_menu(
         menu_text=test_menu,
-        nutrition_axis=20,  # Health focused
-        budget_axis=50,     # Mid-range budget
-        constraints=[],
-        time_constraint=False
+        nutrition_focus=80,  # Health focused
+        budget_focus=50,     # Mid-range budget
+        allergy_filters=[]
     )
     
-    print(f"Winner: {health_analysis['winner']['name']}")
-    print(f"Health Score: {health_analysis['winner']['health_score']}/10")
-    print(f"Confidence: {health_analysis['winner']['confidence']}%")
-    print(f"Reasoning: {health_analysis['reasoning'][:100]}...")
+    winner = health_analysis['recommendations'][0]
+    print(f"Winner: {winner.name}")
+    print(f"Health Score: {winner.metrics.health}/10")
+    print(f"Confidence: {winner.confidence}%")
+    print(f"Reasoning: {winner.reasoning[:100]}...")
+    assert len(health_analysis['recommendations']) == 3
     
-    # Test Indulgence-Focused Analysis (Nutrition=80, Budget=70)
+    # Test Indulgence-Focused Analysis (Nutrition=20, Budget=70)
     print("\n😈 Testing Indulgence-Focused Analysis...")
     indulgence_analysis = engine.analyze_menu(
         menu_text=test_menu,
-        nutrition_axis=80,  # Indulgence focused
-        budget_axis=70,     # Premium budget
-        constraints=[],
-        time_constraint=False
+        nutrition_focus=20,  # Indulgence focused
+        budget_focus=70,     # Premium budget
+        allergy_filters=[]
     )
     
-    print(f"Winner: {indulgence_analysis['winner']['name']}")
-    print(f"Taste Score: {indulgence_analysis['winner']['taste_score']}/10")
-    print(f"Confidence: {indulgence_analysis['winner']['confidence']}%")
-    print(f"Reasoning: {indulgence_analysis['reasoning'][:100]}...")
+    winner = indulgence_analysis['recommendations'][0]
+    print(f"Winner: {winner.name}")
+    print(f"Taste Score: {winner.metrics.taste}/10")
+    print(f"Confidence: {winner.confidence}%")
+    print(f"Reasoning: {winner.reasoning[:100]}...")
     
     # Test Constraint Enforcement
     print("\n🛡️ Testing Constraint Enforcement...")
     constrained_analysis = engine.analyze_menu(
         menu_text=test_menu,
-        nutrition_axis=50,
-        budget_axis=50,
-        constraints=[AllergyFilter.DAIRY],  # No dairy
-        time_constraint=False
+        nutrition_focus=50,
+        budget_focus=50,
+        allergy_filters=[AllergyFilter.DAIRY]  # No dairy
     )
     
-    print(f"Winner: {constrained_analysis['winner']['name']}")
+    print(f"Winner: {constrained_analysis['recommendations'][0].name}")
     print(f"Vetoed Items: {len(constrained_analysis['vetoed_items'])}")
     if constrained_analysis['vetoed_items']:
-        print(f"First Veto: {constrained_analysis['vetoed_items'][0]} - {constrained_analysis['veto_reasons'][0]}")
+        first_veto = constrained_analysis['vetoed_items'][0]
+        print(f"First Veto: {first_veto['item']} - {first_veto['reasons'][0]}")
+    assert any(veto['item'] == 'Chocolate Lava Cake' for veto in constrained_analysis['vetoed_items'])
     
     # Test Decision Intelligence Metrics
     print("\n📊 Decision Intelligence Metrics:")
-    print(f"Total Options: {health_analysis['total_options']}")
-    print(f"Safe Options: {health_analysis['safe_options']}")
-    print(f"Risk Level: {health_analysis['risk_level']}")
-    print(f"Alignment Score: {health_analysis['alignment_score']}%")
+    print(f"Total Options: {health_analysis['total_analyzed']}")
+    print(f"Constraints Applied: {constrained_analysis['constraints_applied']}")
     
     print("\n✅ Executive Dashboard Test Completed Successfully!")
     print("\n🚀 Ready for National Stage Competition!")
+
+def test_stage_timings():
+    """Per-stage timings are returned on request and forwarded to the hook"""
+    forwarded = []
+    engine = DecisionIntelligenceEngine(timing_hook=forwarded.append)
+    
+    menu = "Grilled Salmon - $22\nBacon Cheeseburger - $16\nPeanut Noodles - $12\nGarden Salad - $9"
+    analysis = engine.analyze_menu(menu, 50, 50, [AllergyFilter.NUTS], collect_timings=True)
+    
+    timings = analysis['timings']
+    assert list(timings) == ['parse', 'constraints', 'scoring', 'recommendations', 'total']
+    assert timings['constraints']['items_in'] == 4
+    assert timings['constraints']['items_out'] == 3
+    assert all(stage['seconds'] >= 0 for stage in timings.values())
+    assert forwarded == [timings]
+    
+    # Without collect_timings the hook still fires but the result stays unchanged
+    assert 'timings' not in engine.analyze_menu(menu, 50, 50, [])
+    assert len(forwarded) == 2
+
+def test_recommendation_text_is_lazy():
+    """Trade-off and reasoning prose is only formatted when read"""
+    engine = DecisionIntelligenceEngine()
+    menu = "Grilled Salmon - $22\nBacon Cheeseburger - $16\nGarden Salad - $9"
+    primary = engine.analyze_menu(menu, 90, 50, [])['recommendations'][0]
     
-    return True
+    assert primary._reasoning is None and primary._trade_off_summary is None
+    assert primary.reasoning.startswith("Optimal alignment with your preferences")
+    assert primary.trade_off_summary.startswith("Prioritized health")
+    assert primary._reasoning is not None
+    assert not hasattr(primary, '__dict__')
+
+def test_dashboard_decisions_from_engine():
+    """The dashboard page renders from the engine's result shape, quick-service filter included"""
+    engine = DecisionIntelligenceEngine()
+    menu = """Grilled Salmon - $22 - slow roasted
+Garden Salad - $9 - fresh greens
+Walnut Brownie - $7
+Quick Tomato Soup - $6"""
+    filters = [AllergyFilter.NUTS, AllergyFilter.QUICK]
+    decisions = ExecutiveDashboard.build_decisions(engine.analyze_menu(menu, 70, 50, filters), filters)
+    
+    card_fields = {'name', 'description', 'health_score', 'taste_score', 'confidence'}
+    for card in ('winner', 'alternative', 'compromise'):
+        assert card_fields <= decisions[card].keys()
+    assert decisions['vetoed_items'] == ['Grilled Salmon', 'Walnut Brownie']
+    assert len(decisions['veto_reasons']) == 2
+    assert (decisions['total_options'], decisions['safe_options']) == (4, 2)
+    assert decisions['active_constraints'] == [f.value for f in filters]
+    assert decisions['risk_level'].startswith("Medium")
+    assert {'sacrificed', 'gained'} == decisions['trade_offs'].keys()
+    assert 0 <= decisions['alignment_score'] <= 100
+    
+    # Nothing left to recommend still renders
+    vetoed = ExecutiveDashboard.build_decisions(engine.analyze_menu("Walnut Brownie - $7", 50, 50, filters), filters)
+    assert vetoed['winner']['name'] == 'No suitable option' and vetoed['risk_level'].startswith("High")
+
+def test_dashboard_filters_use_constraint_index():
+    """Re-running the dashboard's menu with other filters is answered by the session's ConstraintIndex"""
+    engine = DecisionIntelligenceEngine()
+    analyzer = IncrementalAnalyzer(engine)
+    menu = """Grilled Salmon - $22 - slow roasted
+Garden Salad - $9 - fresh greens
+Walnut Brownie - $7
+Milk Pudding - $5"""
+    analyzer.analyze(menu, 50, 50, [])
+    for filters in ([AllergyFilter.NUTS], [AllergyFilter.DAIRY, AllergyFilter.QUICK], []):
+        assert analyzer.analyze(menu, 30, 60, filters) == engine.analyze_menu(menu, 30, 60, filters)
+        assert analyzer._constraints is not None
 
 if __name__ == "__main__":
-    test_executive_functionality()
\ No newline at end of file
+    test_executive_functionality()
+    test_stage_timings()
+    test_recommendation_text_is_lazy()
+    test_dashboard_decisions_from_engine()
+    test_dashboard_filters_use_constraint_index()
@@ -0,0 +1,36 @@
+#!/usr/bin/env python3
+"""
+Test script for menu line fingerprinting and deduplicated scoring
+"""
+
+from src.decision_engine import DecisionIntelligenceEngine
+from src.fingerprint import FingerprintMemo, canonicalize, fingerprint
+
+def test_canonical_form_ignores_numbering_spacing_case_and_price():
+    variants = [
+        "1. Grilled Salmon - $22 - quinoa,  vegetables",
+        "14) grilled salmon - $24.50 - Quinoa, vegetables",
+        "- GRILLED SALMON - $19 - quinoa, vegetables"
+    ]
+    assert len({fingerprint(canonicalize(line)) for line in variants}) == 1
+    assert canonicalize("2. Fish Tacos") != canonicalize("2. Fish Tacos with slaw")
+
+def test_duplicates_scored_once():
+    """Each unique dish is scored once; names and prices stay per line"""
+    engine = DecisionIntelligenceEngine()
+    calls = []
+    memo = FingerprintMemo(lambda canonical: calls.append(canonical) or engine._score_text(canonical))
+    lines = ["1. Bacon Cheeseburger - $15", "7. bacon  cheeseburger - $17", "Caesar Salad - $12"]
+    scores = [memo(line) for line in lines]
+    
+    assert len(calls) == 2 and memo.duplicates == 1
+    assert scores[0] == scores[1] == engine._score_text("bacon cheeseburger - $15")
+    
+    scored = engine._score_items(lines)
+    assert [view['price'] for view in scored] == [15.0, 17.0, 12.0]
+    assert scored[1]['clean_name'] == "bacon  cheeseburger"
+
+if __name__ == "__main__":
+    test_canonical_form_ignores_numbering_spacing_case_and_price()
+    test_duplicates_scored_once()
+    print("✅ Fingerprint tests passed!")
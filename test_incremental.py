@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Test script for incremental menu re-analysis
+"""
+
+from src.decision_engine import DecisionIntelligenceEngine
+from src.incremental import IncrementalAnalyzer
+from src.menu_generator import SyntheticMenuGenerator
+from src.models import AllergyFilter
+
+def summarize(analysis):
+    summary = dict(analysis)
+    summary['recommendations'] = [(r.name, r.scores, r.confidence, r.reasoning) for r in analysis['recommendations']]
+    return summary
+
+def test_edits_match_full_analysis():
+    """Line edits re-score only changed lines and give the full-run output"""
+    engine = DecisionIntelligenceEngine()
+    analyzer = IncrementalAnalyzer(engine)
+    lines = SyntheticMenuGenerator(seed=3).generate_lines(200)
+    filters = [AllergyFilter.NUTS, AllergyFilter.DAIRY]
+    
+    analyzer.analyze('\n'.join(lines), 60, 40, filters, 25.0)
+    lines[10] = "Grilled Salmon Salad - $12 - quinoa, vegetables"
+    del lines[50]
+    lines.insert(0, "Bacon Cheeseburger - $15 - fried onions")
+    menu_text = '\n'.join(lines)
+    
+    result = analyzer.analyze(menu_text, 60, 40, filters, 25.0)
+    assert analyzer.rescored <= 2
+    assert analyzer.reused == len(engine._parse_menu(menu_text)) - 2
+    assert summarize(result) == summarize(engine.analyze_menu(menu_text, 60, 40, filters, 25.0))
+
+def test_lexicon_change_rescores_everything():
+    """Editing a keyword list drops the per-line cache"""
+    engine = DecisionIntelligenceEngine()
+    analyzer = IncrementalAnalyzer(engine)
+    menu_text = "Chickpea Bowl - $11\nVeggie Wrap - $9"
+    analyzer.analyze(menu_text, 50, 50, [])
+    
+    engine.health_keywords.append('chickpea')
+    result = analyzer.analyze(menu_text, 90, 50, [])
+    assert analyzer.reused == 0
+    assert result['recommendations'][0].name == "Chickpea Bowl"
+
+if __name__ == "__main__":
+    test_edits_match_full_analysis()
+    test_lexicon_change_rescores_everything()
+    print("✅ Incremental analysis tests passed!")
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Test script for memory-mapped menu ingestion
+"""
+
+import os
+import pathlib
+import tempfile
+
+from src.decision_engine import DecisionIntelligenceEngine
+from src.ingest import MappedMenuFile, menu_files
+from src.menu_generator import SyntheticMenuGenerator
+from src.models import AllergyFilter
+
+def write(directory, name, text):
+    path = os.path.join(directory, name)
+    with open(path, 'w', newline='') as f:
+        f.write(text)
+    return path
+
+def test_mapped_lines_and_offsets():
+    """Block iteration and the offset index agree with str.split"""
+    with tempfile.TemporaryDirectory() as tmp:
+        text = "# Mains\r\n1. Grilled Salmon - $20\n\n  Veggie Wrap - $9  \nSoup - $6"
+        path = write(tmp, 'menu.txt', text)
+        
+        with MappedMenuFile(path) as menu_file:
+            menu_file.BLOCK_SIZE = 8  # force lines to span blocks
+            assert list(menu_file) == text.split('\n')
+            assert [menu_file[i] for i in range(len(menu_file))] == text.split('\n')
+            assert menu_file[-1] == "Soup - $6"
+            assert list(menu_file.iter_items()) == DecisionIntelligenceEngine()._parse_menu(text)
+        
+        with MappedMenuFile(write(tmp, 'empty.txt', '')) as empty:
+            assert len(empty) == 0 and list(empty) == []
+
+def test_analyze_directory_in_parallel():
+    """Each file in a directory is analyzed like its text would be"""
+    engine = DecisionIntelligenceEngine()
+    with tempfile.TemporaryDirectory() as tmp:
+        for seed in range(3):
+            write(tmp, f"supplier_{seed}.txt", SyntheticMenuGenerator(seed=seed).generate(150))
+        write(tmp, 'notes.md', "not a menu")
+        
+        paths = menu_files(tmp)
+        results = list(engine.analyze_files(tmp, 60, 40, [AllergyFilter.NUTS], workers=2))
+        
+        assert [r['source'] for r in results] == paths
+        for result in results:
+            with open(result['source']) as f:
+                expected = engine.analyze_menu(f.read(), 60, 40, [AllergyFilter.NUTS])
+            assert [r.name for r in result['recommendations']] == [r.name for r in expected['recommendations']]
+
+def test_analyze_single_file():
+    """A file path given as str or Path is one menu, not a sequence of paths"""
+    engine = DecisionIntelligenceEngine()
+    with tempfile.TemporaryDirectory() as tmp:
+        text = SyntheticMenuGenerator(seed=4).generate(60)
+        path = write(tmp, 'menu.txt', text)
+        expected = engine.analyze_menu(text, 50, 50, [])
+        
+        for source in (path, pathlib.Path(path)):
+            results = list(engine.analyze_files(source, 50, 50, [], workers=1))
+            assert [r['source'] for r in results] == [source]
+            assert results[0]['recommendations'] == expected['recommendations']
+
+if __name__ == "__main__":
+    test_mapped_lines_and_offsets()
+    test_analyze_directory_in_parallel()
+    test_analyze_single_file()
+    print("✅ Ingestion tests passed!")
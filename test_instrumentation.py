@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Test script for BiteBalance pipeline instrumentation
+"""
+
+from app_professional import RefereePersona, analyze_food_with_persona
+from src.instrumentation import TraceRecorder, NULL_TRACE
+
+def test_trace_recorder_measures_steps():
+    """Each step keeps its details and elapsed time, in order"""
+    trace = TraceRecorder()
+    
+    trace.step('Input Analysis', food_requested='burger')
+    trace.record('candidates_generated', 3)
+    trace.step('Final Selection', winner='Turkey Burger')
+    steps = trace.finish()
+    
+    assert [step['title'] for step in steps] == ['Input Analysis', 'Final Selection']
+    assert steps[0]['details'] == {'food_requested': 'burger', 'candidates_generated': 3}
+    assert all(step['seconds'] >= 0 for step in steps)
+    assert trace.total_seconds == sum(step['seconds'] for step in steps)
+
+def test_null_trace_records_nothing():
+    """The disabled recorder accepts the same calls and keeps no state"""
+    NULL_TRACE.step('Input Analysis', food_requested='pizza')
+    NULL_TRACE.record('candidates_generated', 3)
+    
+    assert not NULL_TRACE.enabled
+    assert NULL_TRACE.finish() == []
+
+def test_analysis_closes_its_trace():
+    """The final step is closed before the caller renders anything"""
+    trace = TraceRecorder()
+    profile = {'allergies': [], 'daily_calorie_limit': 2000, 'dietary_preference': 'None'}
+    analyze_food_with_persona('burger', RefereePersona.STRICT_DOCTOR, profile, trace)
+    
+    assert trace.steps[-1]['title'] == 'Final Selection'
+    assert trace.steps[-1]['details']['confidence'].endswith('%')
+    assert trace.finish() == trace.steps
+
+if __name__ == "__main__":
+    test_trace_recorder_measures_steps()
+    test_null_trace_records_nothing()
+    test_analysis_closes_its_trace()
+    print("✅ Instrumentation tests passed!")
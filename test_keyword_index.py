@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Test script for the inverted keyword index
+"""
+
+from src.keyword_index import KeywordIndex, bits_from_ids, iter_bits
+from src.menu_generator import SyntheticMenuGenerator
+from src.models import AllergyChecker, AllergyFilter
+
+def scan_safe_items(items, filters):
+    """Reference answer: every item checked against every filter"""
+    return [item for item in items if not any(AllergyChecker.violates_filter(item, f) for f in filters)]
+
+def test_bitset_helpers():
+    bits = bits_from_ids([0, 3, 64, 1000], 1001)
+    assert list(iter_bits(bits)) == [0, 3, 64, 1000]
+    assert list(iter_bits(0)) == []
+
+def test_safe_items_match_allergy_checker():
+    """Set algebra over posting lists gives the per-item scan's answer, incrementally"""
+    items = SyntheticMenuGenerator(seed=8).generate_lines(2000)
+    index = KeywordIndex()
+    index.extend(items[:1500])
+    for item in items[1500:]:
+        index.add(item)
+    
+    for filters in ([AllergyFilter.NUTS, AllergyFilter.DAIRY], [AllergyFilter.VEGAN],
+                    [AllergyFilter.QUICK, AllergyFilter.GLUTEN], []):
+        assert index.safe_items(filters) == scan_safe_items(items, filters)
+        assert AllergyChecker.get_safe_items(items, filters) == scan_safe_items(items, filters)
+    
+    index.remove(0)
+    index.add("Peanut Noodles - $11")
+    remaining = items[1:] + ["Peanut Noodles - $11"]
+    assert len(index) == len(remaining)
+    assert index.safe_items([AllergyFilter.NUTS]) == scan_safe_items(remaining, [AllergyFilter.NUTS])
+    assert index.safe_items([AllergyFilter.QUICK]) == scan_safe_items(remaining, [AllergyFilter.QUICK])
+
+def test_quick_service_filter():
+    index = KeywordIndex()
+    index.extend(["Quick Salad - $8", "Slow Braised Short Rib - $30"])
+    assert index.safe_items([AllergyFilter.QUICK]) == ["Quick Salad - $8"]
+    assert AllergyChecker.get_safe_items(index.items, [AllergyFilter.QUICK]) == ["Quick Salad - $8"]
+    # Items added after the first QUICK query keep the prep-time posting list current
+    index.add("Quick Braised Wrap - 45 min")
+    assert index.safe_items([AllergyFilter.QUICK]) == ["Quick Salad - $8"]
+
+def test_unindexed_keyword_is_indexed_on_demand():
+    index = KeywordIndex(keywords=['cheese'])
+    index.extend(["Tofu Bowl", "Mac and Cheese", "tofu scramble"])
+    assert list(iter_bits(index.posting('tofu'))) == [0, 2]
+    assert list(iter_bits(index.matching_any(['tofu', 'cheese']))) == [0, 1, 2]
+
+if __name__ == "__main__":
+    test_bitset_helpers()
+    test_safe_items_match_allergy_checker()
+    test_quick_service_filter()
+    test_unindexed_keyword_is_indexed_on_demand()
+    print("✅ Keyword index tests passed!")
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Test script for versioned lexicon data, compiled artifacts and hot reload
+"""
+
+import json
+import os
+import tempfile
+
+from src.decision_engine import DecisionIntelligenceEngine
+from src.lexicon import LEXICON_PATH, LexiconRegistry, lexicons
+from src.models import AllergyChecker, AllergyFilter, PrepTimeEstimator
+
+def write_lexicon(path, edit=None):
+    with open(LEXICON_PATH, encoding='utf-8') as f:
+        data = json.load(f)
+    if edit:
+        edit(data)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f)
+
+def test_default_lexicon_is_active():
+    active = lexicons.active()
+    assert isinstance(active.version, int)
+    assert DecisionIntelligenceEngine().lexicon() == {
+        name: list(keywords) for name, keywords in active.engine_keywords.items()}
+    assert AllergyChecker.ALLERGY_KEYWORDS[AllergyFilter.NUTS] == list(active.allergy_keywords['NUTS'])
+    assert PrepTimeEstimator.FAST_KEYWORDS == active.prep_fast
+
+def test_artifact_is_reused_until_data_changes():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'menu.json')
+        write_lexicon(path)
+        first = LexiconRegistry(path)
+        first.active()
+        assert (first.compiles, os.path.exists(first.artifact_path)) == (1, True)
+
+        # A fresh process loads the compiled artifact instead of compiling
+        second = LexiconRegistry(path)
+        assert second.active().digest == first.active().digest
+        assert second.compiles == 0
+        assert second.kernel('engine').score('grilled salmon') == first.kernel('engine').score('grilled salmon')
+
+        # A stale artifact is ignored and replaced
+        write_lexicon(path, lambda data: data['engine']['health_keywords'].append('tofu'))
+        third = LexiconRegistry(path)
+        assert 'tofu' in third.active().engine_keywords['health_keywords']
+        assert third.compiles == 1
+
+def test_hot_reload_swaps_atomically():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'menu.json')
+        write_lexicon(path)
+        registry = LexiconRegistry(path)
+        engine = DecisionIntelligenceEngine()
+        registry.follow(engine)
+        registry.subscribe(AllergyChecker.use_lexicon)
+        try:
+            old = registry.active()
+            assert not registry.reload_if_changed()
+            assert not AllergyChecker.violates_filter("Tofu Bowl - $9", AllergyFilter.VEGAN)
+
+            def edit(data):
+                data['engine']['health_keywords'].append('tofu')
+                data['allergy']['VEGAN'].append('tofu')
+            write_lexicon(path, edit)
+            os.utime(path, ns=(0, 0))
+            assert registry.reload_if_changed()
+
+            new = registry.active()
+            assert new is not old
+            assert 'tofu' not in old.engine_keywords['health_keywords']
+            assert engine._score_text('tofu bowl')[0] == 6
+            assert AllergyChecker.violates_filter("Tofu Bowl - $9", AllergyFilter.VEGAN)
+            assert not registry.reload(), "unchanged content is not republished"
+        finally:
+            AllergyChecker.use_lexicon(lexicons.active())
+
+def test_reload_mid_analysis_keeps_the_snapshot():
+    """An analysis uses the lexicon it started with, even if a new one is published halfway"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'menu.json')
+        write_lexicon(path)
+        registry = LexiconRegistry(path)
+        engine = DecisionIntelligenceEngine(locale='en')
+        registry.follow(engine)
+        registry.subscribe(AllergyChecker.use_lexicon)
+        registry.subscribe(PrepTimeEstimator.use_lexicon)
+        menu = "Tofu Bowl - $9\nPlain Rice - $4"
+        try:
+            before = engine.analyze_menu(menu, 80, 50, [AllergyFilter.VEGAN])
+
+            def edit(data):
+                data['engine']['health_keywords'].append('tofu')
+                data['allergy']['VEGAN'].append('tofu')
+            write_lexicon(path, edit)
+            score_items = engine._score_items
+
+            def reload_then_score(items, lexicon=None):
+                registry.reload()
+                return score_items(items, lexicon)
+            engine._score_items = reload_then_score
+            assert engine.analyze_menu(menu, 80, 50, [AllergyFilter.VEGAN]) == before
+
+            del engine._score_items
+            after = engine.analyze_menu(menu, 80, 50, [AllergyFilter.VEGAN])
+            assert [vetoed['item'] for vetoed in after['vetoed_items']] == ['Tofu Bowl']
+        finally:
+            AllergyChecker.use_lexicon(lexicons.active())
+            PrepTimeEstimator.use_lexicon(lexicons.active())
+
+def test_apps_pick_up_edited_keyword_files():
+    """Each app reloads the lexicon on every Streamlit rerun, so edits need no restart"""
+    from streamlit.testing.v1 import AppTest
+    root = os.path.dirname(os.path.abspath(__file__))
+    path, artifact_path = lexicons.path, lexicons.artifact_path
+    with tempfile.TemporaryDirectory() as tmp:
+        lexicons.path = os.path.join(tmp, 'menu.json')
+        lexicons.artifact_path = f"{lexicons.path}.compiled"
+        try:
+            for app in ('app.py', 'app_simple.py', 'app_executive.py', 'app_executive_simple.py'):
+                write_lexicon(lexicons.path)
+                session = AppTest.from_file(os.path.join(root, app), default_timeout=30).run()
+                assert not session.exception
+                assert not AllergyChecker.violates_filter("Tofu Bowl - $9", AllergyFilter.VEGAN)
+
+                write_lexicon(lexicons.path, lambda data: data['allergy']['VEGAN'].append('tofu'))
+                session.run()
+                assert AllergyChecker.violates_filter("Tofu Bowl - $9", AllergyFilter.VEGAN), app
+        finally:
+            lexicons.path, lexicons.artifact_path = path, artifact_path
+            lexicons.reload()
+
+if __name__ == "__main__":
+    test_default_lexicon_is_active()
+    test_artifact_is_reused_until_data_changes()
+    test_hot_reload_swaps_atomically()
+    test_reload_mid_analysis_keeps_the_snapshot()
+    test_apps_pick_up_edited_keyword_files()
+    print("✅ Lexicon tests passed!")
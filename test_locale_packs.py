@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test script for per-locale lexicon packs and locale auto-detection
+"""
+
+from src.decision_engine import DecisionIntelligenceEngine
+from src.incremental import IncrementalAnalyzer
+from src.lexicon import LocalePacks, lexicons, packs
+from src.menu_generator import SyntheticMenuGenerator
+from src.models import AllergyChecker, AllergyFilter
+
+SPANISH_MENU = """Ensalada de quinoa con verduras - $11
+Hamburguesa con queso y beicon - $14
+Pollo a la plancha con arroz - $13
+Tarta de almendra casera - $7
+Sopa del día - $6"""
+
+def test_detects_locale_from_first_lines():
+    assert packs.detect(SPANISH_MENU.split('\n')) == 'es'
+    assert packs.detect(["Poulet rôti avec frites", "Soupe du jour"]) == 'fr'
+    assert packs.detect(["Schnitzel mit Pommes und Salat"]) == 'de'
+    assert packs.detect(["Grilled Salmon - $22", "Pot de Creme - $8"]) == 'en'
+    # Lines past the sample are never read
+    assert packs.detect(["Plain Rice"] * 8 + ["Pollo con queso y arroz"]) == 'en'
+
+def test_packs_compile_lazily_and_are_shared():
+    local = LocalePacks(lexicons)
+    assert local.loaded() == []
+    assert local.get('en') is lexicons.active()
+    assert local.loaded() == []
+
+    french = local.get('fr')
+    assert local.loaded() == ['fr'] and local.get('fr') is french
+    # Base keywords stay, pack keywords are appended
+    assert french.engine_keywords['taste_keywords'][0] == 'burger'
+    assert 'fromage' in french.engine_keywords['taste_keywords']
+    # Profiles the pack does not touch share the base kernel
+    assert french.kernel('professional') is lexicons.active().kernel('professional')
+
+def test_spanish_menu_is_scored_and_filtered():
+    engine = DecisionIntelligenceEngine()
+    english = DecisionIntelligenceEngine(locale='en')
+    lexicon = engine.menu_lexicon(SPANISH_MENU.split('\n'))
+    assert lexicon.locale == 'es'
+
+    assert engine._score_text('ensalada de quinoa con verduras', lexicon)[0] == 10
+    assert english._score_text('ensalada de quinoa con verduras')[0] == 6
+    assert AllergyChecker.violates_filter("Tarta de almendra", AllergyFilter.NUTS, lexicon)
+    assert not AllergyChecker.violates_filter("Tarta de almendra", AllergyFilter.NUTS)
+
+    filters = [AllergyFilter.NUTS, AllergyFilter.DAIRY]
+    analysis = engine.analyze_menu(SPANISH_MENU, 70, 40, filters)
+    vetoed = {entry['item'] for entry in analysis['vetoed_items']}
+    assert vetoed == {'Hamburguesa con queso y beicon', 'Tarta de almendra casera'}
+    assert analysis['recommendations'][0].name == 'Ensalada de quinoa con verduras'
+
+    streamed = engine.analyze_stream(SPANISH_MENU, 70, 40, filters)
+    assert streamed['recommendations'] == analysis['recommendations']
+    assert IncrementalAnalyzer(engine).analyze(SPANISH_MENU, 70, 40, filters) == analysis
+
+def test_english_menus_are_unchanged():
+    auto, english = DecisionIntelligenceEngine(), DecisionIntelligenceEngine(locale='en')
+    for seed in range(5):
+        menu = SyntheticMenuGenerator(seed=seed).generate(40)
+        # The default locale is analyzed with a snapshot of the published lexicon
+        assert auto.menu_lexicon(menu.split('\n')) is lexicons.active()
+        assert auto.analyze_menu(menu, 60, 30, [AllergyFilter.GLUTEN]) == \
+            english.analyze_menu(menu, 60, 30, [AllergyFilter.GLUTEN])
+
+if __name__ == "__main__":
+    test_detects_locale_from_first_lines()
+    test_packs_compile_lazily_and_are_shared()
+    test_spanish_menu_is_scored_and_filtered()
+    test_english_menus_are_unchanged()
+    print("✅ Locale pack tests passed!")
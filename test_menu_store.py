@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Test script for the persistent parsed-and-scored menu store
+"""
+
+import os
+import tempfile
+
+from src.decision_engine import DecisionIntelligenceEngine
+from src.menu_generator import SyntheticMenuGenerator
+from src.menu_store import ScoredMenuStore
+from src.models import AllergyFilter
+from src.scored_menu import ScoredMenu
+
+def summarize(analysis):
+    summary = dict(analysis)
+    summary['recommendations'] = [(r.name, r.category, r.confidence, r.price) for r in analysis['recommendations']]
+    return summary
+
+def test_scored_menu_round_trip():
+    engine = DecisionIntelligenceEngine()
+    scored = engine._score_items(["1. Crème Brûlée - $9 - vanilla", "Grilled Salmon - $22"])
+    restored = ScoredMenu.from_bytes(scored.to_bytes())
+    assert restored.to_records() == scored.to_records()
+
+def test_store_survives_restart_and_serves_any_constraints():
+    """A new engine on the same file loads instead of re-scoring, with identical output"""
+    menu_text = SyntheticMenuGenerator(seed=4).generate(300)
+    reference = DecisionIntelligenceEngine()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'menus.sqlite')
+        DecisionIntelligenceEngine(store=ScoredMenuStore(path)).analyze_menu(menu_text, 50, 50, [])
+        
+        store = ScoredMenuStore(path)
+        engine = DecisionIntelligenceEngine(store=store)
+        for filters, budget_limit in (([AllergyFilter.NUTS], None), ([AllergyFilter.VEGAN, AllergyFilter.DAIRY], 15.0)):
+            result = engine.analyze_menu(menu_text, 70, 30, filters, budget_limit, collect_timings=True)
+            assert 'load' in result.pop('timings')
+            assert summarize(result) == summarize(reference.analyze_menu(menu_text, 70, 30, filters, budget_limit))
+        assert store.hits == 2 and store.misses == 0
+
+def test_lexicon_change_misses_store():
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ScoredMenuStore(os.path.join(tmp, 'menus.sqlite'))
+        engine = DecisionIntelligenceEngine(store=store)
+        engine.analyze_menu("Tofu Bowl - $10\nBurger - $12", 90, 50, [])
+        engine.health_keywords.append('tofu')
+        result = engine.analyze_menu("Tofu Bowl - $10\nBurger - $12", 90, 50, [])
+        assert store.misses == 2
+        assert result['recommendations'][0].name == "Tofu Bowl"
+
+if __name__ == "__main__":
+    test_scored_menu_round_trip()
+    test_store_survives_restart_and_serves_any_constraints()
+    test_lexicon_change_misses_store()
+    print("✅ Menu store tests passed!")
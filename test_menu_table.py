@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test script for structured (CSV/JSON/JSONL/Arrow) menu ingestion
+"""
+
+import csv
+import json
+import math
+import os
+import tempfile
+
+import pytest
+
+from src.decision_engine import DecisionIntelligenceEngine
+from src.menu_table import load_menu_table, parse_price
+from src.models import AllergyFilter
+
+ROWS = [
+    {'Name': 'Grilled Salmon', 'Price': '$22.50', 'Description': 'quinoa, vegetables', 'Tags': 'gluten-free;healthy'},
+    {'Name': 'Bacon Cheeseburger', 'Price': '16', 'Description': 'fried onions, brioche bun', 'Tags': ''},
+    {'Name': 'Walnut Salad', 'Price': '', 'Description': 'greens, walnut', 'Tags': 'vegan'}
+]
+
+def write_formats(directory):
+    paths = {}
+    paths['csv'] = os.path.join(directory, 'menu.csv')
+    with open(paths['csv'], 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(ROWS[0]))
+        writer.writeheader()
+        writer.writerows(ROWS)
+    paths['json'] = os.path.join(directory, 'menu.json')
+    with open(paths['json'], 'w') as f:
+        json.dump({'items': ROWS}, f)
+    paths['jsonl'] = os.path.join(directory, 'menu.jsonl')
+    with open(paths['jsonl'], 'w') as f:
+        f.writelines(json.dumps(row) + '\n' for row in ROWS)
+    return paths
+
+def test_loaders_produce_typed_columns():
+    """Every text format maps onto the same typed columns"""
+    with tempfile.TemporaryDirectory() as tmp:
+        for path in write_formats(tmp).values():
+            table = load_menu_table(path)
+            assert table.names == ['Grilled Salmon', 'Bacon Cheeseburger', 'Walnut Salad']
+            assert [table.price(i) for i in range(3)] == [22.5, 16.0, None]
+            assert table.tags[0] == 'gluten-free, healthy'
+
+def test_arrow_prices_are_zero_copy():
+    pa = pytest.importorskip('pyarrow')
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'menu.arrow')
+        data = pa.table({
+            'dish': ['Grilled Salmon', 'Bacon Cheeseburger'],
+            'price': pa.array([22.5, None]),
+            'tags': [['healthy'], []]
+        })
+        with pa.OSFile(path, 'wb') as sink:
+            with pa.ipc.new_file(sink, data.schema) as writer:
+                writer.write_table(data)
+        
+        table = load_menu_table(path)
+        assert table.names == ['Grilled Salmon', 'Bacon Cheeseburger']
+        assert table.price(0) == 22.5 and math.isnan(table.prices[1])
+        assert table.tags == ['healthy', '']
+
+def test_parse_price_separators():
+    """Comma decimals and thousands separators both parse"""
+    assert parse_price("12,50") == 12.5
+    assert parse_price("12,50 €") == 12.5
+    assert parse_price("1.234,50") == 1234.5
+    assert parse_price("$1,250") == 1250.0
+    assert parse_price("$1,234.50") == 1234.5
+    assert parse_price("$12.5") == 12.5
+    assert parse_price("12,5") == 12.5
+    assert parse_price("12,5 €") == 12.5
+    assert parse_price("1,250") == 1250.0
+    assert parse_price("1.250,50") == 1250.5
+    assert parse_price("1,250,000") == 1250000.0
+    assert math.isnan(parse_price("market price"))
+
+def test_analyze_table_skips_text_parsing():
+    """Structured menus veto and recommend from their columns"""
+    engine = DecisionIntelligenceEngine()
+    with tempfile.TemporaryDirectory() as tmp:
+        table = load_menu_table(write_formats(tmp)['csv'])
+    
+    analysis = engine.analyze_table(table, 80, 50, [AllergyFilter.NUTS], budget_limit=20)
+    assert analysis['vetoed_items'] == [
+        {'item': 'Grilled Salmon', 'reasons': ['Exceeds budget limit ($22.5 > $20)']},
+        {'item': 'Walnut Salad', 'reasons': [f"Violates {AllergyFilter.NUTS.value} constraint"]}
+    ]
+    assert [r.name for r in analysis['recommendations']] == ['Bacon Cheeseburger']
+    assert analysis['recommendations'][0].price == 16.0
+
+if __name__ == "__main__":
+    test_loaders_produce_typed_columns()
+    test_arrow_prices_are_zero_copy()
+    test_parse_price_separators()
+    test_analyze_table_skips_text_parsing()
+    print("✅ Structured menu tests passed!")
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Test script for the single-pass multi-mode argmax kernel
+"""
+
+from src.menu_generator import SyntheticMenuGenerator
+from src.mode_kernel import best_per_mode
+from src.models import ScoreCalculator, SteeringMode
+from src.lexicon import get_kernel
+from src.tokens import PhraseMatcher
+
+HEALTH = ['salad', 'grilled', 'steamed', 'quinoa', 'salmon', 'chicken breast', 'vegetables', 'fruit', 'lean']
+TASTE = ['burger', 'pizza', 'chocolate', 'cheese', 'bacon', 'fried', 'cake', 'ice cream', 'sauce', 'crispy']
+
+def per_mode_loop(items, mode):
+    """The original one-loop-per-mode selection"""
+    best_item, best_score, best_scores = items[0], 0, None
+    for item in items:
+        health = min(10, max(1, 2 * len(PhraseMatcher(HEALTH).match(item)) + 3))
+        taste = min(10, max(1, 2 * len(PhraseMatcher(TASTE).match(item)) + 3))
+        final = ScoreCalculator.calculate_final_score(health, taste, mode)
+        if final > best_score:
+            best_item, best_score, best_scores = item, final, (health, taste)
+    return best_item, best_scores
+
+def test_matches_per_mode_loops():
+    score = get_kernel('referee').score_item
+    for seed in range(5):
+        items = SyntheticMenuGenerator(seed=seed).generate(200).split('\n')
+        best = best_per_mode(items, score, ScoreCalculator.MODE_WEIGHTS)
+        for mode in SteeringMode:
+            index, scores = best[mode]
+            assert (items[index], scores) == per_mode_loop(items, mode)
+
+def test_scores_each_item_once():
+    calls = []
+
+    def score(item):
+        calls.append(item)
+        return get_kernel('referee').score_item(item)
+
+    items = ["Grilled Salmon Salad", "Bacon Cheese Burger", "Plain Rice"]
+    personas = {'zen': (0.8, 0.2), 'gremlin': (0.1, 0.9), 'balanced': (0.5, 0.5)}
+    best = best_per_mode(items, score, personas)
+    assert calls == items
+    assert best['zen'][0] == 0 and best['gremlin'][0] == 1
+    # Ties keep the earliest item
+    assert best['balanced'][0] == 0
+
+def test_final_score_reads_mode_weights():
+    """The final score and the kernel share one weight table"""
+    for mode, (health_weight, taste_weight) in ScoreCalculator.MODE_WEIGHTS.items():
+        assert ScoreCalculator.calculate_final_score(7, 3, mode) == 7 * health_weight + 3 * taste_weight
+    assert ScoreCalculator.calculate_final_score(10, 0, SteeringMode.ZEN) == 8.0
+    assert ScoreCalculator.calculate_final_score(0, 10, SteeringMode.GREMLIN) == 9.0
+
+if __name__ == "__main__":
+    test_matches_per_mode_loops()
+    test_scores_each_item_once()
+    test_final_score_reads_mode_weights()
+    print("✅ Mode kernel tests passed!")
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Test script for Pareto-front ranking and the compromise pick
+"""
+
+import math
+import random
+
+from app_executive_simple import analyze_executive_menu
+from src.decision_engine import DecisionIntelligenceEngine
+from src.incremental import IncrementalAnalyzer
+from src.menu_generator import SyntheticMenuGenerator
+from src.models import AllergyFilter
+from src.pareto import closeness, knee_point, objective_points, pareto_front
+
+EXECUTIVE_MENU = """1. Grilled Atlantic Salmon - $28 - Wild-caught salmon, quinoa pilaf, seasonal vegetables
+2. Wagyu Beef Burger - $24 - Premium wagyu patty, truffle aioli, artisan bun, hand-cut fries
+3. Mediterranean Bowl - $16 - Quinoa, chickpeas, feta, olives, cucumber, tahini dressing
+4. Lobster Risotto - $32 - Maine lobster, arborio rice, white wine, parmesan, herbs
+5. Caesar Salad - $14 - Romaine hearts, house-made croutons, parmesan, anchovy dressing
+6. Chocolate Lava Cake - $12 - Warm chocolate cake, vanilla bean ice cream, berry coulis"""
+
+def brute_force_front(points):
+    front = []
+    for index, point in enumerate(points):
+        if point in points[:index]:
+            continue
+        if not any(other != point and all(a >= b for a, b in zip(other, point))
+                   for other in points):
+            front.append(index)
+    return front
+
+def test_front_matches_brute_force():
+    rng = random.Random(7)
+    for _ in range(500):
+        spread = rng.randint(1, 5)
+        points = [(rng.randint(1, spread), rng.randint(1, spread),
+                   rng.choice([-math.inf, -rng.randint(1, spread)])) for _ in range(rng.randint(0, 30))]
+        front = pareto_front(points)
+        assert front == brute_force_front(points)
+        knee = knee_point(points, front)
+        assert knee in front if front else knee is None
+
+def test_objective_points_and_knee():
+    points = objective_points([9, 2, 7, 7, 5], [3, 9, 7, 7, 5], [12.0, 10.0, 11.0, 11.0, None])
+    assert points[4] == (5, 5, -math.inf)
+    # The duplicate and the unpriced item are off the front
+    assert pareto_front(points) == [0, 1, 2]
+    # Two extremes and one balanced member: the balanced one is the knee
+    assert knee_point(points, [0, 1, 2]) == 2
+    # Coinciding extremes fall back to the member closest to the ideal point
+    line = [(1, 3, 0), (2, 2, 0), (3, 1, 0)]
+    assert knee_point(line, pareto_front(line)) == 1
+
+def test_closeness():
+    assert closeness((10, 10, -12), (10, 10, -12), (1, 1, -28)) == 1.0
+    assert closeness((1, 1, -math.inf), (10, 10, -12), (1, 1, -28)) == 0.0
+    # Unpriced menus are judged on health and taste alone
+    assert closeness((10, 10, -math.inf), (10, 10, -math.inf), (1, 1, -math.inf)) == 1.0
+
+def test_compromise_explains_itself():
+    """The compromise is a dish not already recommended, with its own reasoning and confidence"""
+    analysis = DecisionIntelligenceEngine().analyze_menu(EXECUTIVE_MENU, 50, 50, [])
+    compromise = analysis['compromise']
+    assert [member['name'] for member in analysis['pareto_front']] == [
+        'Grilled Atlantic Salmon', 'Caesar Salad', 'Chocolate Lava Cake']
+    assert compromise.name == 'Caesar Salad'
+    assert compromise.name not in [r.name for r in analysis['recommendations']]
+    assert compromise.reasoning.startswith("Most balanced trade-off: 6/10 nutrition and 4/10 satisfaction")
+    # (6, 4, $14) scaled between (1, 1, $28) and (10, 10, $12) is 0.53 of the way to the ideal dish
+    assert compromise.confidence == 53
+
+def test_result_shape_without_options():
+    engine = DecisionIntelligenceEngine()
+    for analysis in (engine.analyze_menu("", 50, 50, []),
+                     engine.analyze_menu("Walnut Cake - $8", 50, 50, [AllergyFilter.NUTS])):
+        assert analysis['compromise'] is None and analysis['pareto_front'] == []
+
+def test_engine_exposes_front_and_compromise():
+    engine = DecisionIntelligenceEngine()
+    menu = SyntheticMenuGenerator(seed=3).generate(400)
+    analysis = engine.analyze_menu(menu, 80, 20, [])
+    assert analysis['compromise'].category == "Balanced Compromise"
+    assert analysis['compromise'].name in {member['name'] for member in analysis['pareto_front']}
+    assert len(analysis['recommendations']) == 3
+
+    # The front does not depend on the steering sliders; only which members are already recommended does
+    steered = engine.analyze_menu(menu, 10, 90, [])
+    assert steered['pareto_front'] == analysis['pareto_front']
+    assert steered['compromise'].name in {member['name'] for member in analysis['pareto_front']}
+
+    # Streaming keeps every front member among its candidates
+    for seed in range(3):
+        menu = SyntheticMenuGenerator(seed=seed).generate(1000)
+        expected = engine.analyze_menu(menu, 40, 60, [])
+        streamed = engine.analyze_stream(menu, 40, 60, [])
+        assert streamed['pareto_front'] == expected['pareto_front']
+        assert streamed['compromise'] == expected['compromise']
+
+    incremental = IncrementalAnalyzer(engine)
+    assert incremental.analyze(menu, 40, 60, []) == expected
+    assert incremental.analyze(menu, 70, 30, []) == engine.analyze_menu(menu, 70, 30, [])
+
+def test_executive_compromise_is_on_front():
+    menu = "\n".join([
+        "Grilled Salmon Salad - $18 - fresh greens",
+        "Bacon Cheese Burger - $15 - fried onions",
+        "Quinoa Bowl - $12 - vegetables",
+        "Plain Rice - $4",
+    ])
+    analysis = analyze_executive_menu(menu, 50, 50, [])
+    assert analysis['compromise']['name'] in [item['name'] for item in analysis['pareto_front']]
+    # The page reads its compromise and front from the engine instead of recomputing them
+    engine_analysis = DecisionIntelligenceEngine().analyze_menu(menu, 50, 50, [])
+    assert analysis['compromise']['name'] == engine_analysis['compromise'].name
+    assert analysis['compromise']['confidence'] == engine_analysis['compromise'].confidence
+    assert analysis['pareto_front'] == engine_analysis['pareto_front']
+    assert 0 < analysis['compromise']['confidence'] <= 95
+    assert analyze_executive_menu("", 50, 50, [])['pareto_front'] == []
+
+if __name__ == "__main__":
+    test_front_matches_brute_force()
+    test_objective_points_and_knee()
+    test_closeness()
+    test_compromise_explains_itself()
+    test_result_shape_without_options()
+    test_engine_exposes_front_and_compromise()
+    test_executive_compromise_is_on_front()
+    print("✅ Pareto front tests passed!")
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Test script for prep-time estimates and the quick-service constraint
+"""
+
+from src.catalog import DishCatalog
+from src.decision_engine import DecisionIntelligenceEngine
+from src.incremental import IncrementalAnalyzer
+from src.menu_generator import SyntheticMenuGenerator
+from src.models import AllergyFilter, AllergyChecker, PrepTimeEstimator
+from src.price_index import ConstraintIndex
+
+def test_estimate_minutes():
+    assert PrepTimeEstimator.estimate_minutes("Express Chicken Wrap - $9") <= 20
+    assert PrepTimeEstimator.estimate_minutes("Slow Braised Short Rib - $28") > 20
+    # A stated prep time wins over keywords, using the upper bound of a range
+    assert PrepTimeEstimator.estimate_minutes("Slow Roast Pork (ready in 15 min) - $18") == 15
+    assert PrepTimeEstimator.estimate_minutes("Quick Salad, 25-30 mins - $11") == 30
+
+def test_quick_filter_vetoes_slow_dishes():
+    assert not AllergyChecker.violates_filter("Quick Tomato Soup - $6", AllergyFilter.QUICK)
+    assert AllergyChecker.violates_filter("Lobster Risotto - $32", AllergyFilter.QUICK)
+
+    engine = DecisionIntelligenceEngine()
+    result = engine.analyze_menu("Quick Tomato Soup - $6\nLobster Risotto - $32\nSmoked Brisket - $24",
+                                 50, 50, [AllergyFilter.QUICK, AllergyFilter.NUTS])
+    assert [r.name for r in result['recommendations']] == ["Quick Tomato Soup"]
+    assert {v['item'] for v in result['vetoed_items']} == {"Lobster Risotto", "Smoked Brisket"}
+
+def test_constraint_index_quick_matches_engine():
+    engine = DecisionIntelligenceEngine()
+    items = engine._parse_menu(SyntheticMenuGenerator(seed=9).generate(600))
+    index = ConstraintIndex.from_items(items)
+    for filters, budget_limit in (([AllergyFilter.QUICK], None), ([AllergyFilter.QUICK, AllergyFilter.DAIRY], 15.0)):
+        safe_items, _ = engine._apply_constraints(items, filters, budget_limit)
+        assert [items[i] for i in index.safe_ids(filters, budget_limit)] == safe_items
+
+def test_incremental_and_catalog_quick():
+    engine = DecisionIntelligenceEngine()
+    menu_text = SyntheticMenuGenerator(seed=4).generate(300)
+    expected = engine.analyze_menu(menu_text, 60, 40, [AllergyFilter.QUICK])
+
+    analyzer = IncrementalAnalyzer(engine)
+    for _ in range(2):
+        result = analyzer.analyze(menu_text, 60, 40, [AllergyFilter.QUICK])
+        assert result['vetoed_items'] == expected['vetoed_items']
+        assert [r.name for r in result['recommendations']] == [r.name for r in expected['recommendations']]
+
+    catalog = DishCatalog()
+    catalog.add_menu('lunch', menu_text, engine)
+    dishes = catalog.search(allergy_filters=[AllergyFilter.QUICK], limit=1000)
+    assert dishes and all(d['prep_minutes'] <= PrepTimeEstimator.QUICK_SERVICE_MINUTES for d in dishes)
+    assert len(dishes) == len(engine._parse_menu(menu_text)) - len(expected['vetoed_items'])
+    assert all(d['prep_minutes'] <= 12 for d in catalog.search(max_prep_minutes=12, limit=1000))
+
+if __name__ == "__main__":
+    test_estimate_minutes()
+    test_quick_filter_vetoes_slow_dishes()
+    test_constraint_index_quick_matches_engine()
+    test_incremental_and_catalog_quick()
+    print("✅ Prep-time tests passed!")
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Test script for the sorted price index and combined constraint index
+"""
+
+import random
+
+from src.decision_engine import DecisionIntelligenceEngine
+from src.incremental import IncrementalAnalyzer
+from src.keyword_index import iter_bits
+from src.menu_generator import SyntheticMenuGenerator
+from src.models import AllergyFilter, SteeringMode
+from src.price_index import ConstraintIndex, PriceIndex
+
+def test_over_budget_bits_match_a_scan():
+    rng = random.Random(5)
+    prices = [None if rng.random() < 0.1 else round(rng.uniform(0, 40), 2) for _ in range(3000)]
+    index = PriceIndex(prices)
+    for limit in [0.01, 7.5, 20, 39.99, 45] + [rng.uniform(0, 40) for _ in range(50)]:
+        expected = [i for i, price in enumerate(prices) if price and price > limit]
+        assert list(iter_bits(index.over_budget_bits(limit))) == expected
+        assert index.over_budget_count(limit) == len(expected)
+
+def test_constraint_index_matches_apply_constraints():
+    engine = DecisionIntelligenceEngine()
+    items = engine._parse_menu(SyntheticMenuGenerator(seed=6).generate(800))
+    index = ConstraintIndex.from_items(items)
+    for filters, budget_limit in (([], 12.0), ([AllergyFilter.NUTS, AllergyFilter.DAIRY], None),
+                                  ([AllergyFilter.VEGAN], 18.5)):
+        safe_items, _ = engine._apply_constraints(items, filters, budget_limit)
+        assert [items[i] for i in index.safe_ids(filters, budget_limit)] == safe_items
+
+def test_budget_slider_reuses_index():
+    """Repeated runs on the same menu answer constraints from the index"""
+    engine = DecisionIntelligenceEngine()
+    analyzer = IncrementalAnalyzer(engine)
+    menu_text = SyntheticMenuGenerator(seed=2).generate(400)
+    for budget_limit in (30, 25, 20, 15, 10):
+        result = analyzer.analyze(menu_text, 50, 50, [AllergyFilter.GLUTEN], budget_limit)
+        expected = engine.analyze_menu(menu_text, 50, 50, [AllergyFilter.GLUTEN], budget_limit)
+        assert result['vetoed_items'] == expected['vetoed_items']
+        assert [r.name for r in result['recommendations']] == [r.name for r in expected['recommendations']]
+    assert analyzer._constraints is not None
+
+def test_referee_budget_slider_uses_constraint_index():
+    """The main app's budget slider and filters re-filter the referee's ConstraintIndex"""
+    from app import FreeAIReferee
+    referee = FreeAIReferee()
+    menu = "Grilled Salmon - $28 - quinoa\nCaesar Salad - $14\nWalnut Brownie - $7"
+    decision = referee.make_decision(menu, SteeringMode.ZEN, 20, [])
+    assert decision['vetoed_items'] == ['Grilled Salmon']
+    constraints = referee._constraints
+    
+    decision = referee.make_decision(menu, SteeringMode.ZEN, 15, [AllergyFilter.NUTS])
+    assert referee._constraints is constraints
+    assert decision['vetoed_items'] == ['Grilled Salmon', 'Walnut Brownie']
+    assert decision['winner'] == 'Caesar Salad'
+    assert 'budget' in decision['verdict']
+    assert referee.make_decision(menu, SteeringMode.ZEN, None, [])['vetoed_items'] == []
+
+if __name__ == "__main__":
+    test_over_budget_bits_match_a_scan()
+    test_constraint_index_matches_apply_constraints()
+    test_budget_slider_reuses_index()
+    test_referee_budget_slider_uses_constraint_index()
+    print("✅ Price index tests passed!")
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Test script for the analyze_menu result cache
+"""
+
+import os
+import tempfile
+
+from src.decision_engine import DecisionIntelligenceEngine
+from src.models import AllergyChecker, AllergyFilter, PrepTimeEstimator
+from src.result_cache import ResultCache
+
+MENU = """
+1. Grilled Salmon - $22 - quinoa, vegetables
+2. Bacon Cheeseburger - $16 - fried onions, cheese
+3. Mediterranean Bowl - $14 - chickpeas, feta
+"""
+
+def test_hits_misses_and_private_copies():
+    """Repeated requests are served from memory as independent copies"""
+    cache = ResultCache()
+    engine = DecisionIntelligenceEngine(cache=cache)
+    
+    first = engine.analyze_menu(MENU, 70, 50, [AllergyFilter.NUTS])
+    first['vetoed_items'].append("mutated by caller")
+    # Whitespace-only differences normalize to the same key
+    second = engine.analyze_menu("\n  " + MENU.strip() + "\n\n", 70, 50, [AllergyFilter.NUTS])
+    
+    assert cache.stats['misses'] == 1 and cache.stats['hits'] == 1
+    assert second['vetoed_items'] == []
+    assert second['recommendations'][0].name == first['recommendations'][0].name
+    assert second['recommendations'][0].reasoning == first['recommendations'][0].reasoning
+    
+    engine.analyze_menu(MENU, 71, 50, [AllergyFilter.NUTS])
+    assert cache.stats['misses'] == 2
+
+def test_timings_report_cache_stage():
+    """A cache hit still returns fresh timings with a 'cache' stage"""
+    engine = DecisionIntelligenceEngine(cache=ResultCache())
+    engine.analyze_menu(MENU, 50, 50, [])
+    hit = engine.analyze_menu(MENU, 50, 50, [], collect_timings=True)
+    
+    assert hit['timings']['cache']['items_out'] == 1
+    assert 'scoring' not in hit['timings']
+
+def test_lru_eviction_by_bytes():
+    """The memory tier evicts least recently used entries past its byte budget"""
+    cache = ResultCache(max_bytes=250)
+    for key in 'abc':
+        cache.put(key, {'payload': key * 100})
+    
+    assert cache.get('a') is None
+    assert cache.get('c') == {'payload': 'c' * 100}
+    assert cache.stats['evictions'] >= 1
+    assert cache.stats['bytes'] <= 250
+
+def test_disk_tier_shared_between_caches():
+    """A second cache on the same file sees results written by the first"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'results.sqlite')
+        writer = DecisionIntelligenceEngine(cache=ResultCache(disk_path=path))
+        expected = writer.analyze_menu(MENU, 30, 80, [])
+        
+        reader_cache = ResultCache(disk_path=path)
+        reader = DecisionIntelligenceEngine(cache=reader_cache)
+        result = reader.analyze_menu(MENU, 30, 80, [])
+        
+        assert reader_cache.stats['disk_hits'] == 1
+        assert [r.name for r in result['recommendations']] == [r.name for r in expected['recommendations']]
+
+def test_lexicon_change_invalidates():
+    """Editing a keyword list changes the key, so stale results are not served"""
+    cache = ResultCache()
+    engine = DecisionIntelligenceEngine(cache=cache)
+    version = engine.lexicon_version
+    engine.analyze_menu(MENU, 50, 50, [])
+    
+    engine.health_keywords.append('chickpeas')
+    assert engine.lexicon_version != version
+    engine.analyze_menu(MENU, 50, 50, [])
+    assert cache.stats['hits'] == 0 and cache.stats['misses'] == 2
+
+def test_shared_table_edits_invalidate():
+    """In-place edits of the allergy and prep-time tables reach analyses and change the key"""
+    cache = ResultCache()
+    engine = DecisionIntelligenceEngine(cache=cache)
+    menu = "Tofu Wrap - $9\nGrilled Salmon - $22"
+    filters = [AllergyFilter.VEGAN]
+    version = engine.lexicon_version
+    assert engine.analyze_menu(menu, 50, 50, filters)['vetoed_items'][0]['item'] == 'Grilled Salmon'
+    engine.analyze_menu(menu, 50, 50, filters)
+    assert cache.stats['hits'] == 1
+    
+    AllergyChecker.ALLERGY_KEYWORDS[AllergyFilter.VEGAN].append('tofu')
+    try:
+        assert AllergyChecker.violates_filter("Tofu Wrap", AllergyFilter.VEGAN)
+        analysis = engine.analyze_menu(menu, 50, 50, filters)
+        assert [vetoed['item'] for vetoed in analysis['vetoed_items']] == ['Tofu Wrap', 'Grilled Salmon']
+        assert engine.lexicon_version != version
+        assert cache.stats['hits'] == 1 and cache.stats['misses'] == 2
+    finally:
+        AllergyChecker.ALLERGY_KEYWORDS[AllergyFilter.VEGAN].remove('tofu')
+    
+    PrepTimeEstimator.SLOW_KEYWORDS['tofu'] = 30
+    try:
+        analysis = engine.analyze_menu(menu, 50, 50, [AllergyFilter.QUICK])
+        assert [vetoed['item'] for vetoed in analysis['vetoed_items']] == ['Tofu Wrap', 'Grilled Salmon']
+        assert cache.stats['misses'] == 3
+    finally:
+        del PrepTimeEstimator.SLOW_KEYWORDS['tofu']
+    assert engine.lexicon_version == version
+
+if __name__ == "__main__":
+    test_hits_misses_and_private_copies()
+    test_timings_report_cache_stage()
+    test_lru_eviction_by_bytes()
+    test_disk_tier_shared_between_caches()
+    test_lexicon_change_invalidates()
+    test_shared_table_edits_invalidate()
+    print("✅ Result cache tests passed!")
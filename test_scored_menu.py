@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Test script for the columnar ScoredMenu representation
+"""
+
+from src.decision_engine import DecisionIntelligenceEngine
+from src.scored_menu import ScoredMenu
+
+def test_views_match_legacy_dicts():
+    """Lazy views expose the same shape the old list-of-dicts did"""
+    menu = ScoredMenu()
+    menu.append("1. Grilled Salmon - $22 - quinoa", "Grilled Salmon", 22.0, (8, 4, 3, 5, 6))
+    menu.append("Soup of the Day", "Soup of the Day", None, (4, 4, 3, 5, 4))
+    
+    assert len(menu) == 2
+    assert dict(menu[0]) == {
+        'item': "1. Grilled Salmon - $22 - quinoa",
+        'clean_name': "Grilled Salmon",
+        'price': 22.0,
+        'scores': {'health': 8, 'taste': 4, 'premium': 3, 'speed': 5, 'satiety': 6}
+    }
+    assert menu[1].get('price') is None
+    assert menu[-1]['clean_name'] == "Soup of the Day"
+    assert [view['clean_name'] for view in menu.take([1, 0])] == ["Soup of the Day", "Grilled Salmon"]
+
+def test_weighted_scores_and_argmax():
+    """Column-wise ranking returns the first best item"""
+    menu = ScoredMenu()
+    menu.extend([
+        ("Salad", "Salad", 9.0, (8, 3, 3, 5, 4)),
+        ("Burger", "Burger", 14.0, (3, 9, 3, 5, 8)),
+        ("Bowl", "Bowl", 12.0, (8, 3, 3, 5, 4))
+    ])
+    
+    health_first = menu.weighted_scores({'health': 0.8, 'taste': 0.2})
+    assert menu.argmax(health_first) == 0
+    assert menu.argmax(menu.weighted_scores({'taste': 1.0})) == 1
+
+def test_engine_scores_into_scored_menu():
+    """The engine returns a ScoredMenu whose rows mirror the menu"""
+    engine = DecisionIntelligenceEngine()
+    scored = engine._score_items(["1. Grilled Chicken Breast Salad - $14", "Bacon Cheeseburger - $16"])
+    
+    assert isinstance(scored, ScoredMenu)
+    assert scored[0]['clean_name'] == "Grilled Chicken Breast Salad"
+    assert scored[0]['scores']['health'] > scored[1]['scores']['health']
+    assert scored[1]['price'] == 16.0
+
+if __name__ == "__main__":
+    test_views_match_legacy_dicts()
+    test_weighted_scores_and_argmax()
+    test_engine_scores_into_scored_menu()
+    print("✅ ScoredMenu tests passed!")
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared compiled scoring kernel and lexicon profiles
+"""
+
+from src.decision_engine import DecisionIntelligenceEngine
+from src.menu_generator import SyntheticMenuGenerator
+from src.models import ProfessionalAnalyzer
+from src.lexicon import get_kernel, lexicons
+from src.scoring import LexiconProfile, ScoringKernel, additive, compile_profile, engine_profile, tiered
+from src.tokens import PhraseMatcher
+
+def keyword_loop(item_lower, lexicon):
+    """The engine's original per-dimension keyword loops, one matcher per list"""
+    def additive_score(keywords, base):
+        return min(10, max(1, base + 2 * len(PhraseMatcher(keywords).match(item_lower))))
+    if PhraseMatcher(lexicon['satiety_keywords']).match(item_lower):
+        satiety = 8
+    elif PhraseMatcher(lexicon['light_keywords']).match(item_lower):
+        satiety = 4
+    else:
+        satiety = 6
+    return (additive_score(lexicon['health_keywords'], 4), additive_score(lexicon['taste_keywords'], 4),
+            additive_score(lexicon['premium_keywords'], 3), additive_score(lexicon['speed_keywords'], 5), satiety)
+
+def test_engine_profile_matches_keyword_loops():
+    engine_lexicon = lexicons.active().engine_keywords
+    kernel = ScoringKernel(engine_profile(engine_lexicon))
+    lines = SyntheticMenuGenerator(seed=3).generate(500).lower().split('\n')
+    for line in lines + ['truffle organic salad side', 'plain water']:
+        assert kernel.score(line) == keyword_loop(line, engine_lexicon)
+
+def test_weights_tiers_and_clamping():
+    profile = LexiconProfile('test', (
+        additive('health', 5, (['salad', 'grilled'], 1), (['fried', 'salad'], -1), low=1, high=6),
+        tiered('size', (['large'], 9), (['small', 'large'], 2), default=5),
+    ))
+    kernel = ScoringKernel(profile)
+    assert kernel.fields == ('health', 'size')
+    assert kernel.score('grilled salad') == (6, 5)    # salad counts +1 and -1, then clamped at 6
+    assert kernel.score('fried fried') == (4, 5)      # each keyword counts once per text
+    assert kernel.score('small plate') == (5, 2)
+    assert kernel.score('large small') == (5, 9)      # first tier wins
+    assert kernel.score_dict('Grilled Fish') == {'health': 6, 'size': 5}
+
+def test_kernels_are_shared():
+    assert get_kernel('engine') is compile_profile(engine_profile(lexicons.active().engine_keywords))
+    engine = DecisionIntelligenceEngine()
+    assert engine.kernel() is get_kernel('engine')
+
+    # Editing a keyword list recompiles the engine's kernel
+    engine.health_keywords.append('tofu')
+    assert engine.kernel() is not get_kernel('engine')
+    assert engine._score_text('tofu bowl')[0] == 6
+
+def test_professional_profile():
+    metrics = ProfessionalAnalyzer.analyze_menu_item("Crispy Fried Chicken Sandwich with Cheese Sauce")
+    assert (metrics.health, metrics.taste, metrics.speed) == (4, 8, 6)
+    metrics = ProfessionalAnalyzer.analyze_menu_item("Slow Braised Wagyu with Truffle")
+    assert (metrics.price, metrics.speed) == (9, 3)
+
+if __name__ == "__main__":
+    test_engine_profile_matches_keyword_loops()
+    test_weights_tiers_and_clamping()
+    test_kernels_are_shared()
+    test_professional_profile()
+    print("✅ Scoring kernel tests passed!")
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Test script for the streaming analysis pipeline
+"""
+
+import io
+
+from src.decision_engine import DecisionIntelligenceEngine
+from src.menu_generator import SyntheticMenuGenerator
+from src.models import AllergyFilter
+from src.streaming import TopK
+
+def picks(analysis):
+    return [(r.name, r.category, r.confidence) for r in analysis['recommendations']]
+
+def test_stream_matches_analyze_menu():
+    """Streaming recommendations and veto counts match the in-memory pipeline"""
+    engine = DecisionIntelligenceEngine()
+    menu_text = SyntheticMenuGenerator(seed=11).generate(2000)
+    filters = [AllergyFilter.NUTS, AllergyFilter.GLUTEN]
+    
+    expected = engine.analyze_menu(menu_text, 70, 30, filters, 18.0)
+    streamed = engine.analyze_stream(io.StringIO(menu_text), 70, 30, filters, 18.0, veto_sample=5)
+    
+    assert picks(streamed) == picks(expected)
+    assert streamed['total_analyzed'] == expected['total_analyzed']
+    assert streamed['vetoed_count'] == len(expected['vetoed_items'])
+    assert streamed['vetoed_items'] == expected['vetoed_items'][:5]
+    assert sum(streamed['veto_reasons'].values()) >= streamed['vetoed_count']
+
+def test_duplicate_names_and_small_menus():
+    """Name exclusions and the fewer-than-three path behave like analyze_menu"""
+    engine = DecisionIntelligenceEngine()
+    menus = [
+        "Grilled Salmon - $20\nGrilled Salmon - $20 - salad\nBurger - $12 - cheese\nBurger - $9",
+        "Soup - $6\nSalad - $8",
+        "# only a header"
+    ]
+    for menu_text in menus:
+        assert picks(engine.analyze_stream(menu_text, 80, 50, [])) == picks(engine.analyze_menu(menu_text, 80, 50, []))
+
+def test_topk_keeps_first_best_per_name():
+    top = TopK(2, distinct=True)
+    for index, (value, name) in enumerate([(5, 'a'), (7, 'b'), (7, 'a'), (7, 'c'), (9, 'b')]):
+        top.offer(value, index, name, name + str(index))
+    assert [row for _, row in top] == ['b4', 'a2']
+
+if __name__ == "__main__":
+    test_stream_matches_analyze_menu()
+    test_duplicate_names_and_small_menus()
+    test_topk_keeps_first_best_per_name()
+    print("✅ Streaming analysis tests passed!")
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Test script for token-based lexicon matching
+"""
+
+from src.decision_engine import DecisionIntelligenceEngine
+from src.keyword_index import KeywordIndex
+from src.models import AllergyChecker, AllergyFilter
+from src.tokens import PhraseMatcher, stem, tokenize
+
+def test_stemming():
+    assert stem('grilled') == stem('grill') == stem('grilling')
+    assert stem('fried') == stem('fries') == stem('fry')
+    assert stem('cheeses') == stem('cheese')
+    assert stem('sandwiches') == stem('sandwich')
+    assert stem('berries') == stem('berry')
+    assert stem('hummus') == 'hummus'
+    # -y adjectives meet their noun
+    assert stem('nutty') == stem('nuts') == 'nut'
+    assert stem('milky') == stem('milk')
+    assert stem('creamy') == stem('cream')
+    assert stem('cheesy') == stem('cheese')
+    assert stem('eggy') == stem('egg')
+    assert tokenize("Pan-Fried Nuts, $12") == ('pan', 'fri', 'nut', '12')
+
+def test_phrase_matching():
+    matcher = PhraseMatcher(['nut', 'ice cream', 'chicken breast', 'cream'])
+    assert matcher.match("Salted Nuts") == {'nut'}
+    assert matcher.match("Glazed Donut with Coconut") == set()
+    assert matcher.match("Vanilla Ice Cream") == {'ice cream', 'cream'}
+    assert matcher.match("Grilled Chicken Breasts") == {'chicken breast'}
+    assert matcher.match("Chicken with breast of duck") == set()
+
+def test_no_false_vetoes():
+    assert not AllergyChecker.violates_filter("Glazed Donut - $3", AllergyFilter.NUTS)
+    assert not AllergyChecker.violates_filter("Coconut Curry - $14", AllergyFilter.NUTS)
+    assert not AllergyChecker.violates_filter("Roasted Eggplant - $12", AllergyFilter.VEGAN)
+    assert AllergyChecker.violates_filter("Mixed Nuts - $5", AllergyFilter.NUTS)
+    assert AllergyChecker.violates_filter("Scrambled Eggs - $7", AllergyFilter.VEGAN)
+    # Compound words are listed explicitly
+    assert AllergyChecker.violates_filter("NY Cheesecake - $9", AllergyFilter.DAIRY)
+    assert AllergyChecker.violates_filter("Garlic Flatbread - $8", AllergyFilter.GLUTEN)
+
+def test_adjectives_are_vetoed():
+    assert AllergyChecker.violates_filter("Nutty Granola - $6", AllergyFilter.NUTS)
+    assert AllergyChecker.violates_filter("Milky Tea - $3", AllergyFilter.DAIRY)
+    assert AllergyChecker.violates_filter("Creamy Tomato Soup - $7", AllergyFilter.DAIRY)
+    assert AllergyChecker.violates_filter("Cheesy Garlic Bread - $5", AllergyFilter.DAIRY)
+    assert AllergyChecker.violates_filter("Milky Tea - $3", AllergyFilter.VEGAN)
+    assert not AllergyChecker.violates_filter("Berry Smoothie - $6", AllergyFilter.DAIRY)
+
+def test_scores_and_index_use_tokens():
+    engine = DecisionIntelligenceEngine()
+    # "breakfast" is no longer a "fast" item, "grilling" is still grilled
+    assert engine._score_text("breakfast platter")[3] == 5
+    assert engine._score_text("salmon for grilling")[0] == 8
+
+    index = KeywordIndex()
+    items = ["Glazed Donut", "Walnut Brownie", "Mixed Nuts", "Coconut Rice"]
+    index.extend(items)
+    assert index.safe_items([AllergyFilter.NUTS]) == AllergyChecker.get_safe_items(items, [AllergyFilter.NUTS])
+    assert index.safe_items([AllergyFilter.NUTS]) == ["Glazed Donut", "Coconut Rice"]
+
+if __name__ == "__main__":
+    test_stemming()
+    test_phrase_matching()
+    test_no_false_vetoes()
+    test_adjectives_are_vetoed()
+    test_scores_and_index_use_tokens()
+    print("✅ Token matching tests passed!")